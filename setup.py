@@ -51,7 +51,6 @@ setup(
     python_requires=">=3.8, <4",
     install_requires=[
         "panel",
-        "rasterio",
         "matplotlib",
         "numpy",
         "shapely",
@@ -70,5 +69,8 @@ setup(
         "pyvista": [
             "pyvista",
         ],
+        "rasterio": [
+            "rasterio",
+        ],
     },
 )
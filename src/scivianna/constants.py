@@ -11,6 +11,7 @@ POLYGONS = "polygons"
 GRID = "grid"
 FILL_ALPHA = "fill_alpha"
 EDGE_ALPHA = "edge_alpha"
+CELL_VALUES = "cell_values"
 
 #   Default field names
 MESH = "Mesh"
@@ -25,5 +26,9 @@ X = (1., 0., 0.)
 Y = (0., 1., 0.)
 Z = (0., 0., 1.)
 
+#   Options given to the grid interfaces by the 2D panels
+SCREEN_RESOLUTION = "Screen resolution"
+DEVICE_PIXEL_RATIO = "Device pixel ratio"
+
 # Cell name to define the outside world
 OUTSIDE = np.inf
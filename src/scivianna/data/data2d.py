@@ -1,17 +1,140 @@
 from typing import Callable, Dict, List, Any, Tuple, Union
 import numpy as np
-from scivianna.utils.polygonize_tools import PolygonElement, numpy_2D_array_to_polygons
-from scivianna.enums import DataType
+import shapely
+from scivianna.utils.polygonize_tools import (
+    PackedPolygons, 
+    PolygonElement, 
+    grid_to_pixel_polygons, 
+    iso_band_edges,
+    numpy_2D_array_to_iso_bands,
+    pixel_to_frame_polygons, 
+    rasterize_polygons,
+    splice_pixel_polygons,
+)
+from scivianna.constants import OUTSIDE
+from scivianna.enums import DataType, Polygonizer
 from scivianna.data.data_container import DataContainer
 
+
+def _as_string_array(array: np.ndarray) -> np.ndarray:
+    """Converts an array of strings to an object array in which identical strings share the same python object
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Strings array
+
+    Returns
+    -------
+    np.ndarray
+        Object array of interned strings
+    """
+    categories, codes = np.unique(array.astype(str), return_inverse=True)
+    return categories.astype(object)[codes.reshape(-1)]
+
+
+def _as_string_or_object_array(value: Any) -> np.ndarray:
+    """Converts a non numeric sequence to an interned string array if it only contains strings, to an object array otherwise
+
+    Parameters
+    ----------
+    value : Any
+        Sequence to convert
+
+    Returns
+    -------
+    np.ndarray
+        Converted array
+    """
+    if isinstance(value, np.ndarray) and value.dtype.kind in "US":
+        return _as_string_array(value)
+    if isinstance(value, np.ndarray) and value.dtype == object and value.ndim == 1:
+        #   Already converted arrays (slices, copies) are kept as is
+        return value
+
+    array = np.empty(len(value), dtype=object)
+    array[:] = list(value)
+    if len(array) > 0 and all(isinstance(item, str) for item in array):
+        return _as_string_array(array)
+    return array
+
+
+def as_cell_ids(value: Any) -> np.ndarray:
+    """Converts a cell ids sequence to an int64 array, a float64 array (ids containing scivianna.constants.OUTSIDE) or an interned string array
+
+    Parameters
+    ----------
+    value : Any
+        Cell ids sequence
+
+    Returns
+    -------
+    np.ndarray
+        Cell ids array
+    """
+    array = np.asarray(value)
+    if array.ndim == 1 and array.dtype.kind in "biu":
+        return array.astype(np.int64, copy=False)
+    if array.ndim == 1 and array.dtype.kind == "f":
+        return array.astype(np.float64, copy=False)
+    return _as_string_or_object_array(value)
+
+
+def as_cell_values(value: Any) -> np.ndarray:
+    """Converts a cell values sequence to a float64 array or an interned string array
+
+    Parameters
+    ----------
+    value : Any
+        Cell values sequence
+
+    Returns
+    -------
+    np.ndarray
+        Cell values array
+    """
+    array = np.asarray(value)
+    if array.ndim == 1 and array.dtype.kind in "biuf":
+        return array.astype(np.float64, copy=False)
+    return _as_string_or_object_array(value)
+
+
+def as_cell_colors(value: Any) -> np.ndarray:
+    """Converts a colors sequence to a (cell_count, 4) uint8 array, values are rounded and clipped to [0, 255]
+
+    Parameters
+    ----------
+    value : Any
+        RGBA colors sequence ranging from 0 to 255
+
+    Returns
+    -------
+    np.ndarray
+        Colors array
+    """
+    array = np.asarray(value)
+    if array.size == 0:
+        return np.zeros((0, 4), dtype=np.uint8)
+    if array.dtype == np.uint8:
+        return array
+    if array.dtype.kind in "biu":
+        return np.clip(array, 0, 255).astype(np.uint8)
+    if array.dtype.kind == "f":
+        return np.clip(np.rint(array), 0, 255).astype(np.uint8)
+    #   Invalid colors are kept as is to be reported by check_valid
+    return array
+
+
 class Data2D(DataContainer):
     """Data class containing the 2D geometry data"""
 
     data_type:DataType
     """Whether the data are provided from a polygon list or a grid"""
 
-    polygons:List[PolygonElement]
-    """List of polygons defining the geometry"""
+    _polygons:List[PolygonElement]
+    _packed_polygons:PackedPolygons
+    _pixel_polygons:PackedPolygons
+    _polygon_bounds:np.ndarray
 
     grid:np.ndarray
     """2D grid defining the geometry"""
@@ -20,23 +143,32 @@ class Data2D(DataContainer):
     v_values:np.ndarray
     """Coordinates of the grid points on the vertical axis"""
 
-    cell_ids:List[Union[int, str]]
-    """List of contained cell ids"""
-    cell_values:List[Union[float, str]]
-    """List of contained cell values"""
-    cell_colors:List[Tuple[int, int, int]]
-    """List of contained cell colors"""
-    cell_edge_colors:List[Tuple[int, int, int]]
-    """List of contained cell edge colors"""
-    
+    _cell_ids:np.ndarray
+    _cell_values:np.ndarray
+    _cell_colors:np.ndarray
+    _cell_edge_colors:np.ndarray
+
     simplify:bool
     """Simplify the polygons when converting from grid to polygon list"""
+    polygonizer:Polygonizer
+    """Algorithm converting the grid to polygons"""
+    tile_size:int
+    """Side in pixels of the tiles polygonized in parallel when converting from grid, None to polygonize the grid as a single tile"""
+    max_workers:int
+    """Number of processes polygonizing the tiles, None for the processors count"""
+    iso_bands:int
+    """Number of value bands contoured when converting a continuous grid to polygons, None to polygonize each grid value"""
+    color_range:Tuple[float, float]
+    """Values mapped on both ends of the color map when the cell colors are computed from the cell values, None otherwise"""
 
     def __init__(self):
         """ Empty constructor of the Data2D class.
         """
         self.data_type = None
-        self.polygons = []
+        self._polygons = []
+        self._packed_polygons = None
+        self._pixel_polygons = None
+        self._polygon_bounds = None
         self.grid = np.array([])
         self.u_values = np.array([])
         self.v_values = np.array([])
@@ -45,14 +177,309 @@ class Data2D(DataContainer):
         self.cell_colors = []
         self.cell_edge_colors = []
         self.simplify = None
+        self.polygonizer = Polygonizer.RUN_LENGTH
+        self.tile_size = None
+        self.max_workers = None
+        self.iso_bands = None
+        self.color_range = None
+
+    @property
+    def polygons(self) -> List[PolygonElement]:
+        """List of polygons defining the geometry. If the polygons were provided packed, the list is built on first access."""
+        if self._polygons is None:
+            self._polygons = self._packed_polygons.to_polygon_list(copy=False)
+        return self._polygons
+
+    @polygons.setter
+    def polygons(self, value:Union[List[PolygonElement], PackedPolygons]):
+        self._pixel_polygons = None
+        self._polygon_bounds = None
+        if isinstance(value, PackedPolygons):
+            self._polygons = None
+            self._packed_polygons = value
+        else:
+            self._polygons = value
+            self._packed_polygons = None
+
+    @property
+    def packed_polygons(self) -> PackedPolygons:
+        """Polygons defining the geometry stored in flat arrays. If the polygons were provided as a list, they are packed on first access."""
+        if self._packed_polygons is None:
+            self._packed_polygons = PackedPolygons.from_polygon_list(self._polygons)
+        return self._packed_polygons
+
+    @packed_polygons.setter
+    def packed_polygons(self, value:PackedPolygons):
+        self._pixel_polygons = None
+        self._polygon_bounds = None
+        self._polygons = None
+        self._packed_polygons = value
+
+    def get_polygon_count(self,) -> int:
+        """Returns the number of polygons without building the polygon list nor packing it
+
+        Returns
+        -------
+        int
+            Polygons count
+        """
+        if self._polygons is not None:
+            return len(self._polygons)
+        return len(self._packed_polygons)
+
+    @property
+    def nbytes(self) -> int:
+        """Size in bytes of the geometry and cell arrays, the polygons are counted packed"""
+        nbytes = sum(
+            array.nbytes 
+            for array in (self.grid, self.u_values, self.v_values, self.cell_ids, self.cell_values, self.cell_colors, self.cell_edge_colors)
+        )
+        if self.get_polygon_count() > 0:
+            nbytes += self.packed_polygons.nbytes
+        if self._pixel_polygons is not None:
+            nbytes += self._pixel_polygons.nbytes
+        if self._polygon_bounds is not None:
+            nbytes += self._polygon_bounds.nbytes
+        return nbytes
+
+    def take_polygons(self, indexes:np.ndarray):
+        """Keeps the polygons at the given indexes, in the given order. The cells columns are not modified.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the polygons to keep
+        """
+        polygons = None if self._polygons is None else [self._polygons[i] for i in indexes]
+        packed_polygons = None if self._packed_polygons is None else self._packed_polygons.take(indexes)
+
+        self._polygons = polygons
+        self._packed_polygons = packed_polygons
+        if self._pixel_polygons is not None:
+            self._pixel_polygons = self._pixel_polygons.take(indexes)
+        if self._polygon_bounds is not None:
+            self._polygon_bounds = self._polygon_bounds[indexes]
+
+    def get_polygon_bounds(self) -> np.ndarray:
+        """Returns the bounding box of each polygon, computed on first call and kept with the polygons
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (polygon_count, 4) containing (u_min, v_min, u_max, v_max) per polygon
+        """
+        if self._polygon_bounds is None:
+            self._polygon_bounds = self.get_packed_polygons().bounds()
+        return self._polygon_bounds
+
+    def get_polygons_in_range(self, u_range:Tuple[float, float], v_range:Tuple[float, float]) -> np.ndarray:
+        """Returns the indexes of the polygons whose bounding box intersects the given range
+
+        Parameters
+        ----------
+        u_range : Tuple[float, float]
+            Range along the horizontal axis
+        v_range : Tuple[float, float]
+            Range along the vertical axis
+
+        Returns
+        -------
+        np.ndarray
+            Sorted indexes of the polygons in range
+        """
+        bounds = self.get_polygon_bounds()
+        return np.flatnonzero(
+            (bounds[:, 0] <= u_range[1]) & (bounds[:, 2] >= u_range[0]) & 
+            (bounds[:, 1] <= v_range[1]) & (bounds[:, 3] >= v_range[0])
+        )
+
+    def get_cell_id_at(self, u:float, v:float) -> Union[int, str]:
+        """Returns the id of the cell whose polygon contains the point (u, v), None if no polygon contains it
+
+        Parameters
+        ----------
+        u : float
+            Horizontal coordinate of the point
+        v : float
+            Vertical coordinate of the point
+
+        Returns
+        -------
+        Union[int, str]
+            Cell id
+        """
+        candidates = self.get_polygons_in_range((u, u), (v, v))
+        if len(candidates) == 0:
+            return None
+
+        inside = shapely.intersects_xy(self.get_packed_polygons().take(candidates).to_shapely(), u, v)
+        if not inside.any():
+            return None
+
+        return self.cell_ids[candidates[np.argmax(inside)]]
+
+    def take(self, indexes:np.ndarray) -> "Data2D":
+        """Returns a Data2D containing the polygons and cell columns at the given indexes, in the given order
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the polygons to keep
+
+        Returns
+        -------
+        Data2D
+            Selected polygons
+        """
+        data2D = Data2D()
+        data2D.data_type = DataType.POLYGONS
+        data2D.packed_polygons = self.get_packed_polygons().take(indexes)
+        data2D._polygon_bounds = self.get_polygon_bounds()[indexes]
+        data2D.cell_ids = self.cell_ids[indexes]
+        data2D.cell_values = self.cell_values[indexes]
+        data2D.cell_colors = self.cell_colors[indexes]
+        data2D.cell_edge_colors = self.cell_edge_colors[indexes]
+        data2D.simplify = self.simplify
+        data2D.polygonizer = self.polygonizer
+        data2D.tile_size = self.tile_size
+        data2D.max_workers = self.max_workers
+        data2D.iso_bands = self.iso_bands
+        data2D.color_range = self.color_range
+
+        return data2D
+
+    def rasterize(self, u_values:np.ndarray, v_values:np.ndarray) -> "Data2D":
+        """Returns a grid Data2D sampling the polygons at the grid points. The points outside of the polygons belong to 
+        a transparent OUTSIDE cell (an empty string for string cell ids).
+
+        Parameters
+        ----------
+        u_values : np.ndarray
+            Regularly spaced coordinates of the grid points on the horizontal axis
+        v_values : np.ndarray
+            Regularly spaced coordinates of the grid points on the vertical axis
+
+        Returns
+        -------
+        Data2D
+            Grid Data2D containing the sampled cells and the OUTSIDE cell
+        """
+        u_values = np.asarray(u_values, dtype=float)
+        v_values = np.asarray(v_values, dtype=float)
+
+        #   Each grid point is the center of a pixel
+        du = (u_values[-1] - u_values[0]) / max(len(u_values) - 1, 1)
+        dv = (v_values[-1] - v_values[0]) / max(len(v_values) - 1, 1)
+        u_range = (u_values[0] - du / 2, u_values[-1] + du / 2)
+        v_range = (v_values[0] - dv / 2, v_values[-1] + dv / 2)
+
+        indexes = self.get_polygons_in_range(u_range, v_range)
+        index_grid = rasterize_polygons(self.get_packed_polygons().take(indexes), u_range, v_range, (len(v_values), len(u_values)))
+
+        outside_color = np.array([[255, 255, 255, 0]], dtype=np.uint8)
+
+        data_ = Data2D()
+        data_.cell_ids = np.append(self.cell_ids[indexes], OUTSIDE if self.cell_ids.dtype.kind in "iuf" else "")
+        data_.cell_values = np.append(self.cell_values[indexes], np.nan if self.cell_values.dtype.kind == "f" else "")
+        data_.cell_colors = np.concatenate([self.cell_colors[indexes], outside_color])
+        data_.cell_edge_colors = np.concatenate([self.cell_edge_colors[indexes], outside_color])
+
+        #   The points outside of the polygons have the index -1 of the OUTSIDE cell
+        data_.grid = data_.cell_ids[index_grid]
+        data_.u_values = u_values
+        data_.v_values = v_values
+        data_.simplify = self.simplify
+        data_.polygonizer = self.polygonizer
+        data_.tile_size = self.tile_size
+        data_.max_workers = self.max_workers
+        data_.iso_bands = self.iso_bands
+        data_.color_range = self.color_range
+        data_.data_type = DataType.GRID
+
+        return data_
+
+    @property
+    def cell_ids(self) -> np.ndarray:
+        """Array of contained cell ids, int64 (float64 if it contains OUTSIDE) or interned strings"""
+        return self._cell_ids
+
+    @cell_ids.setter
+    def cell_ids(self, value:Union[List[Union[int, str]], np.ndarray]):
+        self._cell_ids = as_cell_ids(value)
+
+    @property
+    def cell_values(self) -> np.ndarray:
+        """Array of contained cell values, float64 or interned strings"""
+        return self._cell_values
+
+    @cell_values.setter
+    def cell_values(self, value:Union[List[Union[float, str]], np.ndarray]):
+        self._cell_values = as_cell_values(value)
+
+    @property
+    def cell_colors(self) -> np.ndarray:
+        """Array of contained cell RGBA colors, uint8 array of shape (cell_count, 4)"""
+        return self._cell_colors
+
+    @cell_colors.setter
+    def cell_colors(self, value:Union[List[Tuple[int, int, int, int]], np.ndarray]):
+        self._cell_colors = as_cell_colors(value)
+
+    @property
+    def cell_edge_colors(self) -> np.ndarray:
+        """Array of contained cell RGBA edge colors, uint8 array of shape (cell_count, 4)"""
+        return self._cell_edge_colors
+
+    @cell_edge_colors.setter
+    def cell_edge_colors(self, value:Union[List[Tuple[int, int, int, int]], np.ndarray]):
+        self._cell_edge_colors = as_cell_colors(value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the attributes to pickle, the polygons are only pickled packed
+
+        Returns
+        -------
+        Dict[str, Any]
+            Attributes to pickle
+        """
+        state = self.__dict__.copy()
+        if self._polygons is not None and len(self._polygons) > 0:
+            state["_packed_polygons"] = self.packed_polygons
+        state["_polygons"] = None if state["_packed_polygons"] is not None else []
+        return state
+
+    def __setstate__(self, state:Dict[str, Any]):
+        """Restores a pickled Data2D, the cell columns of Data2D pickled as lists are converted to arrays
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            Pickled attributes
+        """
+        columns = {
+            key: state.pop(key) for key in ["polygons", "cell_ids", "cell_values", "cell_colors", "cell_edge_colors"] if key in state
+        }
+        state.setdefault("_polygons", [])
+        state.setdefault("_packed_polygons", None)
+        state.setdefault("_pixel_polygons", None)
+        state.setdefault("_polygon_bounds", None)
+        state.setdefault("polygonizer", Polygonizer.RUN_LENGTH)
+        state.setdefault("tile_size", None)
+        state.setdefault("max_workers", None)
+        state.setdefault("iso_bands", None)
+        state.setdefault("color_range", None)
+        self.__dict__.update(state)
+
+        for key, value in columns.items():
+            setattr(self, key, value)
 
     @classmethod
-    def from_polygon_list(cls, polygon_list:List[PolygonElement]):
-        """Build a Data2D object from a list of PolygonElement
+    def from_polygon_list(cls, polygon_list:Union[List[PolygonElement], PackedPolygons]):
+        """Build a Data2D object from a list of PolygonElement or from PackedPolygons
 
         Parameters
         ----------
-        polygon_list : List[PolygonElement]
+        polygon_list : Union[List[PolygonElement], PackedPolygons]
             Polygons contained in the Data2D
 
         Returns
@@ -63,18 +490,29 @@ class Data2D(DataContainer):
         data_ = Data2D()
         data_.polygons = polygon_list
 
-        data_.cell_ids = [p.cell_id for p in polygon_list]
-        data_.cell_values = [np.nan]*len(polygon_list)
+        if isinstance(polygon_list, PackedPolygons):
+            data_.cell_ids = polygon_list.cell_ids.copy()
+        else:
+            data_.cell_ids = [p.cell_id for p in polygon_list]
+        data_.cell_values = np.full(len(polygon_list), np.nan)
 
-        data_.cell_colors = np.zeros((len(polygon_list), 4)) + 255
-        data_.cell_edge_colors = np.zeros((len(polygon_list), 4)) + 50
+        data_.cell_colors = np.full((len(polygon_list), 4), 255, dtype=np.uint8)
+        data_.cell_edge_colors = np.full((len(polygon_list), 4), 50, dtype=np.uint8)
         
         data_.data_type = DataType.POLYGONS
 
         return data_
 
     @classmethod
-    def from_grid(cls, grid:np.ndarray, u_values:np.ndarray, v_values:np.ndarray, simplify:bool = False):
+    def from_grid(cls, 
+                    grid:np.ndarray, 
+                    u_values:np.ndarray, 
+                    v_values:np.ndarray, 
+                    simplify:bool = False, 
+                    polygonizer:Polygonizer = Polygonizer.RUN_LENGTH,
+                    iso_bands:int = None,
+                    tile_size:int = None,
+                    max_workers:int = None):
         """Build a Data2D object from a list of PolygonElement
 
         Parameters
@@ -87,6 +525,14 @@ class Data2D(DataContainer):
             Coordinates of the grid points on the vertical axis
         simplify : bool
             Simplify the polygons when converted to polygon list
+        polygonizer : Polygonizer, optional
+            Algorithm converting the grid to polygons, by default Polygonizer.RUN_LENGTH
+        iso_bands : int, optional
+            Number of value bands contoured when converting a continuous grid to polygons, by default None: one polygon per connected area of each value
+        tile_size : int, optional
+            Side in pixels of the tiles polygonized in parallel when converted to polygons, by default None: the grid is polygonized as a single tile
+        max_workers : int, optional
+            Number of processes polygonizing the tiles, by default None (processors count)
 
         Returns
         -------
@@ -99,37 +545,122 @@ class Data2D(DataContainer):
         data_.u_values = u_values
         data_.v_values = v_values
 
-        data_.cell_ids = np.unique(grid.flatten())
-        data_.cell_values = [np.nan]*len(data_.cell_ids)
+        data_.cell_ids = np.unique(grid)
+        data_.cell_values = np.full(len(data_.cell_ids), np.nan)
 
-        data_.cell_colors = np.zeros((len(data_.cell_ids), 4)) + 1
-        data_.cell_edge_colors = np.zeros((len(data_.cell_ids), 4)) + 1
+        data_.cell_colors = np.ones((len(data_.cell_ids), 4), dtype=np.uint8)
+        data_.cell_edge_colors = np.ones((len(data_.cell_ids), 4), dtype=np.uint8)
         
         data_.simplify = simplify
+        data_.polygonizer = polygonizer
+        data_.tile_size = tile_size
+        data_.max_workers = max_workers
+        data_.iso_bands = iso_bands
         data_.data_type = DataType.GRID
 
         return data_
     
-    def convert_to_polygons(self,):
-        """Convert the geometry to polygons
+    def convert_to_polygons(self, previous:"Data2D" = None):
+        """Convert the geometry to polygons. 
+        
+        If previous was converted from a grid on the same points, only the blocks of the grid that changed are polygonized again, 
+        the other polygons are taken from previous.
+
+        Parameters
+        ----------
+        previous : Data2D, optional
+            Formerly converted Data2D, by default None
         """
         if self.data_type == DataType.POLYGONS:
             pass
+        elif self.iso_bands is not None:
+            self.convert_to_iso_bands()
         else:
-            self.polygons = numpy_2D_array_to_polygons(self.u_values, self.v_values, self.grid, self.simplify)
+            spliced = None
+            if self._is_incremental_from(previous):
+                spliced = splice_pixel_polygons(previous._pixel_polygons, previous.grid, self.grid, polygonizer=self.polygonizer)
+
+            if spliced is None:
+                pixel_polygons = grid_to_pixel_polygons(self.grid, self.tile_size, self.max_workers, self.polygonizer)
+                self.polygons = pixel_to_frame_polygons(pixel_polygons, self.u_values, self.v_values, self.simplify)
+            else:
+                kept, new_pixel_polygons, _ = spliced
+                pixel_polygons = PackedPolygons.concatenate([previous._pixel_polygons.take(kept), new_pixel_polygons])
+                self.polygons = PackedPolygons.concatenate([
+                    previous.packed_polygons.take(kept), 
+                    pixel_to_frame_polygons(new_pixel_polygons, self.u_values, self.v_values, self.simplify)
+                ])
+            self._pixel_polygons = pixel_polygons
 
             # The polygons count will become different than the number of cell values, so we update and change the data_type
-            id_to_value = dict(zip(self.cell_ids, self.cell_values))
-            id_to_color = dict(zip(self.cell_ids, self.cell_colors))
-            id_to_edge_color = dict(zip(self.cell_ids, self.cell_edge_colors))
+            sorter = np.argsort(self.cell_ids)
+            indexes = sorter[np.searchsorted(self.cell_ids, self.packed_polygons.cell_ids, sorter=sorter)]
 
-            self.cell_ids = [p.cell_id for p in self.polygons]
-            self.cell_values = [id_to_value[e] for e in self.cell_ids]
-            self.cell_colors = [id_to_color[e] for e in self.cell_ids]
-            self.cell_edge_colors = [id_to_edge_color[e] for e in self.cell_ids]
+            self.cell_ids = self.cell_ids[indexes]
+            self.cell_values = self.cell_values[indexes]
+            self.cell_colors = self.cell_colors[indexes]
+            self.cell_edge_colors = self.cell_edge_colors[indexes]
 
             self.data_type = DataType.POLYGONS
 
+    def convert_to_iso_bands(self,):
+        """Convert the continuous grid to the polygons of iso_bands bands of values, 
+        each band takes the cell columns of the cell id closest to its center value
+        """
+        if self.grid.dtype.kind not in "iuf":
+            raise TypeError(f"Iso-bands require a numerical grid, found dtype {self.grid.dtype}")
+
+        band_edges = iso_band_edges(self.grid, self.iso_bands)
+        polygons = numpy_2D_array_to_iso_bands(self.u_values, self.v_values, self.grid, band_edges)
+
+        #   Closest finite cell id to each band center
+        finite = np.flatnonzero(np.isfinite(self.cell_ids))
+        sorter = finite[np.argsort(self.cell_ids[finite])]
+        sorted_ids = self.cell_ids[sorter]
+        centers = (band_edges[1:] + band_edges[:-1]) / 2
+
+        above = np.minimum(np.searchsorted(sorted_ids, centers), len(sorted_ids) - 1)
+        below = np.maximum(above - 1, 0)
+        closest = np.where(
+            np.abs(sorted_ids[below] - centers) <= np.abs(sorted_ids[above] - centers), 
+            sorter[below], 
+            sorter[above]
+        )
+        indexes = closest[polygons.cell_ids]
+
+        polygons.cell_ids = self.cell_ids[indexes]
+        self.polygons = polygons
+
+        self.cell_ids = self.cell_ids[indexes]
+        self.cell_values = self.cell_values[indexes]
+        self.cell_colors = self.cell_colors[indexes]
+        self.cell_edge_colors = self.cell_edge_colors[indexes]
+
+        self.data_type = DataType.POLYGONS
+
+    def _is_incremental_from(self, previous:"Data2D") -> bool:
+        """Checks if previous kept the pixel polygons of a grid defined on the same points as self grid
+
+        Parameters
+        ----------
+        previous : Data2D
+            Formerly converted Data2D
+
+        Returns
+        -------
+        bool
+            The polygons of previous can be spliced
+        """
+        return (
+            previous is not None
+            and previous._pixel_polygons is not None
+            and previous.simplify == self.simplify
+            and previous.grid.shape == self.grid.shape
+            and previous.grid.dtype.kind == self.grid.dtype.kind
+            and np.array_equal(previous.u_values, self.u_values)
+            and np.array_equal(previous.v_values, self.v_values)
+        )
+
     def get_polygons(self,) -> List[PolygonElement]:
         """Returns the polygon list of the geometry. If defined as grid, the grid is rasterized and self is converted to polygon data.
 
@@ -145,6 +676,18 @@ class Data2D(DataContainer):
             
             return self.polygons
 
+    def get_packed_polygons(self,) -> PackedPolygons:
+        """Returns the packed polygons of the geometry. If defined as grid, the grid is rasterized and self is converted to polygon data.
+
+        Returns
+        -------
+        PackedPolygons
+            Packed polygons
+        """
+        self.convert_to_polygons()
+
+        return self.packed_polygons
+
     def get_grid(self,) -> np.ndarray:
         """Returns the grid associated to the current geometry
 
@@ -173,15 +716,23 @@ class Data2D(DataContainer):
         """
         data2D = Data2D()
         data2D.data_type = self.data_type
-        data2D.polygons = self.polygons.copy()
+        data2D._polygons = None if self._polygons is None else self._polygons.copy()
+        data2D._packed_polygons = None if self._packed_polygons is None else self._packed_polygons.copy()
+        data2D._pixel_polygons = None if self._pixel_polygons is None else self._pixel_polygons.copy()
+        data2D._polygon_bounds = None if self._polygon_bounds is None else self._polygon_bounds.copy()
         data2D.grid = self.grid.copy()
         data2D.u_values = self.u_values.copy()
         data2D.v_values = self.v_values.copy()
-        data2D.cell_ids = np.array(self.cell_ids).tolist()
-        data2D.cell_values = np.array(self.cell_values).tolist()
-        data2D.cell_colors = np.array(self.cell_colors).tolist()
-        data2D.cell_edge_colors = np.array(self.cell_edge_colors).tolist()
+        data2D.cell_ids = self.cell_ids.copy()
+        data2D.cell_values = self.cell_values.copy()
+        data2D.cell_colors = self.cell_colors.copy()
+        data2D.cell_edge_colors = self.cell_edge_colors.copy()
         data2D.simplify = self.simplify
+        data2D.polygonizer = self.polygonizer
+        data2D.tile_size = self.tile_size
+        data2D.max_workers = self.max_workers
+        data2D.iso_bands = self.iso_bands
+        data2D.color_range = self.color_range
 
         return data2D
 
@@ -192,9 +743,9 @@ class Data2D(DataContainer):
         assert len(self.cell_values) == len(self.cell_colors), "The Data2D object must have the same number of cell values and colors"
         assert len(self.cell_values) == len(self.cell_edge_colors), "The Data2D object must have the same number of cell values and edge colors"
         if self.data_type == DataType.POLYGONS:
-            assert len(self.cell_values) == len(self.polygons), "The Data2D object must have the same number of cell values and polygons"
+            assert len(self.cell_values) == self.get_polygon_count(), "The Data2D object must have the same number of cell values and polygons"
 
-        if any(isinstance(item, str) for item in self.cell_values):
+        if self.cell_values.dtype == object:
             assert all(isinstance(item, str) for item in self.cell_values), "If any of the values is a string, they all must be"
 
 
@@ -27,10 +27,10 @@ class Data2DWorker:
             data_2d changed
         """
         try:
-            np.testing.assert_equal(np.array(self.data2d.cell_colors), np.array(self.data2d_save.cell_colors))
-            np.testing.assert_equal(np.array(self.data2d.cell_edge_colors), np.array(self.data2d_save.cell_edge_colors))
-            np.testing.assert_equal(np.array(self.data2d.cell_ids), np.array(self.data2d_save.cell_ids))
-            np.testing.assert_equal(np.array(self.data2d.cell_values), np.array(self.data2d_save.cell_values))
+            np.testing.assert_equal(self.data2d.cell_colors, self.data2d_save.cell_colors)
+            np.testing.assert_equal(self.data2d.cell_edge_colors, self.data2d_save.cell_edge_colors)
+            np.testing.assert_equal(self.data2d.cell_ids, self.data2d_save.cell_ids)
+            np.testing.assert_equal(self.data2d.cell_values, self.data2d_save.cell_values)
         except AssertionError:
             return True
 
@@ -54,7 +54,7 @@ class Data2DWorker:
         np.ndarray
             Numpy array with the value per cell
         """
-        return np.array(self.data2d.cell_values)
+        return self.data2d.cell_values.copy()
     
     def get_colors(self,) -> np.ndarray:
         """Returns the color per 2D cell of the geometry. 
@@ -65,7 +65,7 @@ class Data2DWorker:
         np.ndarray
             Numpy array with the value per cell
         """
-        return np.array(self.data2d.cell_colors)
+        return self.data2d.cell_colors.copy()
     
     def set_colors(self, colors:np.ndarray) -> bool:
         """Sets the cells color values, expects a numpy array of integers between 0 and 255 of shape (cell_count, 4). return True if it's ok.
@@ -83,19 +83,18 @@ class Data2DWorker:
         assert type(colors) in (np.ndarray, list), f"A numpy array is expected, type found {type(colors)}."
         colors = np.array(colors)
         assert len(colors.shape) == 2, f"A 2D numpy array is expected, shape found {colors.shape}."
-        assert colors.shape == np.array(self.data2d.cell_colors).shape, f"We expect the same number of elements as in self.data2d.cell_colors, received shape {colors.shape} instead of {self.data2d.cell_colors}."
+        assert colors.shape == self.data2d.cell_colors.shape, f"We expect the same number of elements as in self.data2d.cell_colors, received shape {colors.shape} instead of {self.data2d.cell_colors}."
         assert colors.flatten().max() <= 255, f"The values must be lower than 255, found in array {colors.flatten().max()}."
         assert colors.flatten().min() >= 0, f"The values must be greater than 0, found in array {colors.flatten().min()}."
 
-        self.data2d.cell_colors = colors.tolist()
-        self.data2d.cell_edge_colors = get_edges_colors(colors).tolist()
+        self.data2d.cell_colors = colors
 
-        edge_colors = np.array(self.data2d.cell_edge_colors)
+        edge_colors = get_edges_colors(self.data2d.cell_colors)
 
-        if not isinstance(self.data2d.cell_values[0], str):
-            edge_colors[:, 3] = np.where(np.isnan(np.array(self.data2d.cell_values)), 255, edge_colors[:, 3])
+        if self.data2d.cell_values.dtype != object:
+            edge_colors[:, 3] = np.where(np.isnan(self.data2d.cell_values), 255, edge_colors[:, 3])
 
-        self.data2d.cell_edge_colors = edge_colors.tolist()
+        self.data2d.cell_edge_colors = edge_colors
 
         return True
     
@@ -120,14 +119,8 @@ class Data2DWorker:
         assert alphas.max() <= 255, f"The values must be lower than 255, found in array {alphas.max()}."
         assert alphas.min() >= 0, f"The values must be greater than 0, found in array {alphas.min()}."
 
-        colors = np.array(self.data2d.cell_colors)
-        colors[:, -1] = alphas.astype(int)
-        
-        edge_colors = np.array(self.data2d.cell_edge_colors)
-        edge_colors[:, -1] = alphas.astype(int)
-
-        self.data2d.cell_colors = colors.tolist()
-        self.data2d.cell_edge_colors = edge_colors.tolist()
+        self.data2d.cell_colors[:, -1] = alphas
+        self.data2d.cell_edge_colors[:, -1] = alphas
 
         return True
 
@@ -0,0 +1,220 @@
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scivianna.data.data2d import Data2D
+from scivianna.utils.polygonize_tools import PackedPolygons
+
+ALIGNMENT = 64
+"""Byte alignment of each array in the shared memory block"""
+
+SHARED_FIELDS = [
+    "grid",
+    "u_values",
+    "v_values",
+    "cell_ids",
+    "cell_values",
+    "cell_colors",
+    "cell_edge_colors",
+]
+"""Data2D attributes that are put in the shared memory block when their content is numeric (or fixed width strings)"""
+
+SENT_ATTRIBUTES = [
+    "data_type",
+    "simplify",
+    "polygonizer",
+    "tile_size",
+    "max_workers",
+    "iso_bands",
+    "color_range",
+]
+"""Data2D attributes that are sent as is along the shared memory block"""
+
+_unreleased_blocks: List[shared_memory.SharedMemory] = []
+"""Mapped blocks that could not be closed when their Data2D was deleted, kept to avoid closing them during garbage collection"""
+
+
+class SharedData2D:
+    """Small picklable descriptor of a Data2D whose arrays were copied in a shared memory block"""
+
+    def __init__(
+        self,
+        name: str,
+        layout: Dict[str, Tuple[str, Tuple[int, ...], int]],
+        attributes: Dict[str, Any],
+    ):
+        """SharedData2D constructor
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared memory block
+        layout : Dict[str, Tuple[str, Tuple[int, ...], int]]
+            (dtype, shape, offset in bytes) of each array stored in the block
+        attributes : Dict[str, Any]
+            Data2D attributes that are sent as is
+        """
+        self.name: str = name
+        """Name of the shared memory block"""
+        self.layout: Dict[str, Tuple[str, Tuple[int, ...], int]] = layout
+        """(dtype, shape, offset in bytes) of each array stored in the block"""
+        self.attributes: Dict[str, Any] = attributes
+        """Data2D attributes that are sent as is"""
+
+
+def _as_shareable_array(value: Any) -> Optional[np.ndarray]:
+    """Returns value as a numpy array if it can be stored in a raw buffer and read back identically, None otherwise
+
+    Parameters
+    ----------
+    value : Any
+        List or array to share
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Array version of value
+    """
+    if value is None:
+        return None
+
+    array = np.asarray(value)
+
+    if array.dtype.kind in "biuf":
+        return array
+    if array.dtype.kind == "U":
+        #   np.asarray would convert a nan in a list of strings to "nan"
+        if isinstance(value, np.ndarray) or all(isinstance(v, str) for v in value):
+            return array
+    return None
+
+
+def share_data_2d(data: Data2D) -> SharedData2D:
+    """Copies the arrays of a Data2D in a new shared memory block, and returns the descriptor to send to the other process.
+
+    The block is closed but not unlinked, the process calling map_data_2d becomes responsible for it.
+
+    Parameters
+    ----------
+    data : Data2D
+        Data to share
+
+    Returns
+    -------
+    SharedData2D
+        Descriptor to send to the other process
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    attributes: Dict[str, Any] = {field: getattr(data, field) for field in SENT_ATTRIBUTES}
+
+    for field in SHARED_FIELDS:
+        value = getattr(data, field)
+        array = _as_shareable_array(value)
+        if array is None:
+            attributes[field] = value
+        else:
+            arrays[field] = array
+
+    if data.get_polygon_count() > 0:
+        polygons = data.packed_polygons
+        arrays["polygon_x"] = polygons.x_coords
+        arrays["polygon_y"] = polygons.y_coords
+        arrays["ring_offsets"] = polygons.ring_offsets
+        arrays["polygon_offsets"] = polygons.polygon_offsets
+
+        array = _as_shareable_array(polygons.cell_ids)
+        if array is None:
+            attributes["polygon_cell_ids"] = polygons.cell_ids
+        else:
+            arrays["polygon_cell_ids"] = array
+
+        attributes["polygon_compos"] = polygons.compos
+
+    layout: Dict[str, Tuple[str, Tuple[int, ...], int]] = {}
+    size = 0
+    for field, array in arrays.items():
+        layout[field] = (array.dtype.str, array.shape, size)
+        size += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for field, array in arrays.items():
+        dtype, shape, offset = layout[field]
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = array
+
+    shared = SharedData2D(shm.name, layout, attributes)
+    shm.close()
+
+    return shared
+
+
+def _release_block(shm: shared_memory.SharedMemory):
+    """Closes a mapped block once no array uses it anymore
+
+    Parameters
+    ----------
+    shm : shared_memory.SharedMemory
+        Block to close
+    """
+    try:
+        shm.close()
+    except BufferError:
+        _unreleased_blocks.append(shm)
+
+
+def map_data_2d(shared: SharedData2D) -> Data2D:
+    """Builds a Data2D whose arrays are views on the shared memory block described by shared.
+
+    The block name is unlinked right away, the memory is freed when the returned arrays are no longer referenced. 
+    The polygons are mapped as PackedPolygons, without building any PolygonElement.
+
+    Parameters
+    ----------
+    shared : SharedData2D
+        Descriptor received from the process that called share_data_2d
+
+    Returns
+    -------
+    Data2D
+        Mapped data
+    """
+    shm = shared_memory.SharedMemory(name=shared.name)
+    shm.unlink()
+
+    #   All arrays are views of block, the block is closed when the last of them is deleted
+    block = np.ndarray((shm.size,), dtype=np.uint8, buffer=shm.buf)
+    weakref.finalize(block, _release_block, shm)
+
+    arrays: Dict[str, np.ndarray] = {
+        field: block[offset:offset + int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize].view(dtype).reshape(shape)
+        for field, (dtype, shape, offset) in shared.layout.items()
+    }
+    del block
+
+    data = Data2D()
+    for field in SENT_ATTRIBUTES:
+        setattr(data, field, shared.attributes[field])
+
+    for field in SHARED_FIELDS:
+        if field in arrays:
+            setattr(data, field, arrays[field])
+        else:
+            setattr(data, field, shared.attributes[field])
+
+    if "polygon_offsets" in arrays:
+        if "polygon_cell_ids" in arrays:
+            polygon_cell_ids = arrays["polygon_cell_ids"]
+        else:
+            polygon_cell_ids = shared.attributes["polygon_cell_ids"]
+
+        data.packed_polygons = PackedPolygons(
+            arrays["polygon_x"],
+            arrays["polygon_y"],
+            arrays["ring_offsets"],
+            arrays["polygon_offsets"],
+            polygon_cell_ids,
+            shared.attributes["polygon_compos"],
+        )
+
+    return data
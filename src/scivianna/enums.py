@@ -70,3 +70,13 @@ class UpdateEvent(Enum):
     RANGE_CHANGE = 5
     """ The plot is updated when the (u, v) ranges change
     """
+
+class Polygonizer(Enum):
+    """Which algorithm converts a grid to polygons"""
+
+    RUN_LENGTH = 0
+    """ The rows runs of equal values are merged vertically and their borders chained, in numpy
+    """
+    RASTERIO = 1
+    """ rasterio.features.shapes, requires the rasterio module
+    """
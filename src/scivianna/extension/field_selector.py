@@ -11,7 +11,7 @@ from scivianna.enums import VisualizationMode
 from scivianna.extension.extension import Extension
 from scivianna.plotter_2d.generic_plotter import Plotter2D
 from scivianna.slave import ComputeSlave
-from scivianna.utils.color_tools import beautiful_color_maps, get_edges_colors, interpolate_cmap_at_values
+from scivianna.utils.color_tools import beautiful_color_maps, colors_from_lut, get_edges_colors
 
 if TYPE_CHECKING:
     from scivianna.panel.visualisation_panel import VisualizationPanel
@@ -55,6 +55,7 @@ def set_colors_list(
     coloring_mode = slave.get_label_coloring_mode(coloring_label)
 
     cell_values = data.cell_values
+    data.color_range = None
 
     if profile_time:
         print(f"get color list prepare time {time.time() - start_time}")
@@ -64,26 +65,19 @@ def set_colors_list(
         """
         A random color is given for each string value.
         """
-        sorted_values = np.sort(np.unique(list(cell_values)))
+        sorted_values, inv = np.unique(cell_values, return_inverse=True)
         map_to = np.array([hash(c) % 255 for c in sorted_values]) / 255
 
-        value_list = np.array(cell_values)
-
-        _, inv = np.unique(value_list, return_inverse=True)
-
-        cell_colors = interpolate_cmap_at_values(
-            color_map, map_to[inv].astype(float)
-        )
+        cell_colors = colors_from_lut(color_map, map_to[inv])
 
         if OUTSIDE in data.cell_ids:
-            for index_ in np.where(data.cell_ids == OUTSIDE):
-                cell_colors[index_] = (255, 255, 255, 0)
+            cell_colors[data.cell_ids == OUTSIDE] = (255, 255, 255, 0)
 
     elif coloring_mode == VisualizationMode.FROM_VALUE:
         """
         The color is got from a color map set in the range (-max, max)
         """
-        normalized_cell_values = np.array(cell_values).astype(float)
+        normalized_cell_values = cell_values.astype(float)
         no_nan_values = normalized_cell_values[~np.isnan(normalized_cell_values)]
 
         if profile_time:
@@ -99,6 +93,7 @@ def set_colors_list(
                 minmax = max(abs(no_nan_values.min()), no_nan_values.max())
 
             normalized_cell_values = (normalized_cell_values + minmax) / (2 * minmax)
+            data.color_range = (-float(minmax), float(minmax))
         else:
             if (
                 len(no_nan_values) == 0 or max(abs(no_nan_values.min()), no_nan_values.max()) == 0.0
@@ -113,46 +108,39 @@ def set_colors_list(
                 min_val = no_nan_values.min()
 
             normalized_cell_values = (normalized_cell_values - min_val) / minmax
+            data.color_range = (float(min_val), float(min_val + minmax))
 
         if profile_time:
             print(f"Rescaling data {time.time() - start_time}")
             start_time = time.time()
 
-        cell_colors = interpolate_cmap_at_values(
-            color_map, normalized_cell_values
+        # The Nan values are colored in transparent gray
+        cell_colors = colors_from_lut(
+            color_map, normalized_cell_values, nan_color=(200, 200, 200, 0)
         )
 
         if profile_time:
             print(f"Extracting colors {time.time() - start_time}")
             start_time = time.time()
 
-        # Changing the main color from black to gray in case of Nan
-        for c in range(len(cell_colors)):
-            if cell_colors[c, 3] == 0.0:
-                cell_colors[c] = (200, 200, 200, 0)
-
-        if profile_time:
-            print(f"Fixing nans {time.time() - start_time}")
-            start_time = time.time()
-
     elif coloring_mode == VisualizationMode.NONE:
         """
         No color, mesh displayed only
         """
-        cell_colors = np.array([(200, 200, 200, 0)] * (len(data.cell_ids)))
+        cell_colors = np.tile(np.array([200, 200, 200, 0], dtype=np.uint8), (len(data.cell_ids), 1))
     else:
         raise NotImplementedError(
             f"Visualization mode {coloring_mode} not implemented."
         )
 
-    data.cell_colors = cell_colors.tolist()
+    data.cell_colors = cell_colors
 
-    edge_colors = get_edges_colors(cell_colors)
+    edge_colors = get_edges_colors(data.cell_colors)
 
-    if not isinstance(cell_values[0], str):
-        edge_colors[:, 3] = np.where(np.isnan(np.array(cell_values)), 255, edge_colors[:, 3])
+    if cell_values.dtype != object:
+        edge_colors[:, 3] = np.where(np.isnan(cell_values), 255, edge_colors[:, 3])
 
-    data.cell_edge_colors = edge_colors.tolist()
+    data.cell_edge_colors = edge_colors
 
 
 class FieldSelector(Extension):
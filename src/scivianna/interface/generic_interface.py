@@ -1,10 +1,14 @@
+from collections import deque
+import functools
 import multiprocessing as mp
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Any, List, Tuple, Dict, Union
+from typing import Any, Callable, Hashable, List, Tuple, Dict, Union
 
 from scivianna.data.data2d import Data2D
 from scivianna.enums import VisualizationMode, GeometryType, DataType
+from scivianna.utils.lru_cache import LRUCache
 
 from typing import TYPE_CHECKING
 
@@ -12,7 +16,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import medcoupling
 
-from scivianna.constants import MESH, MATERIAL
+from scivianna.constants import MESH, MATERIAL, SCREEN_RESOLUTION, DEVICE_PIXEL_RATIO
 
 
 class GenericInterface:
@@ -108,6 +112,19 @@ class GenericInterface:
         """
         return obj
 
+    def idle_task(self) -> bool:
+        """Runs a short unit of background work (e.g. precomputations) while the slave has no task to process. 
+        The slave checks for incoming tasks between two calls, a unit of work should then be short to keep the GUI responsive.
+
+        By default, the interface has no background work.
+
+        Returns
+        -------
+        bool
+            Whether background work remains
+        """
+        return False
+
     def save(self, file_path: Path, include_files: bool):
         """Pickle saves the slave content to a file, allows slave state reload.
 
@@ -151,6 +168,125 @@ class Geometry2D(GenericInterface):
     rasterized: bool = False
     """Boolean telling if the geometry is made by rasterizing a 2D grid (displays the line count in the GUI)."""
 
+    frame_cache_size: int = 0
+    """Maximum size in bytes of the frames kept by a compute_2D_data decorated with cache_frames, the cache is disabled at 0."""
+    frame_cache_bounds: bool = True
+    """Whether the computed geometry depends on the u and v bounds. If False, frames only differing by their bounds share a cache entry."""
+    frame_cache_options: List[str] = None
+    """Options on which the computed geometry depends, all options are used in the cache key if None."""
+    frame_requests_history: int = 2
+    """Number of frame requests arguments kept by a compute_2D_data decorated with cache_frames, to guess the next frames in idle_task"""
+
+    def get_frame_requests(self,) -> deque:
+        """Returns the arguments (u, v, u_min, u_max, v_min, v_max, w_value, options) of the last frames requested to a compute_2D_data decorated with cache_frames, most recent last
+
+        Returns
+        -------
+        deque
+            Last frame requests
+        """
+        if "_frame_requests" not in self.__dict__:
+            self._frame_requests = deque(maxlen=self.frame_requests_history)
+        return self._frame_requests
+
+    def get_frame_cache(self,) -> LRUCache:
+        """Returns the cache of the computed frames, built on first call
+
+        Returns
+        -------
+        LRUCache
+            Computed frames cache
+        """
+        if "_frame_cache" not in self.__dict__:
+            self._frame_cache = LRUCache(self.frame_cache_size, lambda data: data.nbytes)
+        return self._frame_cache
+
+    def clear_frame_cache(self,):
+        """Empties the computed frames cache, to call when the geometry changes (e.g. a new file is read)"""
+        self.get_frame_cache().clear()
+        self._last_frame_key = None
+
+    def get_frame_key(
+        self,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        u_min: float,
+        u_max: float,
+        v_min: float,
+        v_max: float,
+        w_value: float,
+        options: Dict[str, Any],
+    ) -> Hashable:
+        """Returns the key identifying a frame geometry in the frames cache
+
+        Parameters
+        ----------
+        u : Tuple[float, float, float]
+            Horizontal coordinate director vector
+        v : Tuple[float, float, float]
+            Vertical coordinate director vector
+        u_min : float
+            Lower bound value along the u axis
+        u_max : float
+            Upper bound value along the u axis
+        v_min : float
+            Lower bound value along the v axis
+        v_max : float
+            Upper bound value along the v axis
+        w_value : float
+            Value along the u ^ v axis
+        options : Dict[str, Any]
+            Additional options for frame computation.
+
+        Returns
+        -------
+        Hashable
+            Frame key
+        """
+        bounds = (u_min, u_max, v_min, v_max) if self.frame_cache_bounds else None
+
+        option_names = sorted(options) if self.frame_cache_options is None else self.frame_cache_options
+        option_values = []
+        for name in option_names:
+            value = options.get(name)
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+            option_values.append((name, value))
+
+        #   Rounded to share the entry of frames computed with a different floating point arithmetic (e.g. w + k * step)
+        return (
+            tuple(round(float(e), 12) for e in u),
+            tuple(round(float(e), 12) for e in v),
+            None if w_value is None else round(float(w_value), 12),
+            bounds,
+            tuple(option_values),
+        )
+
+    def restore_cached_frame(
+        self,
+        data: Data2D,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        w_value: float,
+    ):
+        """Called by a compute_2D_data decorated with cache_frames when the requested frame is taken from the cache, 
+        to override in the interfaces keeping the last computed frame (e.g. to save it)
+
+        Parameters
+        ----------
+        data : Data2D
+            Cached frame, not to be modified
+        u : Tuple[float, float, float]
+            Horizontal coordinate director vector
+        v : Tuple[float, float, float]
+            Vertical coordinate director vector
+        w_value : float
+            Value along the u ^ v axis
+        """
+        pass
+
     def compute_2D_data(
         self,
         u: Tuple[float, float, float],
@@ -227,6 +363,204 @@ class Geometry2D(GenericInterface):
         raise NotImplementedError()
 
 
+def cache_frames(compute_2D_data: Callable) -> Callable:
+    """Decorator adding a least recently used cache of the computed frames to a Geometry2D.compute_2D_data implementation.
+
+    The frames are identified by Geometry2D.get_frame_key, and kept within the Geometry2D.frame_cache_size budget. 
+    The decorated function is only called on cache misses, Geometry2D.restore_cached_frame is called on cache hits. 
+    A copy of the cached frame is returned, so the caller can modify it without changing the cache entry. 
+    The returned boolean tells if the returned frame differs from the one returned by the previous call.
+    The requests arguments are recorded in Geometry2D.get_frame_requests.
+
+    Parameters
+    ----------
+    compute_2D_data : Callable
+        compute_2D_data function to decorate
+
+    Returns
+    -------
+    Callable
+        Decorated function
+    """
+    @functools.wraps(compute_2D_data)
+    def cached_compute_2D_data(
+        self: Geometry2D,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        u_min: float,
+        u_max: float,
+        v_min: float,
+        v_max: float,
+        w_value: float,
+        q_tasks: mp.Queue,
+        options: Dict[str, Any],
+    ) -> Tuple[Data2D, bool]:
+        if self.frame_cache_size <= 0:
+            return compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options)
+
+        self.get_frame_requests().append((u, v, u_min, u_max, v_min, v_max, w_value, options))
+
+        key = self.get_frame_key(u, v, u_min, u_max, v_min, v_max, w_value, options)
+        cache = self.get_frame_cache()
+
+        data = cache.get(key)
+        if data is None:
+            data, _ = compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options)
+            cache.put(key, data)
+        else:
+            self.restore_cached_frame(data, u, v, w_value)
+
+        updated = key != self.__dict__.get("_last_frame_key")
+        self._last_frame_key = key
+
+        return data.copy(), updated
+
+    return cached_compute_2D_data
+
+
+def get_screen_grid_values(
+    u_min: float,
+    u_max: float,
+    v_min: float,
+    v_max: float,
+    options: Dict[str, Any],
+    default_steps: Tuple[int, int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the coordinates of the grid points sampling a frame with one point per device pixel, 
+    from the screen resolution and device pixel ratio options the 2D panels give to the Geometry2DGrid interfaces
+
+    Parameters
+    ----------
+    u_min : float
+        Lower bound value along the u axis
+    u_max : float
+        Upper bound value along the u axis
+    v_min : float
+        Lower bound value along the v axis
+    v_max : float
+        Upper bound value along the v axis
+    options : Dict[str, Any]
+        Options given to compute_2D_data
+    default_steps : Tuple[int, int]
+        Points counts along the u and v axes if the options do not contain the screen resolution
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Coordinates of the grid points on the horizontal and vertical axes
+    """
+    u_steps, v_steps = default_steps
+
+    resolution = options.get(SCREEN_RESOLUTION)
+    if resolution is not None and resolution[0] and resolution[1]:
+        pixel_ratio = options.get(DEVICE_PIXEL_RATIO, 1.)
+        u_steps = max(int(round(resolution[0] * pixel_ratio)), 2)
+        v_steps = max(int(round(resolution[1] * pixel_ratio)), 2)
+
+    return np.linspace(u_min, u_max, u_steps), np.linspace(v_min, v_max, v_steps)
+
+
+def cache_tiles(compute_2D_data: Callable) -> Callable:
+    """Decorator computing the frames of a Geometry2DGrid.compute_2D_data implementation from cached square tiles, so panning only computes the newly exposed tiles.
+
+    The grid points are spaced by the power of two closest to the device pixel size given in the SCREEN_RESOLUTION and DEVICE_PIXEL_RATIO options, 
+    the tiles of Geometry2DGrid.tile_size points per side are aligned on multiples of their size at this spacing. 
+    The decorated function is called on each missing tile, with a (tile_size, tile_size) SCREEN_RESOLUTION and a unit DEVICE_PIXEL_RATIO, and must return 
+    a grid of this shape, e.g. sampled at get_screen_grid_values. The tiles are kept within the Geometry2DGrid.tile_cache_size budget, 
+    the frames are computed directly if the tiles are disabled or Geometry2DGrid.use_tiles returns False. 
+    The assembled frame takes the polygons conversion settings (e.g. iso_bands) of the tiles.
+
+    Parameters
+    ----------
+    compute_2D_data : Callable
+        compute_2D_data function to decorate
+
+    Returns
+    -------
+    Callable
+        Decorated function
+    """
+    @functools.wraps(compute_2D_data)
+    def tiled_compute_2D_data(
+        self: "Geometry2DGrid",
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        u_min: float,
+        u_max: float,
+        v_min: float,
+        v_max: float,
+        w_value: float,
+        q_tasks: mp.Queue,
+        options: Dict[str, Any],
+    ) -> Tuple[Data2D, bool]:
+        if self.tile_size <= 0 or self.tile_cache_size <= 0 or not self.use_tiles(options) or u_max <= u_min or v_max <= v_min:
+            return compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options)
+
+        res_x, res_y = options[SCREEN_RESOLUTION]
+        pixel_ratio = options.get(DEVICE_PIXEL_RATIO, 1.)
+        pixel_size = min((u_max - u_min) / (res_x * pixel_ratio), (v_max - v_min) / (res_y * pixel_ratio))
+        level = int(np.round(np.log2(pixel_size)))
+        spacing = 2. ** level
+        tile_span = self.tile_size * spacing
+
+        tile_options = {**options, SCREEN_RESOLUTION: (self.tile_size, self.tile_size), DEVICE_PIXEL_RATIO: 1.}
+        columns = range(int(np.floor(u_min / tile_span)), int(np.floor(u_max / tile_span)) + 1)
+        rows = range(int(np.floor(v_min / tile_span)), int(np.floor(v_max / tile_span)) + 1)
+
+        def tile_bounds(index: int) -> Tuple[float, float]:
+            #   Coordinates of the first and last points of the tile, the points are centered in their pixel
+            return (index * self.tile_size + 0.5) * spacing, ((index + 1) * self.tile_size - 0.5) * spacing
+
+        cache = self.get_tile_cache()
+        tile_keys = []
+        tile_grids = []
+        tile = None
+        for row in rows:
+            row_grids = []
+            for column in columns:
+                tu_min, tu_max = tile_bounds(column)
+                tv_min, tv_max = tile_bounds(row)
+                key = (level, column, row, self.get_frame_key(u, v, tu_min, tu_max, tv_min, tv_max, w_value, tile_options))
+                tile_keys.append(key)
+
+                tile = cache.get(key)
+                if tile is None:
+                    tile, _ = compute_2D_data(self, u, v, tu_min, tu_max, tv_min, tv_max, w_value, q_tasks, tile_options)
+                    if tile.get_grid().shape != (self.tile_size, self.tile_size):
+                        #   The interface does not follow the requested resolution, the frame can not be assembled from tiles
+                        return compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options)
+                    cache.put(key, tile)
+
+                row_grids.append(tile.get_grid())
+            tile_grids.append(row_grids)
+
+        #   The assembled grid is cropped to the points in the requested frame
+        first_u = int(np.ceil(u_min / spacing - 0.5)) - columns[0] * self.tile_size
+        last_u = max(int(np.floor(u_max / spacing - 0.5)) - columns[0] * self.tile_size, first_u)
+        first_v = int(np.ceil(v_min / spacing - 0.5)) - rows[0] * self.tile_size
+        last_v = max(int(np.floor(v_max / spacing - 0.5)) - rows[0] * self.tile_size, first_v)
+
+        grid = np.block(tile_grids)[first_v:last_v + 1, first_u:last_u + 1]
+        u_values = (columns[0] * self.tile_size + first_u + np.arange(grid.shape[1]) + 0.5) * spacing
+        v_values = (rows[0] * self.tile_size + first_v + np.arange(grid.shape[0]) + 0.5) * spacing
+
+        frame_key = (tile_keys[0], first_u, first_v, grid.shape)
+        updated = frame_key != self.__dict__.get("_last_tiled_frame_key")
+        self._last_tiled_frame_key = frame_key
+
+        #   The conversion settings are the ones the interface gave to the tiles
+        return Data2D.from_grid(
+            grid, u_values, v_values, 
+            simplify=tile.simplify, 
+            polygonizer=tile.polygonizer, 
+            iso_bands=tile.iso_bands, 
+            tile_size=tile.tile_size, 
+            max_workers=tile.max_workers
+        ), updated
+
+    return tiled_compute_2D_data
+
+
 class Geometry2DPolygon(Geometry2D):
     """ Interface parent class for classes that can compute geometry 2D slices and provide a list of polygons.
     """
@@ -238,6 +572,45 @@ class Geometry2DGrid(Geometry2D):
     rasterized: bool = True
     """Boolean telling if the geometry is made by rasterizing a 2D grid (displays the line count in the GUI)."""
 
+    tile_size: int = 256
+    """Number of grid points per side of the tiles computed by a compute_2D_data decorated with cache_tiles"""
+    tile_cache_size: int = 0
+    """Maximum size in bytes of the tiles kept by a compute_2D_data decorated with cache_tiles, the tiles are disabled at 0."""
+
+    def get_tile_cache(self,) -> LRUCache:
+        """Returns the cache of the computed tiles, built on first call
+
+        Returns
+        -------
+        LRUCache
+            Computed tiles cache
+        """
+        if "_tile_cache" not in self.__dict__:
+            self._tile_cache = LRUCache(self.tile_cache_size, lambda data: data.nbytes)
+        return self._tile_cache
+
+    def use_tiles(self, options: Dict[str, Any]) -> bool:
+        """Returns if a compute_2D_data decorated with cache_tiles assembles the frame from tiles, by default when the screen resolution is provided
+
+        Parameters
+        ----------
+        options : Dict[str, Any]
+            Additional options for frame computation.
+
+        Returns
+        -------
+        bool
+            Frame computed from tiles
+        """
+        resolution = options.get(SCREEN_RESOLUTION)
+        return resolution is not None and bool(resolution[0]) and bool(resolution[1])
+
+    def clear_frame_cache(self,):
+        """Empties the computed frames and tiles caches, to call when the geometry changes (e.g. a new file is read)"""
+        super().clear_frame_cache()
+        self.get_tile_cache().clear()
+        self._last_tiled_frame_key = None
+
 
 class ValueAtLocation(GenericInterface):
     """ Interface parent class to implement a function to get values at a specific location.
@@ -1,3 +1,4 @@
+from collections import deque
 from logging import warning
 import os
 from pathlib import Path
@@ -20,8 +21,9 @@ import scivianna
 from scivianna.extension.extension import Extension
 import scivianna.icon
 from scivianna.data.data2d import Data2D
-from scivianna.interface.generic_interface import Geometry2DPolygon, IcocoInterface
-from scivianna.utils.polygonize_tools import PolygonElement, PolygonCoords
+from scivianna.interface.generic_interface import Geometry2DPolygon, IcocoInterface, cache_frames
+from scivianna.utils.lru_cache import LRUCache
+from scivianna.utils.polygonize_tools import PackedPolygons
 from scivianna.enums import GeometryType, VisualizationMode
 
 import medcoupling
@@ -32,10 +34,158 @@ profile_time = bool(os.environ["VIZ_PROFILE"]) if "VIZ_PROFILE" in os.environ el
 if profile_time:
     import time
 
+MED_ID_TYPE = np.int64 if medcoupling.MEDCouplingSizeOfIDs() == 64 else np.int32
+"""Numpy type of the medcoupling cell ids"""
+
 with open(Path(scivianna.icon.__file__).parent / "salome.svg", "r") as f:
     icon_svg = f.read()
 
 
+def mesh_to_polygons(
+    mesh: medcoupling.MEDCouplingUMesh,
+    u: Tuple[float, float, float],
+    v: Tuple[float, float, float],
+) -> PackedPolygons:
+    """Builds a polygon per cell of a 2D unstructured mesh, projected on the (u, v) plane. 
+    The polygons are cut from the mesh nodal connectivity, the polygon cell ids are the mesh cell indexes.
+
+    Parameters
+    ----------
+    mesh : medcoupling.MEDCouplingUMesh
+        2D mesh (with a 2D or 3D space dimension)
+    u : Tuple[float, float, float]
+        Horizontal coordinate director vector
+    v : Tuple[float, float, float]
+        Vertical coordinate director vector
+
+    Returns
+    -------
+    PackedPolygons
+        Polygon of each cell
+    """
+    coords = mesh.getCoords().toNumPyArray().reshape(mesh.getNumberOfNodes(), -1)
+    node_u = coords @ np.asarray(u, dtype=float)[:coords.shape[1]]
+    node_v = coords @ np.asarray(v, dtype=float)[:coords.shape[1]]
+
+    #   Each cell is stored as [geometric type, node ids...] in the connectivity
+    connectivity = mesh.getNodalConnectivity().toNumPyArray()
+    connectivity_index = mesh.getNodalConnectivityIndex().toNumPyArray().astype(np.int64)
+
+    is_node = np.ones(len(connectivity), dtype=bool)
+    is_node[connectivity_index[:-1]] = False
+    node_ids = connectivity[is_node]
+
+    cells_count = len(connectivity_index) - 1
+
+    return PackedPolygons(
+        node_u[node_ids],
+        node_v[node_ids],
+        connectivity_index - np.arange(cells_count + 1),
+        np.arange(cells_count + 1),
+        np.arange(cells_count),
+    )
+
+
+class CellPlaneIndex:
+    """Spatial index of the cells of a 3D mesh, returning the cells whose bounding box is crossed by a plane.
+
+    The cells bounding boxes are read once. For each requested plane normal, the projections of the bounding boxes on the normal are sorted,
+    the cells crossed by a plane are then found by a binary search instead of a scan of the whole mesh.
+    """
+
+    interval_cache_size: int = 256 * 2**20
+    """Maximum size in bytes of the sorted intervals kept for the requested normals"""
+
+    def __init__(self, mesh: medcoupling.MEDCouplingUMesh):
+        """CellPlaneIndex constructor
+
+        Parameters
+        ----------
+        mesh : medcoupling.MEDCouplingUMesh
+            Indexed mesh
+        """
+        self.mesh: medcoupling.MEDCouplingUMesh = mesh
+        """Indexed mesh"""
+
+        bounding_boxes = mesh.getBoundingBoxForBBTree().toNumPyArray().reshape(-1, 3, 2)
+
+        self.centers: np.ndarray = bounding_boxes.mean(axis=2)
+        """Center of each cell bounding box"""
+        self.half_extents: np.ndarray = (bounding_boxes[:, :, 1] - bounding_boxes[:, :, 0]) / 2.
+        """Half size of each cell bounding box along each axis"""
+
+        self.intervals: LRUCache = LRUCache(
+            self.interval_cache_size,
+            lambda intervals: sum(array.nbytes for array in intervals[:3])
+        )
+        """Sorted projected intervals per normal: (sorted lower bounds, upper bounds, cell ids, largest interval length)"""
+
+    def get_intervals(self, normal: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """Returns the cells bounding boxes projected on a unit normal, sorted by lower bound
+
+        Parameters
+        ----------
+        normal : np.ndarray
+            Unit normal
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray, float]
+            Sorted lower bounds, upper bounds, cell ids, largest interval length
+        """
+        key = tuple(np.round(normal, 12))
+        intervals = self.intervals.get(key)
+
+        if intervals is None:
+            centers = self.centers @ normal
+            half_lengths = self.half_extents @ np.abs(normal)
+
+            cell_ids = np.argsort(centers - half_lengths, kind="stable")
+            lower_bounds = (centers - half_lengths)[cell_ids]
+            upper_bounds = (centers + half_lengths)[cell_ids]
+
+            intervals = (lower_bounds, upper_bounds, cell_ids, 2. * half_lengths.max(initial=0.))
+            self.intervals.put(key, intervals)
+
+        return intervals
+
+    def get_cells_crossing_plane(
+        self, 
+        origin: Tuple[float, float, float], 
+        normal: Tuple[float, float, float], 
+        tolerance: float = 0.
+    ) -> np.ndarray:
+        """Returns the ids of the cells whose bounding box is crossed by a plane
+
+        Parameters
+        ----------
+        origin : Tuple[float, float, float]
+            Point of the plane
+        normal : Tuple[float, float, float]
+            Plane normal
+        tolerance : float, optional
+            Distance to the plane under which a bounding box is considered crossed, by default 0.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted cell ids
+        """
+        normal = np.asarray(normal, dtype=float)
+        normal = normal / np.linalg.norm(normal)
+        distance = float(np.dot(origin, normal))
+
+        lower_bounds, upper_bounds, cell_ids, max_length = self.get_intervals(normal)
+
+        #   Only the cells starting less than the largest interval length before the plane can reach it
+        start = np.searchsorted(lower_bounds, distance - tolerance - max_length, side="left")
+        end = np.searchsorted(lower_bounds, distance + tolerance, side="right")
+
+        crossing = upper_bounds[start:end] >= distance - tolerance
+
+        return np.sort(cell_ids[start:end][crossing])
+
+
 class MEDCouplingExtension(Extension):
     """Extension to load files and send them to the slave."""
 
@@ -101,6 +251,25 @@ This extension allows defining the medcoupling field display parameters.
             visible=False,
             width=280
         )
+        self.prefetch_depth_input = pmui.IntInput(
+            label="Prefetched time steps",
+            value=2,
+            start=0,
+            description="Number of time steps of the displayed field read ahead while the slave is idle.",
+            width=280
+        )
+        self.field_cache_input = pmui.IntInput(
+            label="Field cache size (MB)",
+            value=MEDInterface.field_cache_size // 2**20,
+            start=0,
+            description="Memory kept for the read field time steps.",
+            width=280
+        )
+        self.prefetch_switch = pmui.Switch(
+            label="Prefetch neighbouring slices",
+            value=False,
+            description="Computes the next slices along the normal axis while the slave is idle.",
+        )
 
         self.valid = True
 
@@ -129,6 +298,10 @@ This extension allows defining the medcoupling field display parameters.
         return {
             "Iteration": self.iteration_input.value,
             "Order": self.order_input.value,
+            "Field prefetch depth": self.prefetch_depth_input.value,
+            "Field cache size": self.field_cache_input.value,
+            "Prefetch slices": self.prefetch_switch.value,
+            "W step": self.slider_w.step,
         }
 
     def on_field_change(self, field_name: str):
@@ -283,17 +456,17 @@ This extension allows defining the medcoupling field display parameters.
         return pmui.Column(
             self.iteration_input,
             self.order_input,
+            self.prefetch_depth_input,
+            self.field_cache_input,
             pmui.Typography("Coordinate along the normal axis"),
             self.slider_w,
+            self.prefetch_switch,
             margin=0
         )
 
 
 class MEDInterface(Geometry2DPolygon, IcocoInterface):
 
-    polygons: List[PolygonElement]
-    """Polygons computed at the previous iteration"""
-
     file_path: str
     """MEDCoupling .med file path saved to read MedCouplingFields later."""
 
@@ -309,20 +482,34 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
     fields_iterations: Dict[str, List[Tuple[int, int]]]
     """List containing for tuples storing the field name, and the associated iteration."""
 
-    fields: Dict[str, np.ndarray]
-    """Dictionnary containing the list of per cell value for each read field."""
+    fields: LRUCache
+    """Per cell values of the read fields, with their components names, per (field name, iteration, order)."""
+
+    med_fields: medcoupling.MEDFileFields
+    """Fields structure of the read file, the arrays are read on demand."""
+
+    med_file_mesh: medcoupling.MEDFileMesh
+    """Mesh structure of the read file, used to read the fields on the mesh cells."""
 
     field_doubles: Dict[str, medcoupling.MEDCouplingFieldDouble]
     """Dictionnary containing the received MEDCouplingFieldDouble."""
 
-    cell_dict: Dict[int, int]
-    """Dictionnary associating the 2D mesh cells to the 3D mesh cells"""
-
     """ Support mesh
     """
     geometry_type: GeometryType = GeometryType._3D_INFINITE
     extensions = [MEDCouplingExtension, SaveLoadExtension]
 
+    frame_cache_size: int = 256 * 2**20
+    """Maximum size in bytes of the cached slices"""
+    frame_cache_bounds: bool = False
+    """The slice of the mesh does not depend on the displayed bounds"""
+    frame_cache_options: List[str] = []
+    """The slice of the mesh does not depend on the field options"""
+    slice_prefetch_count: int = 4
+    """Number of slices precomputed in the scrolling direction when the "Prefetch slices" option is enabled"""
+    field_cache_size: int = 1024 * 2**20
+    """Maximum size in bytes of the field arrays kept in memory"""
+
     def __init__(self):
         """MEDCoupling interface constructor."""
         self.data: Data2D = None
@@ -335,16 +522,30 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
         """Currently loaded mesh"""
         self.fieldnames = []
         """List of fields in the current mesh"""
-        self.fields = {}
-        """List of fields data"""
+        self.fields = LRUCache(self.field_cache_size, lambda field: field[0].nbytes)
+        """Per cell values of the read fields, with their components names, per (field name, iteration, order)"""
+        self.med_fields = None
+        """Fields structure of the read file, the arrays are read on demand"""
+        self.med_file_mesh = None
+        """Mesh structure of the read file, used to read the fields on the mesh cells"""
         self.field_doubles = {}
         """Dictionnary containing the received MEDCouplingFieldDouble."""
         self.fields_iterations = {}
         """Dictionnary containing the med file available (iter, order) couples"""
-        self.cell_dict = {}
-        """Dictionnary associating the 2D mesh cells to the 3D mesh cells"""
         self.last_computed_frame = []
         """Parameters of the last computed frame"""
+        self.cell_plane_index: CellPlaneIndex = None
+        """Spatial index of the 3D mesh cells, built on the first slice of a mesh"""
+        self.prefetch_request: Tuple = None
+        """Frame request around which the slices are being prefetched"""
+        self.prefetch_w_values: List[float] = []
+        """w values of the slices remaining to prefetch"""
+        self.time_step_requests: deque = deque(maxlen=2)
+        """Last displayed (field name, iteration, order, prefetch depth), most recent last"""
+        self.time_step_prefetch_request: Tuple[str, int, int, int] = None
+        """Displayed time step around which the time steps are being prefetched"""
+        self.prefetch_time_steps: List[Tuple[int, int]] = []
+        """(iteration, order) couples remaining to prefetch"""
 
     def read_file(self, file_path: str, file_label: str):
         """Read a file and store its content in the interface
@@ -382,22 +583,30 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
                 )
 
                 for component in components:
-                    for iteration in iterations:
-                        self.fields_iterations[
-                            (
-                                "@".join([field, component[0]])
-                                if component[0] != ""
-                                else field
-                            )
-                        ] = [tuple(iteration)]
-
-            self.mesh = medcoupling.ReadMeshFromFile(file_path, 0)
+                    self.fields_iterations[
+                        (
+                            "@".join([field, component[0]])
+                            if component[0] != ""
+                            else field
+                        )
+                    ] = [tuple(iteration) for iteration in iterations]
+
+            #   The fields structure is read once, their arrays are read when displayed
+            self.med_file_mesh = medcoupling.MEDFileMesh.New(file_path, self.meshnames[0])
+            self.med_fields = medcoupling.MEDFileFields(file_path, False)
+            self.fields.clear()
+
+            self.mesh = self.med_file_mesh.getMeshAtLevel(0)
+            self.data = None
+            self.cell_plane_index = None
+            self.clear_frame_cache()
 
             if profile_time:
                 print(f"File reading time {time.time() - start_time}")
         else:
             raise ValueError(f"File label '{file_label}' not implemented")
 
+    @cache_frames
     def compute_2D_data(
         self,
         u: Tuple[float, float, float],
@@ -436,7 +645,7 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
         Returns
         -------
         Data2D
-            Geometry to display
+            Geometry to display, the cell ids are the ids of the cut 3D mesh cells
         bool
             Were the polygons updated compared to the past call
         """
@@ -446,16 +655,69 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
             print("Skipping polygon computation.")
             return self.data, False
 
+        self.last_computed_frame = [*u, *v, w_value]
+        self.data = self.compute_slice(u, v, u_min, v_min, w_value)
+        return self.data, True
+
+    def restore_cached_frame(
+        self,
+        data: Data2D,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        w_value: float,
+    ):
+        """Keeps the cached frame as the last computed frame, so it is the one saved
+
+        Parameters
+        ----------
+        data : Data2D
+            Cached frame, not to be modified
+        u : Tuple[float, float, float]
+            Horizontal coordinate director vector
+        v : Tuple[float, float, float]
+            Vertical coordinate director vector
+        w_value : float
+            Value along the u ^ v axis
+        """
+        self.data = data
+        self.last_computed_frame = [*u, *v, w_value]
+
+    def compute_slice(
+        self,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        u_min: float,
+        v_min: float,
+        w_value: float,
+    ) -> Data2D:
+        """Cuts the mesh by the plane normal to u ^ v at w_value, and returns the cut cells polygons projected on (u, v)
+
+        Parameters
+        ----------
+        u : Tuple[float, float, float]
+            Horizontal coordinate director vector
+        v : Tuple[float, float, float]
+            Vertical coordinate director vector
+        u_min : float
+            Lower bound value along the u axis
+        v_min : float
+            Lower bound value along the v axis
+        w_value : float
+            Value along the u ^ v axis
+
+        Returns
+        -------
+        Data2D
+            Slice polygons, the cell ids are the ids of the cut 3D mesh cells
+        """
         if profile_time:
             start_time = time.time()
 
         mesh_dimension = self.mesh.getMeshDimension()
 
-        use_cell_id = True
-
         if mesh_dimension == 2:
             mesh: medcoupling.MEDCouplingUMesh = self.mesh
-            cell_ids = list(range(mesh.getNumberOfCells()))
+            cell_ids = np.arange(mesh.getNumberOfCells())
         elif mesh_dimension == 3:
             vec = [float(e) for e in np.cross(u, v)]
 
@@ -466,29 +728,24 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
 
             origin = [u_min * u[i] + v_min * v[i] + w_value * vec[i] for i in range(3)]
 
-            try:
-                eps = 0.0
-                mesh: medcoupling.MEDCouplingUMesh = self.mesh.buildSlice3D(
-                    origin, vec, eps
-                )[0]
+            #   Only the cells whose bounding box is crossed by the plane are given to medcoupling
+            candidates = self.get_cell_plane_index().get_cells_crossing_plane(origin, vec, 1e-7)
 
-                cells_ids = self.mesh.getCellIdsCrossingPlane(origin, vec, eps)
-
-                cell_ids = [int(c) for c in cells_ids]
-
-            except Exception:
-                eps = 1e-7
-
-                mesh: medcoupling.MEDCouplingUMesh = self.mesh.buildSlice3D(
-                    origin, vec, eps
-                )[0]
+            if len(candidates) == 0:
+                mesh = None
+                cell_ids = np.zeros(0, dtype=np.int64)
+            else:
+                part: medcoupling.MEDCouplingUMesh = self.mesh.buildPartOfMySelf(
+                    medcoupling.DataArrayInt(candidates.astype(MED_ID_TYPE)), False
+                )
 
-                cell_ids = [
-                    int(c) for c in self.mesh.getCellIdsCrossingPlane(origin, vec, eps)
-                ]
+                #   buildSlice3D also returns the candidate cut by each 2D cell
+                try:
+                    mesh, cells_ids = part.buildSlice3D(origin, vec, 0.0)
+                except Exception:
+                    mesh, cells_ids = part.buildSlice3D(origin, vec, 1e-7)
 
-            if len(cell_ids) != mesh.getNumberOfCells():
-                use_cell_id = False
+                cell_ids = candidates[cells_ids.toNumPyArray()]
         else:
             raise ValueError(
                 f"Mesh dimension is {mesh_dimension}, should be either 2 or 3 to be displayed."
@@ -498,54 +755,160 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
             print(f"Compute mesh time {time.time() - start_time}")
             start_time = time.time()
 
-        cells_count = mesh.getNumberOfCells()
+        polygons = PackedPolygons.empty() if mesh is None else mesh_to_polygons(mesh, u, v)
+        polygons.cell_ids = cell_ids
 
-        self.data = []
+        if profile_time:
+            print(f"Building polygons time: {time.time() - start_time}")
 
-        vertices_coords = [list(c) for c in mesh.getCoords()]
-        self.cell_dict.clear()
+        return Data2D.from_polygon_list(polygons)
 
-        for cell in range(cells_count):
-            x_vals = [
-                vertices_coords[cell_id][0] for cell_id in mesh.getNodeIdsOfCell(cell)
-            ]
-            y_vals = [
-                vertices_coords[cell_id][1] for cell_id in mesh.getNodeIdsOfCell(cell)
-            ]
-            z_vals = [
-                vertices_coords[cell_id][2] if mesh_dimension == 3 else 0.0
-                for cell_id in mesh.getNodeIdsOfCell(cell)
-            ]
+    def get_prefetch_w_values(self,) -> List[float]:
+        """Returns the w values of the slices to precompute after the last requested frame. 
+        The slices follow the direction and step of the last two requests if they share the same axes, the "W step" option otherwise.
 
-            coords = np.array([x_vals, y_vals, z_vals])
+        Returns
+        -------
+        List[float]
+            w values, in computation order
+        """
+        requests = self.get_frame_requests()
+        u, v, _, _, _, _, w_value, options = requests[-1]
 
-            u_vals = np.matmul(coords.T, u)
-            v_vals = np.matmul(coords.T, v)
+        step = options.get("W step", 0.)
+        if len(requests) > 1:
+            previous_u, previous_v, _, _, _, _, previous_w_value, _ = requests[-2]
+            if np.allclose(u, previous_u) and np.allclose(v, previous_v) and previous_w_value != w_value:
+                step = w_value - previous_w_value
 
-            self.data.append(
-                PolygonElement(
-                    exterior_polygon=PolygonCoords(x_coords=u_vals, y_coords=v_vals),
-                    holes=[],
-                    cell_id=str(cell),
-                )
-            )
+        if step == 0. or w_value is None:
+            return []
 
-            if not use_cell_id:
-                self.cell_dict[cell] = self.mesh.getCellContainingPoint(
-                    [np.mean(x_vals), np.mean(y_vals), np.mean(z_vals)], eps=0.0
-                )
+        #   Range of w covered by the mesh bounding box
+        vec = np.cross(u, v)
+        corners = np.array(np.meshgrid(*self.mesh.getBoundingBox(), indexing="ij")).reshape(3, -1).T
+        w_range = corners @ vec / np.dot(vec, vec)
 
-        if use_cell_id:
-            self.cell_dict = dict(zip(list(range(cells_count)), cell_ids))
+        #   Next slices in the scrolling direction, then the previous one
+        w_values = [w_value + k * step for k in range(1, self.slice_prefetch_count + 1)] + [w_value - step]
 
-        if profile_time:
-            print(
-                f"Gathering cells id time: {time.time() - start_time} using cell id {use_cell_id}"
-            )
+        return [w for w in w_values if w_range.min() <= w <= w_range.max()]
 
-        self.last_computed_frame = [*u, *v, w_value]
-        self.data = Data2D.from_polygon_list(self.data)
-        return self.data, True
+    def idle_task(self) -> bool:
+        """Reads one of the time steps neighbouring the last displayed one, or computes one of the slices neighbouring the last requested frame.
+
+        Returns
+        -------
+        bool
+            Whether time steps or slices remain to prefetch
+        """
+        return self.prefetch_time_step() or self.prefetch_slice()
+
+    def get_prefetch_time_steps(self,) -> List[Tuple[int, int]]:
+        """Returns the (iteration, order) couples of the displayed field to read after the last displayed one.
+        The time steps follow the direction and stride of the last two displayed time steps of the field, the next time steps otherwise.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            (iteration, order) couples, in reading order
+        """
+        field_name, iteration, order, depth = self.time_step_requests[-1]
+
+        time_steps = sorted(tuple(time_step) for time_step in self.get_med_fields()[field_name].getIterations())
+        if (iteration, order) not in time_steps:
+            return []
+        index = time_steps.index((iteration, order))
+
+        stride = 1
+        if len(self.time_step_requests) > 1:
+            previous_field_name, previous_iteration, previous_order, _ = self.time_step_requests[-2]
+            if previous_field_name == field_name and (previous_iteration, previous_order) in time_steps:
+                previous_index = time_steps.index((previous_iteration, previous_order))
+                if previous_index != index:
+                    stride = index - previous_index
+
+        #   Next time steps in the stepping direction, then the previous one
+        indexes = [index + k * stride for k in range(1, depth + 1)] + ([index - stride] if depth > 0 else [])
+
+        return [time_steps[i] for i in indexes if 0 <= i < len(time_steps)]
+
+    def prefetch_time_step(self) -> bool:
+        """Reads in the fields cache one of the time steps neighbouring the last displayed one, according to the "Field prefetch depth" option.
+
+        Returns
+        -------
+        bool
+            Whether time steps remain to prefetch
+        """
+        if len(self.time_step_requests) == 0:
+            return False
+
+        if self.time_step_prefetch_request is not self.time_step_requests[-1]:
+            self.time_step_prefetch_request = self.time_step_requests[-1]
+            self.prefetch_time_steps = self.get_prefetch_time_steps()
+
+        field_name = self.time_step_prefetch_request[0]
+
+        while len(self.prefetch_time_steps) > 0:
+            iteration, order = self.prefetch_time_steps.pop(0)
+
+            if (field_name, iteration, order) not in self.fields:
+                self.read_field(field_name, iteration, order)
+                break
+
+        return len(self.prefetch_time_steps) > 0
+
+    def prefetch_slice(self) -> bool:
+        """Computes one of the slices neighbouring the last requested frame if the "Prefetch slices" option is enabled, and stores it in the frames cache.
+
+        Returns
+        -------
+        bool
+            Whether slices remain to prefetch
+        """
+        if self.frame_cache_size <= 0 or self.mesh is None or self.mesh.getMeshDimension() != 3:
+            return False
+
+        requests = self.get_frame_requests()
+        if len(requests) == 0 or not requests[-1][-1].get("Prefetch slices", False):
+            return False
+
+        if self.prefetch_request is not requests[-1]:
+            self.prefetch_request = requests[-1]
+            self.prefetch_w_values = self.get_prefetch_w_values()
+
+        u, v, u_min, u_max, v_min, v_max, _, options = self.prefetch_request
+        cache = self.get_frame_cache()
+
+        while len(self.prefetch_w_values) > 0:
+            w_value = self.prefetch_w_values.pop(0)
+            key = self.get_frame_key(u, v, u_min, u_max, v_min, v_max, w_value, options)
+
+            if key not in cache:
+                cache.put(key, self.compute_slice(u, v, u_min, v_min, w_value))
+                break
+
+        return len(self.prefetch_w_values) > 0
+
+    def get_cell_plane_index(self,) -> CellPlaneIndex:
+        """Returns the spatial index of the current mesh cells, built if the mesh changed since the last call
+
+        Returns
+        -------
+        CellPlaneIndex
+            Mesh cells index
+        """
+        if self.cell_plane_index is None or self.cell_plane_index.mesh is not self.mesh:
+            if profile_time:
+                start_time = time.time()
+
+            self.cell_plane_index = CellPlaneIndex(self.mesh)
+
+            if profile_time:
+                print(f"Cell index building time: {time.time() - start_time}")
+
+        return self.cell_plane_index
 
     def get_labels(
         self,
@@ -582,7 +945,7 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
         if profile_time:
             start_time = time.time()
         if value_label == MESH:
-            return {str(v): np.nan for v in cells}
+            return {v: np.nan for v in cells}
 
         if "Iteration" not in options:
             print(f"Iteration not found in medcoupling option, setting {self.fields_iterations[value_label][0][0]}")
@@ -593,46 +956,24 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
 
         field_np_array = None
 
-        if value_label in self.fields:
-            field_np_array = self.fields[value_label]
-        elif value_label in self.field_doubles:
+        if value_label in self.field_doubles:
             field_np_array = self.field_doubles[value_label].getArray().toNumPyArray()
-        else:
-            print(f"Reading MEDCouplingFieldDouble in {self.file_path}")
-            # print("Checking", value_label, "in", self.fields_iterations, field in self.fields_iterations.keys())
-
-            if value_label in self.fields_iterations:
-                # if "Iteration" in options and "Order" in options and (options["Iteration"], options["Order"]) in self.fields_iterations[value_label]:
-                if True:
-                    field_name = value_label.split("@")[0]
-                    field: medcoupling.MEDCouplingFieldDouble = medcoupling.ReadField(
-                        medcoupling.ON_CELLS,
-                        self.file_path,
-                        self.meshnames[0],
-                        0,
-                        field_name,
-                        options["Iteration"],
-                        options["Order"],
-                    )
-                    field_array: medcoupling.DataArrayDouble = field.getArray()
-                    field_np_array: np.ndarray = field_array.toNumPyArray()
-
-                    if "@" in value_label:
-                        components: List[str] = field_array.getInfoOnComponents()
-                        field_np_array = field_np_array[
-                            :, components.index(value_label.split("@")[1])
-                        ]
-                    else:
-                        field_np_array = field_np_array
-
-            if field_np_array is not None:
-                self.fields[value_label] = field_np_array
+        elif value_label in self.fields_iterations:
+            field_name, _, component = value_label.partition("@")
+
+            if "Field cache size" in options:
+                self.fields.resize(int(options["Field cache size"] * 2**20))
+            self.time_step_requests.append(
+                (field_name, options["Iteration"], options["Order"], options.get("Field prefetch depth", 0))
+            )
+
+            field_array, components = self.read_field(field_name, options["Iteration"], options["Order"])
+            field_np_array = field_array[:, components.index(component)]
 
         if field_np_array is not None:
-            indexes = np.array(list(self.cell_dict.values())).astype(int)
-            values = field_np_array[indexes[np.array(cells).astype(int)].tolist()]
+            values = field_np_array[np.asarray(cells).astype(int)]
 
-            value_dict = dict(zip(np.array(cells).astype(str), values))
+            value_dict = dict(zip(cells, values.tolist()))
 
             if profile_time:
                 print(f"Get value dict time: {time.time() - start_time}")
@@ -642,6 +983,65 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
             f"The field {value_label} is not implemented, fields available : {self.get_labels()}"
         )
 
+    def get_med_fields(self,) -> medcoupling.MEDFileFields:
+        """Returns the fields structure of the read file, opened if the interface was loaded from a save file
+
+        Returns
+        -------
+        medcoupling.MEDFileFields
+            Fields structure
+        """
+        if self.med_fields is None:
+            self.med_file_mesh = medcoupling.MEDFileMesh.New(self.file_path, self.meshnames[0])
+            self.med_fields = medcoupling.MEDFileFields(self.file_path, False)
+
+        return self.med_fields
+
+    def read_field(self, field_name: str, iteration: int, order: int) -> Tuple[np.ndarray, List[str]]:
+        """Returns the per cell values of all the components of a field time step. 
+        The values are read from the file on the first request, and kept in cache within the field_cache_size budget.
+
+        Parameters
+        ----------
+        field_name : str
+            Field name in the .med file
+        iteration : int
+            Time step iteration
+        order : int
+            Time step order
+
+        Returns
+        -------
+        np.ndarray
+            Values array of shape (cells count, components count)
+        List[str]
+            Components names
+        """
+        key = (field_name, iteration, order)
+        field = self.fields.get(key)
+
+        if field is None:
+            if profile_time:
+                start_time = time.time()
+
+            time_step: medcoupling.MEDFileField1TS = self.get_med_fields()[field_name][iteration, order]
+            time_step.loadArraysIfNecessary()
+            field_array: medcoupling.DataArrayDouble = time_step.getFieldOnMeshAtLevel(
+                medcoupling.ON_CELLS, 0, self.med_file_mesh
+            ).getArray()
+            time_step.unloadArrays()
+
+            field = (
+                field_array.toNumPyArray().reshape(field_array.getNumberOfTuples(), field_array.getNumberOfComponents()),
+                [medcoupling.DataArray.GetVarNameFromInfo(info) for info in field_array.getInfoOnComponents()],
+            )
+            self.fields.put(key, field)
+
+            if profile_time:
+                print(f"Field reading time: {time.time() - start_time}")
+
+        return field
+
     def get_label_coloring_mode(self, label: str) -> VisualizationMode:
         """Returns wheter the given field is colored based on a string value or a float.
 
@@ -691,9 +1091,6 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
     def setInputMEDDoubleField(
         self, field_name: str, field: medcoupling.MEDCouplingFieldDouble
     ):
-        if field_name in self.fields:
-            del self.fields[field_name]
-
         self.field_doubles[field_name] = field
 
     def setTime(self, time_: float):
@@ -747,10 +1144,11 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
                     self.meshnames,
                     self.mesh,
                     self.fieldnames,
-                    self.fields,
+                    dict(self.fields.items()),
                     self.field_doubles,
                     self.fields_iterations,
-                    self.cell_dict,
+                    #   Former 2D to 3D cell ids map, the cell ids are now the 3D cell ids
+                    None,
                     self.last_computed_frame
                 )
             else:
@@ -762,7 +1160,8 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
                     "MEDInterface",
                     self.last_computed_frame,
                     self.data,
-                    self.cell_dict
+                    #   Former 2D to 3D cell ids map, the cell ids are now the 3D cell ids
+                    None
                 )
 
             pickle.dump(data, f)
@@ -807,20 +1206,38 @@ class MEDInterface(Geometry2DPolygon, IcocoInterface):
                     self.meshnames,
                     self.mesh,
                     self.fieldnames,
-                    self.fields,
+                    fields,
                     self.field_doubles,
                     self.fields_iterations,
-                    self.cell_dict,
+                    cell_dict,
                     self.last_computed_frame
                 ) = data[5:]
 
+                self.med_fields = None
+                self.med_file_mesh = None
+                self.fields.clear()
+                for key, field in fields.items():
+                    #   Files saved by older versions store the arrays per label, without their iteration
+                    if isinstance(key, tuple):
+                        self.fields.put(key, field)
+
             else:
                 (
                     self.last_computed_frame,
                     self.data,
-                    self.cell_dict
+                    cell_dict
                 ) = data[5:]
 
+            if cell_dict is not None and self.data is not None:
+                #   Files saved by older versions use the 2D cell indexes as cell ids
+                if isinstance(cell_dict, dict):
+                    cell_dict = list(cell_dict.values())
+                polygons = self.data.packed_polygons
+                polygons.cell_ids = np.asarray(cell_dict, dtype=np.int64)[polygons.cell_ids.astype(int)]
+                self.data = Data2D.from_polygon_list(polygons)
+
+            self.clear_frame_cache()
+
 
 if __name__ == "__main__":
     from scivianna.notebook_tools import _show_panel
@@ -7,7 +7,7 @@ import numpy as np
 import multiprocessing as mp
 
 from scivianna.data.data2d import Data2D
-from scivianna.interface.generic_interface import Geometry2DPolygon
+from scivianna.interface.generic_interface import Geometry2DPolygon, cache_frames
 from scivianna.utils.polygonize_tools import PolygonElement
 from scivianna.enums import GeometryType, VisualizationMode
 from scivianna.utils.structured_mesh import CarthesianStructuredMesh, StructuredMesh
@@ -23,18 +23,34 @@ class StructuredMeshInterface(Geometry2DPolygon):
     data: Data2D
     """Data computed at the previous iteration"""
 
-    mesh: StructuredMesh
-    """Mesh read from the .med file."""
-
     fields: Dict[str, np.ndarray]
     """Dictionnary containing the list of per cell value for each read field."""
 
     geometry_type = GeometryType._3D_INFINITE
 
+    frame_cache_size: int = 256 * 2**20
+    """Maximum size in bytes of the cached slices"""
+    frame_cache_bounds: bool = False
+    """The slice of the mesh does not depend on the displayed bounds"""
+    frame_cache_options: List[str] = []
+    """The slice of the mesh does not depend on the field options"""
+
     def __init__(self, ):
         """StructuredMesh interface constructor."""
         self.data: Data2D = []
         self.last_computed_frame = []
+        self._mesh: StructuredMesh = None
+
+    @property
+    def mesh(self) -> StructuredMesh:
+        """Mesh read from the .med file."""
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, value: StructuredMesh):
+        #   The cached slices belong to the previous mesh
+        self._mesh = value
+        self.clear_frame_cache()
 
     def read_file(self, file_path: str, file_label: str):
         """Read a file and store its content in the interface
@@ -48,6 +64,7 @@ class StructuredMeshInterface(Geometry2DPolygon):
         """
         raise NotImplementedError()
 
+    @cache_frames
     def compute_2D_data(
         self,
         u: Tuple[float, float, float],
@@ -107,6 +124,29 @@ class StructuredMeshInterface(Geometry2DPolygon):
 
         return self.data, True
 
+    def restore_cached_frame(
+        self,
+        data: Data2D,
+        u: Tuple[float, float, float],
+        v: Tuple[float, float, float],
+        w_value: float,
+    ):
+        """Keeps the cached frame as the last computed frame, so it is the one saved
+
+        Parameters
+        ----------
+        data : Data2D
+            Cached frame, not to be modified
+        u : Tuple[float, float, float]
+            Horizontal coordinate director vector
+        v : Tuple[float, float, float]
+            Vertical coordinate director vector
+        w_value : float
+            Value along the u ^ v axis
+        """
+        self.data = data
+        self.last_computed_frame = [*u, *v, w_value]
+
     def get_labels(
         self,
     ) -> List[str]:
@@ -1,3 +1,4 @@
+import functools
 from logging import warning
 from typing import Callable, List, Tuple, Type
 import numpy as np
@@ -25,17 +26,19 @@ except ValueError as e:
     print(f"Warning : Agent not loaded, received error : {e}")
 
 
-from scivianna.data.data2d import Data2D
-from scivianna.interface.generic_interface import Geometry2D
+from scivianna.data.data2d import Data2D, DataType
+from scivianna.interface.generic_interface import Geometry2D, Geometry2DGrid
 
 from scivianna.enums import UpdateEvent, VisualizationMode
 from scivianna.slave import ComputeSlave
 
 from scivianna.utils.polygon_sorter import PolygonSorter
+from scivianna.utils.polygonize_tools import PackedPolygons, simplify_to_tolerance
 from scivianna.plotter_2d.polygon.bokeh import Bokeh2DPolygonPlotter
 from scivianna.plotter_2d.grid.bokeh import Bokeh2DGridPlotter
+from scivianna.plotter_2d.hybrid.bokeh import Bokeh2DHybridPlotter
 from scivianna.plotter_2d.generic_plotter import Plotter2D
-from scivianna.constants import MESH, X, Y
+from scivianna.constants import MESH, X, Y, SCREEN_RESOLUTION, DEVICE_PIXEL_RATIO
 
 profile_time = bool(os.environ["VIZ_PROFILE"]) if "VIZ_PROFILE" in os.environ else 0
 if profile_time:
@@ -58,13 +61,24 @@ class Panel2D(VisualizationPanel):
     """ Displayed data and their properties.
     """
     colormap = param.String()
+    culling_margin: float = 0.5
+    """Margin around the visible range in which polygons are sent to the plotter, in fraction of the visible range size. None sends all polygons"""
+    lod_pixels: float = 1.
+    """Simplification tolerance of the displayed polygons, in screen pixels. None sends the full detail polygons"""
+    lod_merge: bool = False
+    """Merge the touching polygons smaller than a screen pixel that share a value when simplifying the displayed polygons"""
+    raster_cell_threshold: int = 20000
+    """Visible polygons count above which the hybrid display sends the polygons rasterized at the screen resolution"""
 
     def __init__(
         self,
         slave: ComputeSlave,
         name="",
         display_polygons: bool = True,
-        extensions: List[Extension] = default_extensions
+        extensions: List[Extension] = default_extensions,
+        client_side_colors: bool = False,
+        packed_geometry: bool = False,
+        hybrid_display: bool = False,
     ):
         """Visualization panel constructor
 
@@ -76,6 +90,14 @@ class Panel2D(VisualizationPanel):
             Name of the panel.
         display_polygons : bool
             Display as polygons or as a 2D grid.
+        extensions : List[Extension]
+            Extensions displayed in the panel.
+        client_side_colors : bool
+            The polygons of the fields colored from their values are colored in the browser from the cell values.
+        packed_geometry : bool
+            The polygons are sent to the browser as flat binary buffers.
+        hybrid_display : bool
+            The polygons are rasterized on the server and displayed as an image while more than raster_cell_threshold of them are visible.
         """
         code_interface: Type[Geometry2D] = slave.code_interface
         assert issubclass(
@@ -88,17 +110,39 @@ class Panel2D(VisualizationPanel):
         self.update_polygons = False
         """Need to update the data at the next async call"""
         self.display_polygons = display_polygons
+        self.client_side_colors = client_side_colors
+        self.packed_geometry = packed_geometry
+        self.hybrid_display = hybrid_display
 
         self.polygon_sorter = PolygonSorter()
 
+        self.viewport: Tuple[Tuple[float, float], Tuple[float, float]] = None
+        """Horizontal and vertical ranges displayed by the figure, None until the figure reports them"""
+        self.culled_range: Tuple[Tuple[float, float], Tuple[float, float]] = None
+        """Ranges in which the polygons sent to the plotter were selected, None if all polygons were sent"""
+        self.displayed_indexes: np.ndarray = None
+        """Indexes in current_data of the polygons sent to the plotter, None if all polygons were sent"""
+        self.lod_tolerance: float = None
+        """Tolerance of the displayed simplified polygons, None if the full detail polygons are displayed"""
+        self.lod_polygons: PackedPolygons = None
+        """Displayed simplified polygons"""
+        self.lod_indexes: np.ndarray = None
+        """Index in the culled data of the polygon each simplified polygon comes from"""
+        self.lod_values: np.ndarray = None
+        """Cell values from which the simplified polygons were merged"""
+        self.rasterized_range: Tuple[Tuple[float, float], Tuple[float, float]] = None
+        """Ranges covered by the displayed rasterized polygons, None if the polygons are displayed"""
+
         self.field_change_callback: Callable = None
         """Function to call when the field is changed"""
 
         #
         #   Plotter creation
         #
-        if self.display_polygons:
-            self.plotter = Bokeh2DPolygonPlotter()
+        if self.display_polygons and hybrid_display:
+            self.plotter = Bokeh2DHybridPlotter(client_side_colors, packed_geometry)
+        elif self.display_polygons:
+            self.plotter = Bokeh2DPolygonPlotter(client_side_colors, packed_geometry)
         else:
             self.plotter = Bokeh2DGridPlotter()
 
@@ -119,9 +163,14 @@ class Panel2D(VisualizationPanel):
             extension.on_field_change(MESH)
 
         self.colormap = "BuRd"
+        self.current_data = None
 
         data_ = self.compute_fn(self.u, self.v, self.u_range[0], self.v_range[0], self.u_range[1], self.v_range[1], self.w_value)
 
+        if self.display_polygons:
+            #   Only the polygons rasterized by the panel are displayed as an image by the hybrid plotter
+            data_.convert_to_polygons()
+
         self.plotter.set_axes(self.u, self.v, self.w_value)
         self.plotter.plot_2d_frame(data_)
 
@@ -130,13 +179,7 @@ class Panel2D(VisualizationPanel):
         if (
             slave.get_label_coloring_mode(self.displayed_field) == VisualizationMode.FROM_VALUE
         ):
-            self.plotter.update_colorbar(
-                True,
-                (
-                    min([float(e) for e in data_.cell_values]),
-                    max([float(e) for e in data_.cell_values]),
-                ),
-            )
+            self.plotter.update_colorbar(True, self.get_color_range(data_))
         else:
             self.plotter.update_colorbar(False, (None, None))
 
@@ -171,11 +214,7 @@ class Panel2D(VisualizationPanel):
                 self.plotter.set_color_map(self.colormap)
             if "data" in self.__new_data:
                 self.current_data: Data2D = self.__new_data["data"]
-
-                if not self.update_polygons:
-                    self.plotter.update_colors(self.current_data)
-                else:
-                    self.plotter.update_2d_frame(self.current_data)
+                self.display(not self.update_polygons)
 
             self.__data_to_update = False
 
@@ -185,6 +224,10 @@ class Panel2D(VisualizationPanel):
             if profile_time:
                 print(f"Async function : {time.time() - st}")
 
+        elif "x0" in self.__new_data and not self.marked_to_recompute and self.needs_display_update():
+            #   Panning out of the culled range adds back the culled polygons, and zooming changes their simplification, without recomputing the frame
+            self.display(True)
+
         if "field_name" in self.__new_data:
             if self.marked_to_recompute:
                 self.marked_to_recompute = False
@@ -236,6 +279,13 @@ class Panel2D(VisualizationPanel):
             e.provide_options() for e in self.extensions
         ] for key, value in options.items()}
 
+        if issubclass(self.slave.code_interface, Geometry2DGrid):
+            #   The grid interfaces can compute one grid point per device pixel
+            res_x, res_y = self.plotter.get_resolution()
+            if res_x and res_y:
+                options[SCREEN_RESOLUTION] = (int(res_x), int(res_y))
+                options[DEVICE_PIXEL_RATIO] = self.plotter.get_device_pixel_ratio()
+
         computed_data = self.slave.compute_2D_data(
             u,
             v,
@@ -257,6 +307,10 @@ class Panel2D(VisualizationPanel):
 
         computed_data, polygons_updated = computed_data
 
+        if self.display_polygons and polygons_updated and self.current_data is not None:
+            #   Only the grid blocks that changed since the displayed frame are polygonized again
+            computed_data.convert_to_polygons(previous=self.current_data)
+
         for extension in self.extensions:
             extension.on_updated_data(computed_data)
 
@@ -269,6 +323,234 @@ class Panel2D(VisualizationPanel):
 
         return computed_data
 
+    def display(self, same_polygons: bool):
+        """Sends current_data to the plotter: rasterized over the viewport if more than raster_cell_threshold polygons are visible in the hybrid display, 
+        else its polygons culled to the viewport and simplified to the screen resolution
+
+        Parameters
+        ----------
+        same_polygons : bool
+            The polygons of current_data are the previously displayed ones, only the colors are updated if they are displayed the same way
+        """
+        previous_range = self.rasterized_range
+        previous_indexes = self.displayed_indexes
+
+        if self.display_polygons:
+            self.current_data.convert_to_polygons()
+
+        if self.needs_rasterization(self.current_data):
+            displayed_data = self.rasterize(self.current_data)
+            same_polygons = same_polygons and previous_range == self.rasterized_range
+        else:
+            self.rasterized_range = None
+            displayed_data = self.cull(self.current_data)
+            same_polygons = same_polygons and previous_range is None and (
+                (previous_indexes is None and self.displayed_indexes is None) or (
+                    previous_indexes is not None and self.displayed_indexes is not None and np.array_equal(previous_indexes, self.displayed_indexes)
+                )
+            )
+            displayed_data, same_polygons = self.level_of_detail(displayed_data, same_polygons)
+
+        if same_polygons:
+            self.plotter.update_colors(displayed_data)
+        else:
+            self.plotter.update_2d_frame(displayed_data)
+
+    def get_color_range(self, data: Data2D) -> Tuple[float, float]:
+        """Returns the values range displayed by the color bar: the range in which the cell colors were computed, else the values range
+
+        Parameters
+        ----------
+        data : Data2D
+            Displayed data
+
+        Returns
+        -------
+        Tuple[float, float]
+            Color bar range
+        """
+        if data.color_range is not None:
+            return data.color_range
+
+        return (
+            np.nanmin(data.cell_values.astype(float)),
+            np.nanmax(data.cell_values.astype(float)),
+        )
+
+    def needs_display_update(self) -> bool:
+        """Returns if the polygons sent to the plotter must be selected again: the viewport left the culled range, 
+        polygons out of the viewport margin were sent, the zoom changed the simplification tolerance, 
+        or the rasterized polygons no longer cover the viewport
+
+        Returns
+        -------
+        bool
+            Polygons to select again
+        """
+        if self.viewport is None or self.current_data is None or not self.display_polygons:
+            return False
+        if self.current_data.data_type != DataType.POLYGONS:
+            return False
+
+        if self.needs_rasterization(self.current_data):
+            return self.rasterized_range != self.viewport
+        if self.rasterized_range is not None:
+            return True
+
+        if self.culling_margin is None:
+            return False
+
+        if self.get_lod_tolerance() != self.lod_tolerance:
+            return True
+
+        (u_min, u_max), (v_min, v_max) = self.viewport
+        if self.culled_range is None:
+            #   All polygons are displayed, they are culled if the viewport is zoomed in the geometry
+            bounds = self.current_data.get_polygon_bounds()
+            return bool(len(bounds)) and (
+                u_min > np.nanmin(bounds[:, 0]) or u_max < np.nanmax(bounds[:, 2]) or 
+                v_min > np.nanmin(bounds[:, 1]) or v_max < np.nanmax(bounds[:, 3])
+            )
+
+        (cu_min, cu_max), (cv_min, cv_max) = self.culled_range
+        return u_min < cu_min or u_max > cu_max or v_min < cv_min or v_max > cv_max
+
+    def cull(self, data: Data2D) -> Data2D:
+        """Returns the polygons of data to send to the plotter: the polygons whose bounding box intersects the viewport extended by the culling margin
+
+        Parameters
+        ----------
+        data : Data2D
+            Displayed data
+
+        Returns
+        -------
+        Data2D
+            Data to send to the plotter
+        """
+        self.culled_range = None
+        self.displayed_indexes = None
+
+        if self.viewport is None or not self.display_polygons or self.culling_margin is None:
+            return data
+        if data.data_type != DataType.POLYGONS:
+            return data
+
+        (u_min, u_max), (v_min, v_max) = self.viewport
+        u_margin = self.culling_margin * (u_max - u_min)
+        v_margin = self.culling_margin * (v_max - v_min)
+        culled_range = ((u_min - u_margin, u_max + u_margin), (v_min - v_margin, v_max + v_margin))
+
+        indexes = data.get_polygons_in_range(*culled_range)
+        if len(indexes) == data.get_polygon_count():
+            return data
+
+        self.culled_range = culled_range
+        self.displayed_indexes = indexes
+        return data.take(indexes)
+
+    def needs_rasterization(self, data: Data2D) -> bool:
+        """Returns if the hybrid display rasterizes the polygons of data: more than raster_cell_threshold of them are visible
+
+        Parameters
+        ----------
+        data : Data2D
+            Displayed data
+
+        Returns
+        -------
+        bool
+            Polygons to rasterize
+        """
+        if not self.hybrid_display or self.viewport is None or data is None or data.data_type != DataType.POLYGONS:
+            return False
+
+        res_x, res_y = self.plotter.get_resolution()
+        if not res_x or not res_y or res_x < 2 or res_y < 2:
+            return False
+
+        return len(data.get_polygons_in_range(*self.viewport)) > self.raster_cell_threshold
+
+    def rasterize(self, data: Data2D) -> Data2D:
+        """Returns the polygons of data rasterized over the viewport at the screen resolution
+
+        Parameters
+        ----------
+        data : Data2D
+            Displayed data
+
+        Returns
+        -------
+        Data2D
+            Grid Data2D to send to the plotter
+        """
+        res_x, res_y = self.plotter.get_resolution()
+        (u_min, u_max), (v_min, v_max) = self.viewport
+
+        self.rasterized_range = self.viewport
+        return data.rasterize(np.linspace(u_min, u_max, int(res_x)), np.linspace(v_min, v_max, int(res_y)))
+
+    def get_lod_tolerance(self) -> float:
+        """Returns the simplification tolerance of the displayed polygons: the size of lod_pixels screen pixels in the viewport, 
+        rounded down to a power of two so panning keeps it
+
+        Returns
+        -------
+        float
+            Simplification tolerance, None if unknown or disabled
+        """
+        if self.lod_pixels is None or self.viewport is None:
+            return None
+
+        res_x, res_y = self.plotter.get_resolution()
+        if not res_x or not res_y:
+            return None
+
+        (u_min, u_max), (v_min, v_max) = self.viewport
+        pixel_size = max((u_max - u_min) / res_x, (v_max - v_min) / res_y) * self.lod_pixels
+        if pixel_size <= 0.:
+            return None
+
+        return float(2. ** np.floor(np.log2(pixel_size)))
+
+    def level_of_detail(self, data: Data2D, same_polygons: bool) -> Tuple[Data2D, bool]:
+        """Simplifies the polygons of data to the screen resolution, 
+        the touching polygons smaller than a pixel that share a value are merged if lod_merge is set. 
+        The full detail polygons are kept in current_data for the cell lookups.
+
+        Parameters
+        ----------
+        data : Data2D
+            Culled data to display
+        same_polygons : bool
+            The polygons of data are the ones of the previous call, their simplification is reused if the tolerance did not change, nor the values if lod_merge is set
+
+        Returns
+        -------
+        Tuple[Data2D, bool]
+            Data to send to the plotter, and whether its polygons are the ones previously sent
+        """
+        tolerance = self.get_lod_tolerance()
+        if tolerance is None or data.data_type != DataType.POLYGONS:
+            same_polygons = same_polygons and self.lod_polygons is None
+            self.lod_tolerance = None
+            self.lod_polygons = None
+            return data, same_polygons
+
+        same_polygons = same_polygons and self.lod_polygons is not None and tolerance == self.lod_tolerance and (
+            not self.lod_merge or np.array_equal(data.cell_values, self.lod_values, equal_nan=data.cell_values.dtype != object)
+        )
+        if not same_polygons:
+            self.lod_polygons, self.lod_indexes = simplify_to_tolerance(
+                data.get_packed_polygons(), data.cell_values, tolerance, merge=self.lod_merge
+            )
+            self.lod_tolerance = tolerance
+            self.lod_values = data.cell_values
+
+        lod_data = data.take(self.lod_indexes)
+        lod_data.packed_polygons = self.lod_polygons
+        return lod_data, same_polygons
+
     def ranges_callback(
         self,
         x0: float,
@@ -290,6 +572,7 @@ class Panel2D(VisualizationPanel):
             Vertical axis maximum value
         """
         to_update = {"x0": x0, "x1": x1, "y0": y0, "y1": y1}
+        self.viewport = ((x0, x1), (y0, y1))
         self.__new_data = {**self.__new_data, **to_update}
         pn.state.curdoc.add_next_tick_callback(self.async_update_data)
 
@@ -351,9 +634,10 @@ class Panel2D(VisualizationPanel):
                     self.displayed_field
                 ) == VisualizationMode.FROM_VALUE
             ):
+                new_low, new_high = self.get_color_range(data)
                 self.__new_data["color_mapper"] = {
-                    "new_low": np.nanmin(np.array(data.cell_values).astype(float)),
-                    "new_high": np.nanmax(np.array(data.cell_values).astype(float)),
+                    "new_low": new_low,
+                    "new_high": new_high,
                 }
                 self.__new_data["hide_colorbar"] = False
             else:
@@ -384,7 +668,10 @@ class Panel2D(VisualizationPanel):
             slave=self.slave.duplicate(),
             name=self.panel_name,
             display_polygons=self.display_polygons,
-            extensions=[e for e in self.extension_classes]
+            extensions=[e for e in self.extension_classes],
+            client_side_colors=self.client_side_colors,
+            packed_geometry=self.packed_geometry,
+            hybrid_display=self.hybrid_display,
         )
         new_visualiser.copy_index = self.copy_index
 
@@ -419,7 +706,7 @@ class Panel2D(VisualizationPanel):
         callback : Callable
             Function to call.
         """
-        self.plotter.provide_on_mouse_move_callback(callback)
+        self.plotter.provide_on_mouse_move_callback(functools.partial(self.send_full_detail_event, callback))
 
     def provide_on_clic_callback(self, callback: Callable):
         """Stores a function to call everytime the user clics on the plot.
@@ -430,7 +717,37 @@ class Panel2D(VisualizationPanel):
         callback : Callable
             Function to call.
         """
-        self.plotter.provide_on_clic_callback(callback)
+        self.plotter.provide_on_clic_callback(functools.partial(self.send_full_detail_event, callback))
+
+    def send_full_detail_event(
+        self,
+        callback: Callable,
+        screen_location: Tuple[float, float],
+        space_location: Tuple[float, float, float],
+        cell_id: str,
+    ):
+        """Calls a mouse callback, the cell id is looked up in the full detail polygons if the displayed polygons are simplified or rasterized
+
+        Parameters
+        ----------
+        callback : Callable
+            Function to call
+        screen_location : Tuple[float, float]
+            Mouse location on the screen
+        space_location : Tuple[float, float, float]
+            Mouse location in the geometry
+        cell_id : str
+            Id of the displayed cell under the mouse
+        """
+        if (self.lod_polygons is not None or self.rasterized_range is not None) and self.current_data is not None:
+            u, v = self.get_uv()
+            full_detail_cell_id = self.current_data.get_cell_id_at(
+                float(np.dot(space_location, u)), float(np.dot(space_location, v))
+            )
+            if full_detail_cell_id is not None:
+                cell_id = full_detail_cell_id
+
+        callback(screen_location=screen_location, space_location=space_location, cell_id=cell_id)
 
     def provide_field_change_callback(self, callback: Callable):
         """Stores a function to call everytime the displayed field is changed.
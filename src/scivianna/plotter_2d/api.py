@@ -166,7 +166,7 @@ def plot_frame_in_axes(
             == VisualizationMode.FROM_VALUE
         ):
 
-            values = np.array(compo_list).astype(float)
+            values = compo_list.astype(float)
 
             plotter.set_color_map(color_map)
             plotter.update_colorbar(True, (np.nanmin(values), np.nanmin(values)))
@@ -174,9 +174,9 @@ def plot_frame_in_axes(
             slave.get_label_coloring_mode(coloring_label) == VisualizationMode.FROM_STRING
         ):
             compos = np.unique(compo_list)
-            cell_color_list = np.array(cell_color_list).astype(float)
+            cell_color_list = cell_color_list.astype(float)
 
-            edge_color_list = np.array(data.cell_edge_colors).astype(float)
+            edge_color_list = data.cell_edge_colors.astype(float)
 
             colors = []
             edge_colors = []
@@ -186,7 +186,7 @@ def plot_frame_in_axes(
             edge_color_list /= 255.0
 
             for compo in compos:
-                location = compo_list.index(compo)
+                location = np.flatnonzero(compo_list == compo)[0]
 
                 add_in_legend = True
 
@@ -1,9 +1,31 @@
 from typing import IO, Callable, Tuple
+import numpy as np
 import panel as pn
 
 from scivianna.data.data2d import Data2D
 
 
+def changed_values(previous: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Returns where values differ from previous, Nan values are equal to each other
+
+    Parameters
+    ----------
+    previous : np.ndarray
+        Previously sent values
+    values : np.ndarray
+        New values, of the same shape
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array, True where the value changed
+    """
+    changed = np.asarray(previous != values)
+    if previous.dtype.kind == "f" and values.dtype.kind == "f":
+        changed &= ~(np.isnan(previous) & np.isnan(values))
+    return changed
+
+
 class Plotter2D:
     """Generic 2D geometry plotter interface"""
 
@@ -13,6 +35,8 @@ class Plotter2D:
     """Function to call when the mouse is clicked on the geometry"""
     line_width = 1.0
     """Width of the line separating the different cells"""
+    patch_max_fraction = 0.2
+    """Fraction of changed cells above which update_colors sends the whole columns instead of the changed cells only"""
 
     def display_borders(self, display: bool):
         """Display or hides the figure borders and axis
@@ -155,6 +179,16 @@ class Plotter2D:
         """
         raise NotImplementedError()
 
+    def get_device_pixel_ratio(self) -> float:
+        """Returns the number of device pixels per screen pixel of the browser displaying the plot
+
+        Returns
+        -------
+        float
+            Device pixel ratio, 1 if unknown
+        """
+        return 1.
+
     def enable_highlight(self, enable: bool = True):
         """Enable hover highlight
 
@@ -3,8 +3,8 @@ from typing import IO, Callable, List, Tuple
 import bokeh.events
 import panel as pn
 from scivianna.data.data2d import Data2D
-from scivianna.utils.polygonize_tools import PolygonElement
-from scivianna.plotter_2d.generic_plotter import Plotter2D
+from scivianna.utils.polygonize_tools import PackedPolygons
+from scivianna.plotter_2d.generic_plotter import Plotter2D, changed_values
 from scivianna.plotter_2d.grid.grid_tools import get_grids
 
 import bokeh
@@ -14,11 +14,11 @@ from bokeh.plotting import save, output_file
 from bokeh.models import (
     HoverTool,
     ColumnDataSource,
+    CustomJS,
     CustomJSHover,
     LinearColorMapper,
     ColorBar,
 )
-# from bokeh.models import CustomJS
 from bokeh import events
 from scivianna.utils.color_tools import get_edges_colors
 
@@ -30,6 +30,55 @@ from scivianna.utils.color_tools import beautiful_color_maps
 import os
 
 
+def patch_image_colors(source_grid: ColumnDataSource, img: np.ndarray, grid: np.ndarray, val_grid: np.ndarray, patch_max_fraction: float) -> bool:
+    """Updates the image and values of a grid source displaying the same cells grid, only the tile bounding the changed pixels is sent 
+    if it is smaller than patch_max_fraction of the image
+
+    Parameters
+    ----------
+    source_grid : ColumnDataSource
+        Source containing the displayed image, cells grid and values grid
+    img : np.ndarray
+        New image
+    grid : np.ndarray
+        Cells grid of the new image
+    val_grid : np.ndarray
+        New values grid
+    patch_max_fraction : float
+        Fraction of the image above which the whole image is sent
+
+    Returns
+    -------
+    bool
+        False if the source does not display the same cells grid, nothing was updated
+    """
+    if (
+        len(source_grid.data[GRID]) == 0
+        or source_grid.data[GRID][0].shape != img.shape
+        or source_grid.data[COMPO_NAMES][0].dtype != val_grid.dtype
+        or not np.array_equal(source_grid.data[CELL_NAMES][0], grid)
+    ):
+        return False
+
+    changed = changed_values(source_grid.data[GRID][0], img) | changed_values(source_grid.data[COMPO_NAMES][0], val_grid)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if len(rows) == 0:
+        return True
+
+    columns = np.flatnonzero(changed.any(axis=0))
+    tile = (0, slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1))
+    if changed[tile[1:]].size > patch_max_fraction * changed.size:
+        source_grid.data.update({GRID: [img], COMPO_NAMES: [val_grid]})
+        return True
+
+    #   Only the tile bounding the changed pixels is sent
+    source_grid.patch({
+        GRID: [(tile, img[tile[1:]].ravel())],
+        COMPO_NAMES: [(tile, val_grid[tile[1:]].ravel())],
+    })
+    return True
+
+
 class Bokeh2DGridPlotter(Plotter2D):
     """2D geometry plotter based on the bokeh python module"""
 
@@ -91,6 +140,9 @@ class Bokeh2DGridPlotter(Plotter2D):
             }
         )
 
+        self.source_screen = ColumnDataSource({"device_pixel_ratio": [1.]})
+        """Device pixel ratio of the browser, set at each range update"""
+
         code_get_mouse_location = """
             const u0 = full_data.data.u0[0]
             const v0 = full_data.data.v0[0]
@@ -203,6 +255,18 @@ class Bokeh2DGridPlotter(Plotter2D):
         ][0]
         self.figure.toolbar.active_scroll = zoom_tool
         self.figure.toolbar.active_drag = pan_tool
+
+        self.figure.js_on_event(
+            "rangesupdate",
+            CustomJS(
+                args=dict(screen=self.source_screen),
+                code="""
+                    if (screen.data.device_pixel_ratio[0] != window.devicePixelRatio) {
+                        screen.data = {device_pixel_ratio: [window.devicePixelRatio]};
+                    }
+                """,
+            ),
+        )
         
         if self.dim_hovered_cell:
             def on_mouse_enter(event):
@@ -338,7 +402,12 @@ class Bokeh2DGridPlotter(Plotter2D):
         data : Data2D
             Data2D object containing the data to update
         """
-        self.update_2d_frame(data)
+        img, view, grid, val_grid = get_grids(data, self.display_edges)
+
+        if not patch_image_colors(self.source_grid, img, grid, val_grid, self.patch_max_fraction):
+            self.update_2d_frame(data)
+        elif self.save_data:
+            self.data = data
 
     def _set_callback_on_range_update(self, callback: IO):
         """Sets a callback to update the x and y ranges in the GUI.
@@ -419,6 +488,16 @@ class Bokeh2DGridPlotter(Plotter2D):
         except:
             return None, None
 
+    def get_device_pixel_ratio(self) -> float:
+        """Returns the number of device pixels per screen pixel of the browser displaying the plot
+
+        Returns
+        -------
+        float
+            Device pixel ratio, 1 until the browser reports it
+        """
+        return float(self.source_screen.data["device_pixel_ratio"][0])
+
     def export(self, file_name: str, title="Bokeh 2D plot"):
         """Exports the plot in a file
 
@@ -446,33 +525,14 @@ class Bokeh2DGridPlotter(Plotter2D):
         self.figure.width_policy = "max"
         self.figure.height_policy = "max"
 
-    def _polygons_to_coords(self, polygons: List[PolygonElement]) -> Tuple[List[List[Tuple[List[float]]]], List[List[Tuple[List[float]]]]]:
-        xs_dict = [
-            [
-                {
-                    "exterior": p.exterior_polygon.x_coords,
-                    "holes": [h.x_coords for h in p.holes],
-                }
-            ]
-            for p in polygons
-        ]
+    def _polygons_to_coords(self, polygons: PackedPolygons) -> Tuple[List[List[List[np.ndarray]]], List[List[List[np.ndarray]]]]:
+        x_rings = np.split(polygons.x_coords, polygons.ring_offsets[1:-1])
+        y_rings = np.split(polygons.y_coords, polygons.ring_offsets[1:-1])
 
-        ys_dict = [
-            [
-                {
-                    "exterior": p.exterior_polygon.y_coords,
-                    "holes": [h.y_coords for h in p.holes],
-                }
-            ]
-            for p in polygons
-        ]
+        ring_bounds = list(zip(polygons.polygon_offsets[:-1].tolist(), polygons.polygon_offsets[1:].tolist()))
 
-        xs: List[List[Tuple[List[float]]]] = [
-            [[p["exterior"], *p["holes"]] for p in mp] for mp in xs_dict
-        ]
-        ys: List[List[Tuple[List[float]]]] = [
-            [[p["exterior"], *p["holes"]] for p in mp] for mp in ys_dict
-        ]
+        xs: List[List[List[np.ndarray]]] = [[x_rings[start:end]] for start, end in ring_bounds]
+        ys: List[List[List[np.ndarray]]] = [[y_rings[start:end]] for start, end in ring_bounds]
 
         return xs, ys
 
@@ -540,7 +600,7 @@ class Bokeh2DGridPlotter(Plotter2D):
                     self.save_data = False
                     data = self.data.copy()
 
-                    data.cell_colors[data.cell_ids.index(hovered_cell)][3] = 0.6*255
+                    data.cell_colors[data.cell_ids == hovered_cell, 3] = 0.6*255
 
                     self.update_2d_frame(data)
 
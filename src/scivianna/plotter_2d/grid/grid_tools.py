@@ -4,6 +4,9 @@ import numpy as np
 
 from scivianna.data.data2d import Data2D
 
+LOOKUP_TABLE_MAX_FACTOR = 16
+"""Maximum ratio between the integer ids range and the cells count for which the pixels cells are found with a lookup table"""
+
 def get_grids(
     data: Data2D,
     display_edges: bool
@@ -23,52 +26,136 @@ def get_grids(
         Bokeh readable 2D image, 3D color grid, id grid, value grid
     """
     grid = data.get_grid()
-    flat_grid = grid.flatten()
-    vals, inv = np.unique(flat_grid, return_inverse=True)
 
-    value_map = dict(zip(data.cell_ids, data.cell_values))
-    color_map = dict(zip(data.cell_ids, data.cell_colors))
-    
-    value_array = np.array([value_map[val] for val in vals])
-    color_array = np.array([color_map[val] for val in vals])
+    cell_indexes = get_cell_indexes(data.cell_ids, grid)
 
-    colors = color_array[inv]  # shape (n, m, 4)
+    #   The RGBA colors are packed in uint32 and gathered directly in the image buffer
+    img = np.empty(grid.shape, dtype=np.uint32)
+    np.take(_as_uint32(data.cell_colors), cell_indexes, out=img)
 
     if display_edges:
-        flat_data = grid.flatten()
-        roll_1_0 = np.where(flat_data == np.roll(flat_data, -1), 1, 0)
-        roll_1_1 = np.where(flat_data == np.roll(flat_data, 1), 1, 0)
-        contour_1_0 = roll_1_0.reshape(grid.shape)
-        contour_1_1 = roll_1_1.reshape(grid.shape)
+        edges = get_edges(grid)
+        img[edges] = _as_uint32(data.cell_edge_colors)[cell_indexes[edges]]
 
-        flat_data_2 = grid.T.flatten()
-        roll_2_0 = np.where(flat_data_2 == np.roll(flat_data_2, -1), 1, 0)
-        roll_2_1 = np.where(flat_data_2 == np.roll(flat_data_2, 1), 1, 0)
+    view = img.view(dtype=np.uint8).reshape((*grid.shape, 4))
+    val_grid = data.cell_values[cell_indexes]
 
-        contour_2_0 = roll_2_0.reshape(grid.T.shape).T
-        contour_2_1 = roll_2_1.reshape(grid.T.shape).T
+    return img, view, grid, val_grid
 
-        borders = np.expand_dims(np.minimum(
-                np.minimum(contour_1_0, contour_2_0),
-                np.minimum(contour_1_1, contour_2_1),
-            ).flatten(), axis=-1)
-        
-        borders = np.concatenate([borders, borders, borders, borders], axis=1)
+def get_cell_indexes(cell_ids: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """Returns the index in cell_ids of the cell of each pixel, with a lookup table if the ids are integers in a compact range, 
+    by binary search in the sorted ids otherwise
 
-        color_edge_map = dict(zip(data.cell_ids, data.cell_edge_colors))
-        edge_color_array = np.array([color_edge_map[val] for val in vals])
+    Parameters
+    ----------
+    cell_ids : np.ndarray
+        Cell ids
+    grid : np.ndarray
+        2D id grid
 
-        edge_colors = edge_color_array[inv]  # shape (n, m, 4)
+    Returns
+    -------
+    np.ndarray
+        2D index grid
 
-        colors = np.where(borders == (1, 1, 1, 1), colors, edge_colors).reshape((*grid.shape, 4))
-    else:
-        colors = colors.reshape((*grid.shape, 4))
+    Raises
+    ------
+    ValueError
+        The grid contains ids that are not in cell_ids
+    """
+    if len(cell_ids) == 0:
+        if grid.size > 0:
+            _raise_missing_ids(grid, np.zeros(grid.shape, dtype=bool))
+        return np.zeros(grid.shape, dtype=np.int32)
 
-    val_grid = value_array[inv].reshape(grid.shape)
-    
-    img = np.empty(grid.shape, dtype=np.uint32)
-    view = img.view(dtype=np.uint8).reshape(colors.shape)
-    view[:, :, :] = colors[:, :, :]
-    
-    return img, view, grid, val_grid
-    
\ No newline at end of file
+    if cell_ids.dtype.kind in "iu" and grid.dtype.kind in "iu" and grid.size > 0:
+        id_min = cell_ids.min()
+        id_max = cell_ids.max()
+        id_range = int(id_max - id_min) + 1
+        if id_range <= LOOKUP_TABLE_MAX_FACTOR * len(cell_ids):
+            if grid.min() < id_min or grid.max() > id_max:
+                _raise_missing_ids(grid, (grid >= id_min) & (grid <= id_max))
+
+            lookup_table = np.full(id_range, -1, dtype=np.int32)
+            #   Reversed so that the first of duplicated ids is kept
+            lookup_table[(cell_ids - id_min)[::-1]] = np.arange(len(cell_ids), dtype=np.int32)[::-1]
+            indexes = lookup_table[grid - grid.dtype.type(id_min)]
+            if indexes.min() < 0:
+                _raise_missing_ids(grid, indexes >= 0)
+            return indexes
+
+    sorter = np.argsort(cell_ids, kind="stable").astype(np.int32)
+    sorted_ids = cell_ids[sorter]
+    positions = np.minimum(np.searchsorted(sorted_ids, grid), len(cell_ids) - 1)
+
+    #   The binary search gives the position of the next id for the missing ones
+    found = sorted_ids[positions] == grid
+    if sorted_ids.dtype.kind == "f" and grid.dtype.kind == "f":
+        found |= np.isnan(sorted_ids[positions]) & np.isnan(grid)
+    if not np.all(found):
+        _raise_missing_ids(grid, found)
+
+    return sorter[positions]
+
+def _raise_missing_ids(grid: np.ndarray, found: np.ndarray):
+    """Raises the error listing the grid ids that are not cell ids
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        2D id grid
+    found : np.ndarray
+        Boolean grid, False on the pixels whose id is not a cell id
+
+    Raises
+    ------
+    ValueError
+        Always
+    """
+    missing = np.unique(grid[~found])
+    raise ValueError(f"The grid contains {len(missing)} ids missing from the cell ids, such as {missing[:5].tolist()}")
+
+def get_edges(grid: np.ndarray) -> np.ndarray:
+    """Returns the pixels that differ from one of their four neighbours, the pixels on the grid borders are edges
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        2D id grid
+
+    Returns
+    -------
+    np.ndarray
+        Boolean grid, True on the edges
+    """
+    edges = np.zeros(grid.shape, dtype=bool)
+    if grid.size == 0:
+        return edges
+
+    edges[[0, -1], :] = True
+    edges[:, [0, -1]] = True
+
+    horizontal = grid[:, 1:] != grid[:, :-1]
+    edges[:, 1:] |= horizontal
+    edges[:, :-1] |= horizontal
+
+    vertical = grid[1:, :] != grid[:-1, :]
+    edges[1:, :] |= vertical
+    edges[:-1, :] |= vertical
+
+    return edges
+
+def _as_uint32(colors: np.ndarray) -> np.ndarray:
+    """Packs (cell_count, 4) uint8 RGBA colors in one uint32 per cell
+
+    Parameters
+    ----------
+    colors : np.ndarray
+        RGBA colors
+
+    Returns
+    -------
+    np.ndarray
+        Packed colors
+    """
+    return np.ascontiguousarray(colors, dtype=np.uint8).view(np.uint32).reshape(-1)
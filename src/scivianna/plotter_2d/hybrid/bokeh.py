@@ -0,0 +1,206 @@
+from typing import Callable, Tuple
+
+import numpy as np
+from bokeh.models import ColumnDataSource
+
+from scivianna.data.data2d import Data2D
+from scivianna.enums import DataType
+from scivianna.plotter_2d.grid.bokeh import patch_image_colors
+from scivianna.plotter_2d.grid.grid_tools import get_grids
+from scivianna.plotter_2d.polygon.bokeh import Bokeh2DPolygonPlotter
+from scivianna.utils.polygonize_tools import PackedPolygons
+from scivianna.constants import GRID, CELL_NAMES, COMPO_NAMES
+
+
+class Bokeh2DHybridPlotter(Bokeh2DPolygonPlotter):
+    """2D geometry plotter based on the bokeh python module, displaying polygon Data2D as polygons, 
+    and grid Data2D, such as polygons rasterized on the server, as an image"""
+
+    display_edges = True
+    """Display the edges of the cells of the image"""
+
+    def __init__(
+        self,
+        client_side_colors: bool = False,
+        packed_geometry: bool = False,
+    ):
+        """Creates the bokeh Figure and ColumnDataSources
+
+        Parameters
+        ----------
+        client_side_colors : bool
+            The polygons of the fields colored from their values are colored in the browser from the cell values
+        packed_geometry : bool
+            The polygons are sent to the browser as flat binary buffers
+        """
+        super().__init__(client_side_colors, packed_geometry)
+
+        self.rasterized: bool = False
+        """The displayed data is an image"""
+        self.cell_name_grid: np.ndarray = None
+        """Cell ids grid of the displayed image"""
+        self.image_extent: Tuple[float, float, float, float] = None
+        """Lower left corner, width and height of the displayed image"""
+
+        self.source_grid = ColumnDataSource(
+            {
+                GRID: [],
+                CELL_NAMES: [],
+                COMPO_NAMES: [],
+            }
+        )
+        self.image = self.figure.image_rgba(
+            image=GRID,
+            x=0.,
+            y=0.,
+            dw=1.,
+            dh=1.,
+            source=self.source_grid,
+            visible=False,
+        )
+
+    def plot_2d_frame(
+        self,
+        data: Data2D,
+    ):
+        """Adds a new plot to the figure from a set of polygons or a grid
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the geometry to plot
+        """
+        if data.data_type == DataType.GRID:
+            super().plot_2d_frame(Data2D.from_polygon_list(PackedPolygons.empty()))
+            self._plot_image(data)
+        else:
+            super().plot_2d_frame(data)
+
+    def update_2d_frame(
+        self,
+        data: Data2D,
+    ):
+        """Updates plot to the figure, switching between the polygons and the image display if the data type changed
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the data to update
+        """
+        if data.data_type == DataType.GRID:
+            if not self.rasterized:
+                #   The browser no longer keeps the hidden polygons
+                super().update_2d_frame(Data2D.from_polygon_list(PackedPolygons.empty()))
+            self._plot_image(data)
+        else:
+            if self.rasterized:
+                self.source_grid.data = {GRID: [], CELL_NAMES: [], COMPO_NAMES: []}
+                self.image.visible = False
+                self.hovered_glyph.visible = True
+                self.rasterized = False
+                self.cell_name_grid = None
+                self.image_extent = None
+            super().update_2d_frame(data)
+
+    def update_colors(self, data: Data2D,):
+        """Updates the colors of the displayed polygons or image
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the data to update
+        """
+        if data.data_type != DataType.GRID:
+            if self.rasterized:
+                self.update_2d_frame(data)
+            else:
+                super().update_colors(data)
+            return
+
+        if not self.rasterized or self._get_extent(data) != self.image_extent:
+            self.update_2d_frame(data)
+            return
+
+        img, view, grid, val_grid = get_grids(data, self.display_edges)
+        if not patch_image_colors(self.source_grid, img, grid, val_grid, self.patch_max_fraction):
+            self._plot_image(data)
+
+    def _plot_image(self, data: Data2D):
+        """Displays a grid Data2D as an image, in place of the polygons
+
+        Parameters
+        ----------
+        data : Data2D
+            Grid Data2D to display
+        """
+        img, view, grid, val_grid = get_grids(data, self.display_edges)
+
+        self.source_grid.data = {
+            GRID: [img],
+            CELL_NAMES: [grid],
+            COMPO_NAMES: [val_grid],
+        }
+
+        self.image_extent = self._get_extent(data)
+        x, y, dw, dh = self.image_extent
+        self.image.glyph.update(x=x, y=y, dw=dw, dh=dh)
+
+        self.image.visible = True
+        self.hovered_glyph.visible = False
+        self.rasterized = True
+        self.cell_name_grid = grid
+
+    def _get_extent(self, data: Data2D) -> Tuple[float, float, float, float]:
+        """Returns the lower left corner, width and height of the image displaying a grid Data2D
+
+        Parameters
+        ----------
+        data : Data2D
+            Grid Data2D
+
+        Returns
+        -------
+        Tuple[float, float, float, float]
+            Image extent
+        """
+        return (
+            float(data.u_values.min()),
+            float(data.v_values.min()),
+            float(data.u_values.max() - data.u_values.min()),
+            float(data.v_values.max() - data.v_values.min()),
+        )
+
+    def send_event(self, callback: Callable):
+        """Calls the callback with the mouse location and the hovered cell id, found in the image cell ids grid when the image is displayed
+
+        Parameters
+        ----------
+        callback : Callable
+            Function to call
+        """
+        if not self.rasterized:
+            super().send_event(callback)
+            return
+
+        hovered_cell = None
+        if "u" in self.source_mouse.data:
+            rows, columns = self.cell_name_grid.shape
+            x, y, dw, dh = self.image_extent
+            i = int(np.floor((self.source_mouse.data["u"][0] - x) / dw * columns)) if dw > 0 else 0
+            j = int(np.floor((self.source_mouse.data["v"][0] - y) / dh * rows)) if dh > 0 else 0
+
+            if 0 <= i < columns and 0 <= j < rows:
+                hovered_cell = self.cell_name_grid[j, i]
+
+        callback(
+            screen_location=(
+                self.source_mouse.data["sx"][0],
+                self.source_mouse.data["sy"][0]
+            ),
+            space_location=(
+                self.source_mouse.data["x"][0],
+                self.source_mouse.data["y"][0],
+                self.source_mouse.data["z"][0]
+            ),
+            cell_id=hovered_cell
+        )
@@ -1,10 +1,10 @@
 import functools
-from typing import IO, Callable, List, Tuple, Union
+from typing import IO, Any, Callable, Dict, List, Tuple, Union
 import bokeh.events
 import panel as pn
 from scivianna.data.data2d import Data2D
-from scivianna.utils.polygonize_tools import PolygonElement
-from scivianna.plotter_2d.generic_plotter import Plotter2D
+from scivianna.utils.polygonize_tools import PackedPolygons
+from scivianna.plotter_2d.generic_plotter import Plotter2D, changed_values
 
 import bokeh
 from bokeh.colors import RGB
@@ -13,29 +13,70 @@ from bokeh.plotting import save, output_file
 from bokeh.models import (
     HoverTool,
     ColumnDataSource,
+    CustomJS,
     CustomJSHover,
+    CustomJSTransform,
     LinearColorMapper,
     ColorBar,
     TapTool,
 )
-# from bokeh.models import CustomJS
+from bokeh.transform import transform
 from bokeh import events
 
 import numpy as np
 
-from scivianna.constants import XS, YS, CELL_NAMES, COMPO_NAMES, COLORS, EDGE_COLORS, GEOMETRY, EDGE_ALPHA, FILL_ALPHA
-from scivianna.utils.color_tools import beautiful_color_maps
+from scivianna.constants import XS, YS, CELL_NAMES, COMPO_NAMES, COLORS, EDGE_COLORS, GEOMETRY, EDGE_ALPHA, FILL_ALPHA, CELL_VALUES
+from scivianna.utils.color_tools import beautiful_color_maps, get_edges_colors
 
 import os
 
+UNPACK_RINGS_CODE = """
+    // xs contains the index of each displayed polygon in the flat buffers of the geometry source
+    const coords = geometry.data[coordinate][0]
+    const ring_offsets = geometry.data.ring_offsets[0]
+    const polygon_offsets = geometry.data.polygon_offsets[0]
+
+    const polygons = new Array(xs.length)
+    for (let i = 0; i < xs.length; i++) {
+        const polygon = xs[i]
+        const rings = []
+        for (let ring = polygon_offsets[polygon]; ring < polygon_offsets[polygon + 1]; ring++) {
+            // Views on the flat buffer, the coordinates are not copied
+            rings.push(new Float32Array(coords.buffer, coords.byteOffset + 4 * ring_offsets[ring], ring_offsets[ring + 1] - ring_offsets[ring]))
+        }
+        polygons[i] = [rings]
+    }
+    return polygons
+"""
+"""Javascript function unpacking the polygons rings of the flat geometry buffers for multi_polygons"""
+
 
 class Bokeh2DPolygonPlotter(Plotter2D):
     """2D geometry plotter based on the bokeh python module"""
 
     def __init__(
         self,
+        client_side_colors: bool = False,
+        packed_geometry: bool = False,
     ):
-        """Creates the bokeh Figure and ColumnDataSources"""
+        """Creates the bokeh Figure and ColumnDataSources
+
+        Parameters
+        ----------
+        client_side_colors : bool
+            The fields colored from their values are colored in the browser from a float32 value column and the color mapper, instead of receiving the RGBA colors of each cell
+        packed_geometry : bool
+            The polygons are sent as flat float32 coordinates and int32 offsets buffers unpacked in the browser, instead of nested lists of rings
+        """
+        self.client_side_colors: bool = client_side_colors
+        """The fields colored from their values are colored in the browser from the cell values and the color mapper"""
+        self.packed_geometry: bool = packed_geometry
+        """The polygons are sent as flat buffers unpacked in the browser"""
+        self.colored_from_values: bool = False
+        """The displayed polygons are colored from the cell values column"""
+        self.sent_arrays: Dict[str, np.ndarray] = {}
+        """Arrays of the cell values and colors columns last sent to the source"""
+
         self.source_polygons = ColumnDataSource(
             {
                 XS: [],
@@ -47,6 +88,16 @@ class Bokeh2DPolygonPlotter(Plotter2D):
             }
         )
 
+        # Single row source containing the flat geometry buffers, sent as binary arrays
+        self.source_geometry = ColumnDataSource(
+            {
+                "x": [np.zeros(0, dtype=np.float32)],
+                "y": [np.zeros(0, dtype=np.float32)],
+                "ring_offsets": [np.zeros(1, dtype=np.int32)],
+                "polygon_offsets": [np.zeros(1, dtype=np.int32)],
+            }
+        )
+
         self.source_coordinates = ColumnDataSource(
             {
                 "u_min": [0],
@@ -88,6 +139,9 @@ class Bokeh2DPolygonPlotter(Plotter2D):
             }
         )
 
+        self.source_screen = ColumnDataSource({"device_pixel_ratio": [1.]})
+        """Device pixel ratio of the browser, set at each range update"""
+
         code_get_mouse_location = """
             const u0 = full_data.data.u0[0]
             const v0 = full_data.data.v0[0]
@@ -166,8 +220,12 @@ class Bokeh2DPolygonPlotter(Plotter2D):
 
         self.figure.add_tools(self.hover_tool)
 
+        # The Nan values are colored in transparent gray, as in the server side coloring
         self.color_mapper = LinearColorMapper(
-            palette=self.__get_color_mapper_from_string("BuRd"), low=0.0, high=1.0
+            palette=self.__get_color_mapper_from_string("BuRd"), low=0.0, high=1.0, nan_color=RGB(200, 200, 200, 0)
+        )
+        self.edge_color_mapper = LinearColorMapper(
+            palette=self.__get_edge_color_mapper_from_string("BuRd"), low=0.0, high=1.0, nan_color=RGB(180, 180, 180)
         )
 
         self.figure_color_bar = ColorBar(
@@ -193,6 +251,18 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         self.figure.toolbar.active_scroll = zoom_tool
         self.figure.toolbar.active_drag = pan_tool
 
+        self.figure.js_on_event(
+            "rangesupdate",
+            CustomJS(
+                args=dict(screen=self.source_screen),
+                code="""
+                    if (screen.data.device_pixel_ratio[0] != window.devicePixelRatio) {
+                        screen.data = {device_pixel_ratio: [window.devicePixelRatio]};
+                    }
+                """,
+            ),
+        )
+
     def display_borders(self, display: bool):
         """Display or hides the figure borders and axis
 
@@ -227,6 +297,7 @@ class Bokeh2DPolygonPlotter(Plotter2D):
 
         if display:
             self.color_mapper.update(low=value_range[0], high=value_range[1])
+            self.edge_color_mapper.update(low=value_range[0], high=value_range[1])
             self.figure_color_bar.color_mapper = self.color_mapper
         self.figure_color_bar.visible = display
 
@@ -243,6 +314,9 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         self.figure_color_bar.color_mapper.update(
             palette=self.__get_color_mapper_from_string(color_map_name),
         )
+        self.edge_color_mapper.update(
+            palette=self.__get_edge_color_mapper_from_string(color_map_name),
+        )
 
     def plot_2d_frame(
         self,
@@ -255,22 +329,22 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         data : Data2D
             Data2D object containing the geometry to plot
         """
-        xs, ys = self._polygons_to_coords(data.get_polygons())
-
         self.source_polygons.data = {
-            XS: xs,
-            YS: ys,
+            **self._geometry_columns(data.get_packed_polygons()),
             CELL_NAMES: data.cell_ids,
-            COMPO_NAMES: data.cell_values,
-            COLORS: np.array(data.cell_colors)[:, :-1].tolist(),
-            FILL_ALPHA: (np.array(data.cell_colors)[:, -1]/255).tolist(),
-            EDGE_COLORS: np.array(data.cell_edge_colors)[:, :-1].tolist(),
-            EDGE_ALPHA: (np.array(data.cell_edge_colors)[:, -1]/255).tolist(),
+            **self._cell_columns(data),
         }
 
+        if self.packed_geometry:
+            xs = {"field": XS, "transform": CustomJSTransform(args=dict(geometry=self.source_geometry, coordinate="x"), v_func=UNPACK_RINGS_CODE)}
+            ys = {"field": YS, "transform": CustomJSTransform(args=dict(geometry=self.source_geometry, coordinate="y"), v_func=UNPACK_RINGS_CODE)}
+        else:
+            xs = XS
+            ys = YS
+
         self.hovered_glyph = self.figure.multi_polygons(
-            xs=XS,
-            ys=YS,
+            xs=xs,
+            ys=ys,
             line_width = self.line_width,
             source=self.source_polygons,
             color=COLORS,
@@ -280,6 +354,7 @@ class Bokeh2DPolygonPlotter(Plotter2D):
             hover_line_alpha=0.6,
             hover_fill_alpha=0.6,
         )
+        self._set_glyph_colors(self.colored_from_values)
 
     def update_2d_frame(
         self,
@@ -292,20 +367,14 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         data : Data2D
             Data2D object containing the data to update
         """
-        xs, ys = self._polygons_to_coords(data.get_polygons())
-
         self.source_polygons.update(
             data={
-                XS: xs,
-                YS: ys,
+                **self._geometry_columns(data.get_packed_polygons()),
                 CELL_NAMES: data.cell_ids,
-                COMPO_NAMES: data.cell_values,
-                COLORS: np.array(data.cell_colors).tolist(),
-                EDGE_COLORS: np.array(data.cell_edge_colors).tolist(),
-                FILL_ALPHA: (np.array(data.cell_colors)[:, -1]/255).tolist(),
-                EDGE_ALPHA: (np.array(data.cell_edge_colors)[:, -1]/255).tolist(),
+                **self._cell_columns(data),
             }
         )
+        self._set_glyph_colors(self.colored_from_values)
 
     def update_colors(self, data: Data2D,):
         """Updates the colors of the displayed polygons
@@ -316,23 +385,138 @@ class Bokeh2DPolygonPlotter(Plotter2D):
             Data2D object containing the data to update
         """
         data.convert_to_polygons()
-        colors = data.cell_colors
-        cell_count = len(colors)
 
-        self.source_polygons.patch(
-            {
-                COMPO_NAMES: [(slice(0, cell_count), data.cell_values)],
-                COLORS: [(slice(0, cell_count), np.array(data.cell_colors)[:, :-1].tolist())],
-                EDGE_COLORS: [
-                    (slice(0, cell_count), np.array(data.cell_edge_colors).tolist())
-                ],
-                FILL_ALPHA: [
-                    (slice(0, cell_count), (np.array(data.cell_colors)[:, -1]/255).tolist())
-                ],
-                EDGE_ALPHA: [
-                    (slice(0, cell_count), (np.array(data.cell_edge_colors)[:, -1]/255).tolist())
-                ],
+        if len(data.cell_ids) != len(self.source_polygons.data[CELL_NAMES]):
+            self.update_2d_frame(data)
+            return
+
+        if self._is_colored_from_values(data) != self.colored_from_values:
+            #   The columns coloring the glyph change, they are replaced
+            self.source_polygons.data.update(self._cell_columns(data))
+            self._set_glyph_colors(self.colored_from_values)
+            return
+
+        #   With client side colors, color map and range changes only update the color mappers and leave the columns unchanged
+        arrays = self._cell_arrays(data)
+        changed = np.zeros(len(data.cell_ids), dtype=bool)
+        for name, values in arrays.items():
+            column_changed = changed_values(self.sent_arrays[name], values)
+            changed |= column_changed.any(axis=1) if column_changed.ndim == 2 else column_changed
+        self.sent_arrays = arrays
+
+        indexes = np.flatnonzero(changed)
+        if len(indexes) == 0:
+            return
+
+        if len(indexes) > self.patch_max_fraction * len(changed):
+            patches = {name: [(slice(0, len(changed)), self._source_column(values))] for name, values in arrays.items()}
+        else:
+            #   Only the changed cells are sent
+            patches = {name: list(zip(indexes.tolist(), values[indexes].tolist())) for name, values in arrays.items()}
+
+        self.source_polygons.patch(patches)
+
+    def _is_colored_from_values(self, data: Data2D) -> bool:
+        """Returns if the polygons of data are colored in the browser from their values
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the data to display
+
+        Returns
+        -------
+        bool
+            Polygons colored from their values
+        """
+        return self.client_side_colors and data.color_range is not None
+
+    def _cell_arrays(self, data: Data2D) -> Dict[str, np.ndarray]:
+        """Returns the arrays of the source columns containing the cell values and colors of data, and stores if the polygons are colored from their values
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the data to display
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Array per column, the colors are arrays of shape (cell_count, 3)
+        """
+        self.colored_from_values = self._is_colored_from_values(data)
+
+        if self.colored_from_values:
+            return {
+                COMPO_NAMES: data.cell_values,
+                CELL_VALUES: data.cell_values.astype(np.float32),
             }
+
+        return {
+            COMPO_NAMES: data.cell_values,
+            COLORS: data.cell_colors[:, :-1],
+            FILL_ALPHA: data.cell_colors[:, -1]/255,
+            EDGE_COLORS: data.cell_edge_colors[:, :-1],
+            EDGE_ALPHA: data.cell_edge_colors[:, -1]/255,
+        }
+
+    def _cell_columns(self, data: Data2D) -> Dict[str, Any]:
+        """Returns the source columns containing the cell values and colors of data, and keeps their arrays to find the cells changed at the next update
+
+        Parameters
+        ----------
+        data : Data2D
+            Data2D object containing the data to display
+
+        Returns
+        -------
+        Dict[str, Any]
+            Source columns
+        """
+        self.sent_arrays = self._cell_arrays(data)
+        return {name: self._source_column(values) for name, values in self.sent_arrays.items()}
+
+    def _source_column(self, values: np.ndarray) -> Union[np.ndarray, List[List[int]]]:
+        """Returns a column array in the format sent to the source, the colors are sent as lists
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Column array
+
+        Returns
+        -------
+        Union[np.ndarray, List[List[int]]]
+            Source column
+        """
+        return values.tolist() if values.ndim == 2 else values
+
+    def _set_glyph_colors(self, from_values: bool):
+        """Colors the polygons glyphs from the cell values and the color mappers, or from the RGBA colors columns
+
+        Parameters
+        ----------
+        from_values : bool
+            Color from the cell values column
+        """
+        if from_values:
+            fill_color = transform(CELL_VALUES, self.color_mapper)
+            line_color = transform(CELL_VALUES, self.edge_color_mapper)
+        else:
+            fill_color = COLORS
+            line_color = EDGE_COLORS
+
+        for glyph in [
+            self.hovered_glyph.glyph,
+            self.hovered_glyph.hover_glyph,
+            self.hovered_glyph.nonselection_glyph,
+            self.hovered_glyph.muted_glyph,
+        ]:
+            glyph.update(fill_color=fill_color, line_color=line_color)
+
+        self.hovered_glyph.glyph.update(
+            fill_alpha=1. if from_values else FILL_ALPHA,
+            line_alpha=1. if from_values else EDGE_ALPHA,
         )
 
     def _set_callback_on_range_update(self, callback: IO):
@@ -396,6 +580,21 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         """
         return [RGB(*c) for c in beautiful_color_maps[color_map_name]]
 
+    def __get_edge_color_mapper_from_string(self, color_map_name: str) -> List[RGB]:
+        """Gets the edge color list from a color map name, darkened as the edges colored from the cell colors
+
+        Parameters
+        ----------
+        color_map_name : str
+            Color map name
+
+        Returns
+        -------
+        List[RGB]
+            List of RGB colors
+        """
+        return [RGB(*c) for c in get_edges_colors(np.array(beautiful_color_maps[color_map_name]))]
+
     def get_resolution(self) -> Tuple[float, float]:
         """Returns the current plot resolution to display. For resolution based codes, it will be replaced by the value present in the gui
 
@@ -413,6 +612,16 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         except:
             return None, None
 
+    def get_device_pixel_ratio(self) -> float:
+        """Returns the number of device pixels per screen pixel of the browser displaying the plot
+
+        Returns
+        -------
+        float
+            Device pixel ratio, 1 until the browser reports it
+        """
+        return float(self.source_screen.data["device_pixel_ratio"][0])
+
     def export(self, file_name: str, title="Bokeh 2D plot"):
         """Exports the plot in a file
 
@@ -440,33 +649,42 @@ class Bokeh2DPolygonPlotter(Plotter2D):
         self.figure.width_policy = "max"
         self.figure.height_policy = "max"
 
-    def _polygons_to_coords(self, polygons: List[PolygonElement]) -> Tuple[List[List[Tuple[List[float]]]], List[List[Tuple[List[float]]]]]:
-        xs_dict = [
-            [
-                {
-                    "exterior": p.exterior_polygon.x_coords,
-                    "holes": [h.x_coords for h in p.holes],
-                }
-            ]
-            for p in polygons
-        ]
+    def _geometry_columns(self, polygons: PackedPolygons) -> Dict[str, Any]:
+        """Returns the source columns defining the polygons. With packed_geometry, the flat buffers are set in the geometry source 
+        and the columns only contain the index of each polygon, the rings are unpacked in the browser
 
-        ys_dict = [
-            [
-                {
-                    "exterior": p.exterior_polygon.y_coords,
-                    "holes": [h.y_coords for h in p.holes],
-                }
-            ]
-            for p in polygons
-        ]
+        Parameters
+        ----------
+        polygons : PackedPolygons
+            Polygons to display
 
-        xs: List[List[Tuple[List[float]]]] = [
-            [[p["exterior"], *p["holes"]] for p in mp] for mp in xs_dict
-        ]
-        ys: List[List[Tuple[List[float]]]] = [
-            [[p["exterior"], *p["holes"]] for p in mp] for mp in ys_dict
-        ]
+        Returns
+        -------
+        Dict[str, Any]
+            XS and YS columns
+        """
+        if not self.packed_geometry:
+            xs, ys = self._polygons_to_coords(polygons)
+            return {XS: xs, YS: ys}
+
+        # The geometry source is updated first for the polygons source update to unpack the new buffers
+        self.source_geometry.data = {
+            "x": [polygons.x_coords.astype(np.float32)],
+            "y": [polygons.y_coords.astype(np.float32)],
+            "ring_offsets": [polygons.ring_offsets.astype(np.int32)],
+            "polygon_offsets": [polygons.polygon_offsets.astype(np.int32)],
+        }
+        polygon_indexes = np.arange(len(polygons), dtype=np.int32)
+        return {XS: polygon_indexes, YS: polygon_indexes}
+
+    def _polygons_to_coords(self, polygons: PackedPolygons) -> Tuple[List[List[List[np.ndarray]]], List[List[List[np.ndarray]]]]:
+        x_rings = np.split(polygons.x_coords, polygons.ring_offsets[1:-1])
+        y_rings = np.split(polygons.y_coords, polygons.ring_offsets[1:-1])
+
+        ring_bounds = list(zip(polygons.polygon_offsets[:-1].tolist(), polygons.polygon_offsets[1:].tolist()))
+
+        xs: List[List[List[np.ndarray]]] = [[x_rings[start:end]] for start, end in ring_bounds]
+        ys: List[List[List[np.ndarray]]] = [[y_rings[start:end]] for start, end in ring_bounds]
 
         return xs, ys
 
@@ -1,6 +1,5 @@
 from typing import IO, Any, Dict, List, Tuple, Union
 from scivianna.data.data2d import Data2D
-from scivianna.utils.polygonize_tools import PolygonElement
 from scivianna.plotter_2d.generic_plotter import Plotter2D
 
 import matplotlib
@@ -13,7 +12,6 @@ from matplotlib.colors import LinearSegmentedColormap
 from scivianna.constants import POLYGONS, CELL_NAMES, COMPO_NAMES, COLORS, EDGE_COLORS
 from scivianna.utils.color_tools import get_edges_colors, beautiful_color_maps
 
-from shapely import Polygon
 import geopandas as gpd
 import numpy as np
 
@@ -108,22 +106,10 @@ class Matplotlib2DPolygonPlotter(Plotter2D):
         data.convert_to_polygons()
         cell_list: List[Union[str, int]] = data.cell_ids
 
-        cell_colors: np.ndarray = np.array(data.cell_colors).astype(float)
-        cell_edge_colors: np.ndarray = np.array(data.cell_edge_colors).astype(float)
-
-        polygons: List[Polygon] = [
-            Polygon(
-                shell=[
-                    (p.exterior_polygon.x_coords[j], p.exterior_polygon.y_coords[j])
-                    for j in range(len(p.exterior_polygon.x_coords))
-                ],
-                holes=[
-                    [(h.x_coords[j], h.y_coords[j]) for j in range(len(h.x_coords))]
-                    for h in p.holes
-                ],
-            )
-            for p in data.get_polygons()
-        ]
+        cell_colors: np.ndarray = data.cell_colors.astype(float)
+        cell_edge_colors: np.ndarray = data.cell_edge_colors.astype(float)
+
+        polygons: np.ndarray = data.get_packed_polygons().to_shapely()
 
         gdf = gpd.GeoDataFrame(geometry=polygons)
 
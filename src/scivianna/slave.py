@@ -3,14 +3,17 @@ import panel as pn
 from pathlib import Path
 import os
 import multiprocessing as mp
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection, wait
+import threading
 import dill
 import traceback
 
-import time
 import pandas as pd
 from typing import Any, List, Dict, Tuple, Type, Union
 
 from scivianna.data.data2d import Data2D
+from scivianna.data.shared_data import SharedData2D, map_data_2d, share_data_2d
 
 from scivianna.interface.generic_interface import (
     GenericInterface,
@@ -86,225 +89,254 @@ class SlaveCommand:
     """Custom call to transfer to the interface to ease extension development"""
 
 
+class SlaveReply:
+    """Class defining the tags of the messages sent back by the compute slaves"""
+
+    RESULT = "result"
+    """The message contains the value returned by the interface"""
+    ERROR = "error"
+    """The message contains the exception raised by the interface"""
+
+
 def worker(
-    q_tasks: mp.Queue,
-    q_returns: mp.Queue,
-    q_errors: mp.Queue,
+    connection: Connection,
     code_interface: Type[GenericInterface],
+    shared_memory_transport: bool = False,
 ):
-    """Creates a worker that will forward the panel requests to the GenericInterface on another process
+    """Creates a worker that will forward the panel requests to the GenericInterface on another process.
+
+    The worker blocks on the connection until a task is received, and sends back a single (SlaveReply, value) message per task.
+    While no task is pending, the interface idle_task is called.
 
     Parameters
     ----------
-    q_tasks : mp.Queue
-        Queue containing the tasks
-    q_returns : mp.Queue
-        Queue to return the results
+    connection : Connection
+        Worker end of the pipe connecting the worker to the ComputeSlave
     code_interface : Type[GenericInterface]
         GenericInterface to instanciate.
+    shared_memory_transport : bool, optional
+        Send the computed Data2D arrays through a shared memory block instead of pickling them, by default False
     """
     code_: GenericInterface = code_interface()
 
     while True:
+        #   Background work of the interface, interrupted as soon as a task is received
+        try:
+            while not connection.poll() and code_.idle_task():
+                pass
+        except Exception:
+            traceback.print_exc()
+
         try:
-            if not q_tasks.empty():
-                task, data = q_tasks.get()
-
-                #   GenericInterface functions
-                if task == SlaveCommand.READ_FILE:
-                    code_.read_file(*data)
-                    q_returns.put("OK")
-
-                elif task == SlaveCommand.GET_LABELS:
-                    labels = code_.get_labels()
-                    q_returns.put(labels)
-
-                elif task == SlaveCommand.GET_LABEL_COLORING_MODE:
-                    field_name = data
-                    set_return = code_.get_label_coloring_mode(field_name)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.GET_FILE_INPUT_LIST:
-                    input_list = code_.get_file_input_list()
-                    q_returns.put(input_list)
-
-                elif task == SlaveCommand.SAVE:
-                    code_.save(*data)
-                    q_returns.put("OK")
-
-                elif task == SlaveCommand.LOAD:
-                    code_.load(*data)
-                    q_returns.put("OK")
-
-                #
-                #   Geometry2D functions
-                elif task == SlaveCommand.COMPUTE_2D_DATA:
-                    (
-                        u,
-                        v,
-                        u_min,
-                        u_max,
-                        v_min,
-                        v_max,
-                        w_value,
-                        q_tasks_,
-                        coloring_label,
-                        options,
-                    ) = data
-
-                    if not isinstance(code_, Geometry2D):
-                        raise TypeError(
-                            f"The requested panel is not associated to an Geometry2D, found class {type(code_)}."
-                        )
-                    data: Data2D
-                    data, polygons_updated = code_.compute_2D_data(
-                        u,
-                        v,
-                        u_min,
-                        u_max,
-                        v_min,
-                        v_max,
-                        w_value,
-                        q_tasks_,
-                        options,
+            task, data = connection.recv()
+        except EOFError:
+            #   The ComputeSlave end of the pipe was closed
+            break
+
+        try:
+            #   GenericInterface functions
+            if task == SlaveCommand.READ_FILE:
+                code_.read_file(*data)
+                connection.send((SlaveReply.RESULT, "OK"))
+
+            elif task == SlaveCommand.GET_LABELS:
+                labels = code_.get_labels()
+                connection.send((SlaveReply.RESULT, labels))
+
+            elif task == SlaveCommand.GET_LABEL_COLORING_MODE:
+                field_name = data
+                set_return = code_.get_label_coloring_mode(field_name)
+                connection.send((SlaveReply.RESULT, set_return))
+
+            elif task == SlaveCommand.GET_FILE_INPUT_LIST:
+                input_list = code_.get_file_input_list()
+                connection.send((SlaveReply.RESULT, input_list))
+
+            elif task == SlaveCommand.SAVE:
+                code_.save(*data)
+                connection.send((SlaveReply.RESULT, "OK"))
+
+            elif task == SlaveCommand.LOAD:
+                code_.load(*data)
+                connection.send((SlaveReply.RESULT, "OK"))
+
+            #
+            #   Geometry2D functions
+            elif task == SlaveCommand.COMPUTE_2D_DATA:
+                (
+                    u,
+                    v,
+                    u_min,
+                    u_max,
+                    v_min,
+                    v_max,
+                    w_value,
+                    q_tasks_,
+                    coloring_label,
+                    options,
+                ) = data
+
+                if not isinstance(code_, Geometry2D):
+                    raise TypeError(
+                        f"The requested panel is not associated to an Geometry2D, found class {type(code_)}."
                     )
+                data: Data2D
+                data, polygons_updated = code_.compute_2D_data(
+                    u,
+                    v,
+                    u_min,
+                    u_max,
+                    v_min,
+                    v_max,
+                    w_value,
+                    q_tasks_,
+                    options,
+                )
+
+                dict_value_per_cell = code_.get_value_dict(
+                    coloring_label, data.cell_ids, options
+                )
+
+                data.cell_values = [dict_value_per_cell[v] for v in data.cell_ids]
+
+                if shared_memory_transport:
+                    data = share_data_2d(data)
 
-                    dict_value_per_cell = code_.get_value_dict(
-                        coloring_label, data.cell_ids, options
+                connection.send((SlaveReply.RESULT, [data, polygons_updated]))
+
+            elif task == SlaveCommand.GET_VALUE_DICT:
+                if not isinstance(code_, Geometry2D):
+                    raise TypeError(
+                        f"The requested panel is not associated to an Geometry2D, found class {type(code_)}."
                     )
+                set_return = code_.get_value_dict(*data)
+                connection.send((SlaveReply.RESULT, set_return))
 
-                    data.cell_values = [dict_value_per_cell[v] for v in data.cell_ids]
+            elif task == SlaveCommand.GET_GEOMETRY_TYPE:
+                connection.send((SlaveReply.RESULT, code_.geometry_type))
 
-                    q_returns.put(
-                        [
-                            data,
-                            polygons_updated,
-                        ]
+            #   ValueAtLocation functions
+            elif task == SlaveCommand.GET_VALUE:
+                if not isinstance(code_, ValueAtLocation):
+                    raise TypeError(
+                        f"The requested panel is not associated to an ValueAtLocation, found class {type(code_)}."
                     )
+                set_return = code_.get_value(*data)
+                connection.send((SlaveReply.RESULT, set_return))
 
-                elif task == SlaveCommand.GET_VALUE_DICT:
-                    if not isinstance(code_, Geometry2D):
-                        raise TypeError(
-                            f"The requested panel is not associated to an Geometry2D, found class {type(code_)}."
-                        )
-                    set_return = code_.get_value_dict(*data)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.GET_GEOMETRY_TYPE:
-                    q_returns.put(code_.geometry_type)
-
-                #   ValueAtLocation functions
-                elif task == SlaveCommand.GET_VALUE:
-                    if not isinstance(code_, ValueAtLocation):
-                        raise TypeError(
-                            f"The requested panel is not associated to an ValueAtLocation, found class {type(code_)}."
-                        )
-                    set_return = code_.get_value(*data)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.GET_VALUES:
-                    if not isinstance(code_, ValueAtLocation):
-                        raise TypeError(
-                            f"The requested panel is not associated to an ValueAtLocation, found class {type(code_)}."
-                        )
-                    set_return = code_.get_values(*data)
-                    q_returns.put(set_return)
-
-                #
-                #   Value1DAtLocation functions
-                elif task == SlaveCommand.GET_1D_VALUE:
-                    if not isinstance(code_, Value1DAtLocation):
-                        raise TypeError(
-                            f"The requested panel is not associated to an Value1DAtLocation, found class {type(code_)}."
-                        )
-                    input_list = code_.get_1D_value(*data)
-                    q_returns.put(input_list)
-
-                #
-                #   OverLine functions
-                elif task == SlaveCommand.GET_1D_VALUE:
-                    if not isinstance(code_, OverLine):
-                        raise TypeError(
-                            f"The requested panel is not associated to an OverLine, found class {type(code_)}."
-                        )
-                    input_list = code_.compute_1D_line_data(*data)
-                    q_returns.put(input_list)
-
-                #
-                #   ICOCOInterface functions
-                elif task == SlaveCommand.GET_INPUT_MED_DOUBLEFIELD_TEMPLATE:
-                    if not isinstance(code_, IcocoInterface):
-                        raise TypeError(
-                            f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
-                        )
-                    field_name = data
-                    field_template: "medcoupling.MEDCouplingFieldDouble" = (
-                        code_.getInputMEDDoubleFieldTemplate(field_name)
+            elif task == SlaveCommand.GET_VALUES:
+                if not isinstance(code_, ValueAtLocation):
+                    raise TypeError(
+                        f"The requested panel is not associated to an ValueAtLocation, found class {type(code_)}."
+                    )
+                set_return = code_.get_values(*data)
+                connection.send((SlaveReply.RESULT, set_return))
+
+            #
+            #   Value1DAtLocation functions
+            elif task == SlaveCommand.GET_1D_VALUE:
+                if not isinstance(code_, Value1DAtLocation):
+                    raise TypeError(
+                        f"The requested panel is not associated to an Value1DAtLocation, found class {type(code_)}."
+                    )
+                input_list = code_.get_1D_value(*data)
+                connection.send((SlaveReply.RESULT, input_list))
+
+            #
+            #   OverLine functions
+            elif task == SlaveCommand.COMPUTE_1D_LINE_DATA:
+                if not isinstance(code_, OverLine):
+                    raise TypeError(
+                        f"The requested panel is not associated to an OverLine, found class {type(code_)}."
                     )
-                    q_returns.put(field_template)
-
-                elif task == SlaveCommand.SET_INPUT_MED_DOUBLEFIELD:
-                    if not isinstance(code_, IcocoInterface):
-                        raise TypeError(
-                            f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
-                        )
-                    field_name, field = data
-                    set_return = code_.setInputMEDDoubleField(field_name, field)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.SET_TIME:
-                    time_ = data[0]
-                    if not isinstance(code_, IcocoInterface):
-                        raise TypeError(
-                            f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
-                        )
-                    set_return = code_.setTime(time_)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.SET_INPUT_DOUBLE_VALUE:
-                    name, val = data
-                    if not isinstance(code_, IcocoInterface):
-                        raise TypeError(
-                            f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
-                        )
-                    set_return = code_.setInputDoubleValue(name, val)
-                    q_returns.put(set_return)
-
-                elif task == SlaveCommand.CUSTOM:
-                    function_name, arguments = data
-                    q_returns.put(code_.__getattribute__(function_name)(**arguments))
+                input_list = code_.compute_1D_line_data(*data)
+                connection.send((SlaveReply.RESULT, input_list))
+
+            #
+            #   ICOCOInterface functions
+            elif task == SlaveCommand.GET_INPUT_MED_DOUBLEFIELD_TEMPLATE:
+                if not isinstance(code_, IcocoInterface):
+                    raise TypeError(
+                        f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
+                    )
+                field_name = data
+                field_template: "medcoupling.MEDCouplingFieldDouble" = (
+                    code_.getInputMEDDoubleFieldTemplate(field_name)
+                )
+                connection.send((SlaveReply.RESULT, field_template))
+
+            elif task == SlaveCommand.SET_INPUT_MED_DOUBLEFIELD:
+                if not isinstance(code_, IcocoInterface):
+                    raise TypeError(
+                        f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
+                    )
+                field_name, field = data
+                set_return = code_.setInputMEDDoubleField(field_name, field)
+                connection.send((SlaveReply.RESULT, set_return))
+
+            elif task == SlaveCommand.SET_TIME:
+                time_ = data[0]
+                if not isinstance(code_, IcocoInterface):
+                    raise TypeError(
+                        f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
+                    )
+                set_return = code_.setTime(time_)
+                connection.send((SlaveReply.RESULT, set_return))
+
+            elif task == SlaveCommand.SET_INPUT_DOUBLE_VALUE:
+                name, val = data
+                if not isinstance(code_, IcocoInterface):
+                    raise TypeError(
+                        f"The requested panel is not associated to an IcocoInterface, found class {type(code_)}."
+                    )
+                set_return = code_.setInputDoubleValue(name, val)
+                connection.send((SlaveReply.RESULT, set_return))
+
+            elif task == SlaveCommand.CUSTOM:
+                function_name, arguments = data
+                connection.send((SlaveReply.RESULT, code_.__getattribute__(function_name)(**arguments)))
 
             else:
-                time.sleep(0.1)
+                #   Every task must get an answer, otherwise the ComputeSlave would wait forever
+                raise ValueError(f"Unknown slave command {task}.")
 
         except Exception as e:
             traceback.print_exc()
-            q_errors.put(e)
+            try:
+                connection.send((SlaveReply.ERROR, e))
+            except Exception:
+                #   The exception itself can't be pickled, its description is sent instead
+                connection.send((SlaveReply.ERROR, RuntimeError(repr(e))))
 
 
 class ComputeSlave:
     """Class that creates a subprocess to interface with the code."""
 
-    def __init__(self, code_interface: Type[GenericInterface]):
+    def __init__(self, code_interface: Type[GenericInterface], shared_memory_transport: bool = False):
         """ComputeSlave constructor
 
         Parameters
         ----------
         code_interface : Type[GenericInterface]
             Class of the GenericInterface
+        shared_memory_transport : bool, optional
+            Receive the computed Data2D arrays through shared memory blocks instead of pickling them, by default False
         """
         self.p: mp.Process = None
         """ Subprocess hosting the worker
         """
-        self.q_tasks: mp.Queue = None
-        """ Queue in which the tasks are pushed
+        self.connection: Connection = None
+        """ Pipe end through which the tasks are sent and the results/errors received
         """
-        self.q_returns: mp.Queue = None
-        """ Queue to get the results
+        self.lock = threading.Lock()
+        """ Lock preventing two requests to be sent to the worker at the same time
         """
         self.code_interface: Type[GenericInterface] = code_interface
         """ Code interface class
         """
+        self.shared_memory_transport: bool = shared_memory_transport
+        """ The computed Data2D arrays are received through shared memory blocks
+        """
         self.file_read: List[Tuple[str, str]] = []
         """ List of file read and their associated key.
         """
@@ -319,15 +351,21 @@ class ComputeSlave:
         print("RESETING SLAVE.")
         if self.p is not None:
             self.p.kill()
+        if self.connection is not None:
+            self.connection.close()
 
-        self.q_tasks = mp.Queue()
-        self.q_returns = mp.Queue()
-        self.q_errors = mp.Queue()
+        if self.shared_memory_transport:
+            #   The worker must use the same resource tracker, otherwise the blocks would be unlinked when it stops
+            resource_tracker.ensure_running()
+
+        self.connection, worker_connection = mp.Pipe()
         self.p = mp.Process(
             target=worker,
-            args=(self.q_tasks, self.q_returns, self.q_errors, self.code_interface)
+            args=(worker_connection, self.code_interface, self.shared_memory_transport)
         )
         self.p.start()
+        #   The worker process owns its own copy of this end
+        worker_connection.close()
         self.running = True
         self.ongoing_request = False
 
@@ -374,14 +412,15 @@ class ComputeSlave:
             Command and arguments to send to the slave
         """
 
-        while self.ongoing_request:
-            time.sleep(0.1)
+        with self.lock:
+            if not self.running:
+                return
 
-        self.ongoing_request = True
-        self.q_tasks.put(argument)
+            self.ongoing_request = True
+            self.connection.send(argument)
 
-        value = self.get_result_or_error()
-        self.ongoing_request = False
+            value = self.get_result_or_error()
+            self.ongoing_request = False
         return value
 
     def get_labels(
@@ -469,7 +508,7 @@ class ComputeSlave:
         Tuple[Data2D, bool]
             Data2D object containing the geometry, whether the polygons were updated
         """
-        return self.__get_function(
+        value = self.__get_function(
             [
                 SlaveCommand.COMPUTE_2D_DATA,
                 [
@@ -487,6 +526,11 @@ class ComputeSlave:
             ]
         )
 
+        if value is not None and isinstance(value[0], SharedData2D):
+            value[0] = map_data_2d(value[0])
+
+        return value
+
     def get_value_dict(
         self, value_label: str, cells: List[Union[int, str]], options: Dict[str, Any]
     ) -> Dict[Union[int, str], str]:
@@ -733,7 +777,7 @@ class ComputeSlave:
         ComputeSlave
             ComputeSlave copy.
         """
-        duplicata = ComputeSlave(self.code_interface)
+        duplicata = ComputeSlave(self.code_interface, self.shared_memory_transport)
 
         duplicata.reset()
 
@@ -751,37 +795,42 @@ class ComputeSlave:
             self.p.terminate()
 
     def get_result_or_error(self):
-        """Gets the return value from the process. If an error was sent, raise the error instead.
+        """Gets the return value from the process. If an error was sent, a notification is displayed and None is returned instead.
+
+        The call blocks until either a reply is received or the worker process stops.
 
         Returns
         -------
         Any
             Any returned data from the process
-
-        Raises
-        ------
-        error
-            Any error sent by the slave
         """
-        while (not self.p._closed) and (self.q_errors.empty() and self.q_returns.empty()):
-            time.sleep(.05)
+        wait([self.connection, self.p.sentinel])
 
         if not self.running:
             return
 
         self.ongoing_request = False
-        if not self.q_errors.empty():
-            error: Exception = self.q_errors.get()
+        try:
+            reply, value = self.connection.recv()
+        except EOFError:
+            #   The worker process stopped without answering
+            self.running = False
+            pn.state.notifications.error(f"Slave process of {self.code_interface.__name__} stopped, restoring data.")
+            return None
+
+        if reply == SlaveReply.ERROR:
+            error: Exception = value
             pn.state.notifications.error(f"Error {error}, restoring data.")
 
             return None
         else:
-            return self.q_returns.get()
+            return value
 
     def wait_available(self,):
-        while self.ongoing_request:
-            time.sleep(0.05)
-        return
+        """Blocks until the ongoing request, if any, is answered
+        """
+        with self.lock:
+            pass
 
     def call_custom_function(self, function_name: str, arguments: Dict[str, Any]):
         """Call an custom function meant to ease extension developments
@@ -49,6 +49,14 @@ color_maps = {
     "terrain" : ["#333399", "#1175db", "#00b2b2", "#31d56f", "#99ea84", "#fefd98", "#ccbd7d", "#987b61", "#997c76", "#cdbfbb", "#ffffff"],
 }
 
+COLOR_MAP_LUT_SIZE = 1024
+"""Number of colors in the colormaps lookup tables"""
+
+color_maps_rgb = {
+    c:np.array([(int(h[1:3], 16) , int(h[3:5], 16) , int(h[5:7], 16)) for h in color_maps[c]], dtype=float)/255 for c in color_maps
+}
+"""RGB colors of each color map of color_maps, ranging from 0 to 1"""
+
 def get_edges_colors(face_colors:np.ndarray) -> np.ndarray:
     """Returnds the edge colors from the face colors
 
@@ -62,12 +70,15 @@ def get_edges_colors(face_colors:np.ndarray) -> np.ndarray:
     np.ndarray
         Face colors
     """
-    edge_colors:np.ndarray = face_colors.copy()
+    face_colors = np.asarray(face_colors)
+
+    # Integer colors are darkened in int16 to avoid uint8 wrapping around
+    edge_colors:np.ndarray = face_colors.astype(np.int16 if face_colors.dtype.kind in "biu" else float)
 
     # Darkening the colors
     edge_colors[:, :3] -= 20
 
-    return np.where(edge_colors<0, 0, edge_colors)
+    return np.where(edge_colors<0, 0, edge_colors).astype(face_colors.dtype)
 
 def interpolate_cmap_at_values(
     cmap_name: str, values: np.ndarray
@@ -87,8 +98,7 @@ def interpolate_cmap_at_values(
         RGBA 255 colors per value in values
     """ 
 
-    cmap = color_maps[cmap_name]
-    colors = np.array([(int(c[1:3], 16) , int(c[3:5], 16) , int(c[5:7], 16)) for c in cmap]).astype(float)/255
+    colors = color_maps_rgb[cmap_name]
 
     r = colors[:, 0]
     g = colors[:, 1]
@@ -112,4 +122,39 @@ def interpolate_cmap_at_values(
 
 beautiful_color_maps = {
     c:[list(e)[:3] for e in interpolate_cmap_at_values(c, np.arange(0, 1, 0.01))] for c in color_maps
-}
\ No newline at end of file
+}
+
+color_map_luts = {
+    c:interpolate_cmap_at_values(c, np.linspace(0., 1., COLOR_MAP_LUT_SIZE)).astype(np.uint8) for c in color_maps
+}
+"""uint8 RGBA lookup table of COLOR_MAP_LUT_SIZE colors for each color map of color_maps"""
+
+def colors_from_lut(
+    cmap_name: str, values: np.ndarray, nan_color: Tuple[int, int, int, int] = (0, 0, 0, 0)
+) -> np.ndarray:
+    """Returns the uint8 RGBA colors of values ranging from 0 to 1, taken from the color map lookup table. 
+    The values out of range get the color of the closest bound.
+
+    Parameters
+    ----------
+    cmap_name : str
+        Name of the cmaps to get from scivianna.utils.color_tools.color_map_luts
+    values : np.ndarray
+        Values to color
+    nan_color : Tuple[int, int, int, int], optional
+        Color of the NaN values, by default (0, 0, 0, 0)
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (len(values), 4)
+    """
+    lut = color_map_luts[cmap_name]
+    values = np.asarray(values, dtype=float)
+    nan = np.isnan(values)
+
+    indexes = np.rint(np.clip(np.where(nan, 0., values), 0., 1.) * (len(lut) - 1)).astype(np.intp)
+    colors = lut.take(indexes, axis=0)
+    colors[nan] = nan_color
+
+    return colors
@@ -276,7 +276,7 @@ class ExtrudedStructuredMesh(Geometry2D):
                     cell_id,
                 )
         self.polygons = list(polygon_elements.values())
-        self.past_computation == [*list(u), *list(v), *list(origin)]
+        self.past_computation = [*list(u), *list(v), *list(origin)]
         
         return self.polygons
 
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+
+class LRUCache:
+    """Least recently used cache bounded by the total size of its values.
+
+    When storing a value makes the cache exceed its budget, the least recently used values are evicted until it fits again.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]):
+        """LRUCache constructor
+
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum total size of the cached values, in bytes
+        sizeof : Callable[[Any], int]
+            Function returning the size in bytes of a cached value
+        """
+        self.max_bytes: int = max_bytes
+        """Maximum total size of the cached values, in bytes"""
+        self.sizeof: Callable[[Any], int] = sizeof
+        """Function returning the size in bytes of a cached value"""
+        self.nbytes: int = 0
+        """Current total size of the cached values, in bytes"""
+        self.hits: int = 0
+        """Number of get calls that found their key"""
+        self.misses: int = 0
+        """Number of get calls that did not find their key"""
+        self.evictions: int = 0
+        """Number of values removed to respect the budget"""
+
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the value stored at key and marks it as the most recently used, None if the key is not cached
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the requested value
+
+        Returns
+        -------
+        Optional[Any]
+            Cached value
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any):
+        """Stores value at key, evicting the least recently used values if the budget is exceeded.
+        A value larger than the whole budget is not stored.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the value
+        value : Any
+            Value to store
+        """
+        self.pop(key)
+
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (value, size)
+        self.nbytes += size
+
+        self._evict()
+
+    def resize(self, max_bytes: int):
+        """Changes the budget of the cache, evicting the least recently used values if it is exceeded
+
+        Parameters
+        ----------
+        max_bytes : int
+            New maximum total size of the cached values, in bytes
+        """
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        """Removes the least recently used values until the budget is respected"""
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.nbytes -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Removes the value stored at key and returns it, None if the key is not cached
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the value to remove
+
+        Returns
+        -------
+        Optional[Any]
+            Removed value
+        """
+        if key not in self._entries:
+            return None
+
+        value, size = self._entries.pop(key)
+        self.nbytes -= size
+        return value
+
+    def clear(self):
+        """Removes all cached values, the counters are kept"""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def keys(self) -> Iterator[Hashable]:
+        """Iterates over the cached keys, from the least to the most recently used
+
+        Returns
+        -------
+        Iterator[Hashable]
+            Cached keys
+        """
+        return iter(list(self._entries.keys()))
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterates over the cached (key, value) couples, from the least to the most recently used, without changing their order
+
+        Returns
+        -------
+        Iterator[Tuple[Hashable, Any]]
+            Cached items
+        """
+        return iter([(key, value) for key, (value, _) in self._entries.items()])
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -23,15 +23,15 @@ class PolygonSorter:
         data : Data2D
             Data2D object containing the geometry properties
         """
-        values_list:List[Union[int, str]] = data.cell_values
+        values_list:np.ndarray = data.cell_values
 
         assert len(data.cell_ids) == len(data.cell_colors), "The Data2D object must have the same number of cell id and colors"
         assert len(data.cell_ids) == len(data.cell_edge_colors), "The Data2D object must have the same number of cell id and edge colors"
         assert len(data.cell_values) == len(data.cell_colors), "The Data2D object must have the same number of cell values and colors"
         if data.data_type == DataType.POLYGONS:
-            assert len(data.cell_values) == len(data.polygons), "The Data2D object must have the same number of cell values and polygons"
+            assert len(data.cell_values) == data.get_polygon_count(), "The Data2D object must have the same number of cell values and polygons"
 
-        if any(isinstance(item, str) for item in values_list):
+        if values_list.dtype == object:
             assert all(isinstance(item, str) for item in values_list), "If any of the values is a string, they all must be"
 
         # Sorting the polygons per color in order to prevent overlaping edges of different colors
@@ -57,13 +57,13 @@ class PolygonSorter:
         assert len(data.cell_edge_colors) == len(self.sort_indexes), f"Given cell edge colors list has a different length from the sorted indexes, respectively found {len(data.cell_edge_colors)} and {len(self.sort_indexes)}."
         assert len(data.cell_ids) == len(self.sort_indexes), f"Given cell ID list has a different length from the sorted indexes, respectively found {len(data.cell_ids)} and {len(self.sort_indexes)}."
         
-        data.cell_ids = np.array(data.cell_ids)[self.sort_indexes].tolist()
-        data.cell_colors = np.array(data.cell_colors)[self.sort_indexes].tolist()
-        data.cell_values = np.array(data.cell_values)[self.sort_indexes].tolist()
-        data.cell_edge_colors = np.array(data.cell_edge_colors)[self.sort_indexes].tolist()
+        data.cell_ids = data.cell_ids[self.sort_indexes]
+        data.cell_colors = data.cell_colors[self.sort_indexes]
+        data.cell_values = data.cell_values[self.sort_indexes]
+        data.cell_edge_colors = data.cell_edge_colors[self.sort_indexes]
         
         if data.data_type == DataType.POLYGONS:
-            data.polygons = [data.polygons[i] for i in self.sort_indexes]
+            data.take_polygons(self.sort_indexes)
 
     def reset_indexes(self, *args, **kwargs):
         """Clears the saved sort indexes.
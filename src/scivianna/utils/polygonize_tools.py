@@ -1,21 +1,27 @@
+import concurrent.futures
 import math
+import os
 from typing import Any, Dict, List, Tuple, Type, Union
 import numpy as np
 
-import rasterio
-import rasterio.features
-from rasterio.transform import Affine 
-
 import shapely
-from shapely.geometry.polygon import Polygon
-from shapely.geometry import shape
+
+from scivianna.enums import Polygonizer
+
+POLYGONIZE_TILE_SIZE = 2048
+"""Suggested side in pixels of the tiles polygonized in parallel"""
+INCREMENTAL_BLOCK_SIZE = 32
+"""Side in pixels of the blocks compared to find the changed regions of a grid"""
+INCREMENTAL_MAX_FRACTION = 0.5
+"""Fraction of the grid area above which a changed grid is polygonized again entirely"""
 
 class PolygonCoords:
     """Object ontaining the X and Y coordinates of a polygon
     """
     def __init__(self, 
                     x_coords:Union[List[float], np.ndarray], 
-                    y_coords:Union[List[float], np.ndarray]):
+                    y_coords:Union[List[float], np.ndarray],
+                    copy:bool = True):
         """PolygonCoords object constructor.
 
         Parameters
@@ -24,6 +30,8 @@ class PolygonCoords:
             X coordinates of the polygon vertices
         y_coords : Union[List[float], np.ndarray]
             Y coordinates of the polygon vertices
+        copy : bool, optional
+            Copy the coordinates, if False, numpy arrays are stored as is (and may be views on a larger buffer), by default True
         """
         if type(x_coords) not in (list, np.ndarray):
             raise TypeError(f"x_coords must be a numpy array or list, found {type(x_coords)}")
@@ -33,10 +41,10 @@ class PolygonCoords:
         if len(x_coords) != len(y_coords):
             raise ValueError(f"Given polygons coords must have the same length, found {len(x_coords)} and {len(y_coords)}")
         
-        self.x_coords:np.ndarray = np.array(x_coords)
+        self.x_coords:np.ndarray = np.array(x_coords) if copy else np.asarray(x_coords)
         """ X coordinate of each vertex of a polygon
         """
-        self.y_coords:np.ndarray = np.array(y_coords)
+        self.y_coords:np.ndarray = np.array(y_coords) if copy else np.asarray(y_coords)
         """ Y coordinate of each vertex of a polygon
         """
         
@@ -161,12 +169,12 @@ class PolygonElement:
                 np.array([
                     self.exterior_polygon.x_coords, 
                     self.exterior_polygon.y_coords
-                ]),
+                ]).T,
                 [
                     np.array([
                         h.x_coords, 
                         h.y_coords
-                    ]) for h in self.holes
+                    ]).T for h in self.holes
                 ]
             )
         else:
@@ -185,11 +193,449 @@ class PolygonElement:
                 ]
             )
 
+def concatenated_ranges(starts:np.ndarray, counts:np.ndarray) -> np.ndarray:
+    """Returns the concatenation of the ranges [starts[i], starts[i] + counts[i]) without python loop
+
+    Parameters
+    ----------
+    starts : np.ndarray
+        First index of each range
+    counts : np.ndarray
+        Length of each range
+
+    Returns
+    -------
+    np.ndarray
+        Concatenated indexes
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    range_offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - range_offsets, counts) + np.arange(counts.sum(), dtype=np.int64)
+
+class PackedPolygons:
+    """Polygon list stored in flat arrays: the vertices of all rings are concatenated in a single coordinate buffer, 
+    ring_offsets gives the first vertex of each ring, and polygon_offsets the first ring of each polygon (the exterior ring, followed by the holes).
+
+    The object behaves as a sequence of PolygonElement, the items being built on demand.
+    """
+    def __init__(self, 
+                    x_coords:np.ndarray, 
+                    y_coords:np.ndarray, 
+                    ring_offsets:np.ndarray, 
+                    polygon_offsets:np.ndarray, 
+                    cell_ids:Union[List[Union[int, str]], np.ndarray],
+                    compos:Union[List[str], np.ndarray] = None):
+        """PackedPolygons object constructor.
+
+        Parameters
+        ----------
+        x_coords : np.ndarray
+            X coordinates of the vertices of all rings
+        y_coords : np.ndarray
+            Y coordinates of the vertices of all rings
+        ring_offsets : np.ndarray
+            Index of the first vertex of each ring, followed by the vertices count
+        polygon_offsets : np.ndarray
+            Index of the first ring of each polygon, followed by the rings count
+        cell_ids : Union[List[Union[int, str]], np.ndarray]
+            Cell id associated to each polygon
+        compos : Union[List[str], np.ndarray], optional
+            Composition of each polygon, by default None
+        """
+        self.x_coords:np.ndarray = np.asarray(x_coords, dtype=float)
+        """ X coordinates of the vertices of all rings
+        """
+        self.y_coords:np.ndarray = np.asarray(y_coords, dtype=float)
+        """ Y coordinates of the vertices of all rings
+        """
+        self.ring_offsets:np.ndarray = np.asarray(ring_offsets, dtype=np.int64)
+        """ Index of the first vertex of each ring, followed by the vertices count
+        """
+        self.polygon_offsets:np.ndarray = np.asarray(polygon_offsets, dtype=np.int64)
+        """ Index of the first ring of each polygon, followed by the rings count
+        """
+        self.cell_ids:np.ndarray = np.asarray(cell_ids) if len(cell_ids) > 0 else np.zeros(0, dtype=np.int64)
+        """ Cell id associated to each polygon
+        """
+        self.compos:np.ndarray = None if compos is None else np.asarray(compos, dtype=object)
+        """ Composition of each polygon, None if not defined
+        """
+
+        if len(self.x_coords) != len(self.y_coords):
+            raise ValueError(f"Given polygons coords must have the same length, found {len(self.x_coords)} and {len(self.y_coords)}")
+        if self.ring_offsets[-1] != len(self.x_coords):
+            raise ValueError(f"The last ring offset must be the vertices count, found {self.ring_offsets[-1]} and {len(self.x_coords)}")
+        if self.polygon_offsets[-1] != len(self.ring_offsets) - 1:
+            raise ValueError(f"The last polygon offset must be the rings count, found {self.polygon_offsets[-1]} and {len(self.ring_offsets) - 1}")
+        if len(self.cell_ids) != len(self):
+            raise ValueError(f"A cell id is expected per polygon, found {len(self.cell_ids)} for {len(self)} polygons")
+
+    @classmethod
+    def empty(cls) -> "PackedPolygons":
+        """Returns a PackedPolygons containing no polygon
+
+        Returns
+        -------
+        PackedPolygons
+            Empty polygon list
+        """
+        return cls(np.zeros(0), np.zeros(0), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), [])
+
+    @classmethod
+    def from_polygon_list(cls, polygons:List[PolygonElement]) -> "PackedPolygons":
+        """Packs a list of PolygonElement
+
+        Parameters
+        ----------
+        polygons : List[PolygonElement]
+            Polygons to pack
+
+        Returns
+        -------
+        PackedPolygons
+            Packed polygons
+        """
+        if isinstance(polygons, PackedPolygons):
+            return polygons
+        if len(polygons) == 0:
+            return cls.empty()
+
+        rings:List[PolygonCoords] = []
+        rings_per_polygon = np.empty(len(polygons), dtype=np.int64)
+        for i, polygon in enumerate(polygons):
+            rings.append(polygon.exterior_polygon)
+            rings.extend(polygon.holes)
+            rings_per_polygon[i] = 1 + len(polygon.holes)
+
+        ring_sizes = np.fromiter((len(r.x_coords) for r in rings), dtype=np.int64, count=len(rings))
+
+        compos = [p.compo for p in polygons]
+
+        return cls(
+            np.concatenate([r.x_coords for r in rings]),
+            np.concatenate([r.y_coords for r in rings]),
+            np.concatenate([[0], np.cumsum(ring_sizes)]),
+            np.concatenate([[0], np.cumsum(rings_per_polygon)]),
+            [p.cell_id for p in polygons],
+            compos if any(c != "" for c in compos) else None,
+        )
+
+    def to_polygon_list(self, copy:bool = True) -> List[PolygonElement]:
+        """Builds the PolygonElement list
+
+        Parameters
+        ----------
+        copy : bool, optional
+            Copy the coordinates, if False, the PolygonCoords are views on the packed buffers, by default True
+
+        Returns
+        -------
+        List[PolygonElement]
+            Polygon list
+        """
+        return [self.get_polygon(i, copy) for i in range(len(self))]
+
+    def get_polygon(self, index:int, copy:bool = False) -> PolygonElement:
+        """Builds the PolygonElement at the given index
+
+        Parameters
+        ----------
+        index : int
+            Polygon index
+        copy : bool, optional
+            Copy the coordinates, if False, the PolygonCoords are views on the packed buffers, by default False
+
+        Returns
+        -------
+        PolygonElement
+            Requested polygon
+        """
+        first_ring, last_ring = self.polygon_offsets[index], self.polygon_offsets[index + 1]
+        rings = [
+            PolygonCoords(
+                self.x_coords[self.ring_offsets[r]:self.ring_offsets[r + 1]], 
+                self.y_coords[self.ring_offsets[r]:self.ring_offsets[r + 1]], 
+                copy=copy
+            ) for r in range(first_ring, last_ring)
+        ]
+        polygon = PolygonElement(rings[0], rings[1:], self.cell_ids[index])
+        if self.compos is not None:
+            polygon.compo = self.compos[index]
+        return polygon
+
+    def __len__(self) -> int:
+        return len(self.polygon_offsets) - 1
+
+    def __getitem__(self, index:Union[int, slice, np.ndarray]) -> Union[PolygonElement, "PackedPolygons"]:
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Polygon index {index} out of range for {len(self)} polygons")
+            return self.get_polygon(index)
+        return self.take(np.arange(len(self))[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get_polygon(i)
+
+    @property
+    def nbytes(self) -> int:
+        """Size in bytes of the stored arrays"""
+        return sum(
+            array.nbytes 
+            for array in (self.x_coords, self.y_coords, self.ring_offsets, self.polygon_offsets, self.cell_ids) 
+        )
+
+    def take(self, indexes:np.ndarray) -> "PackedPolygons":
+        """Returns the polygons at the given indexes, in the given order
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the polygons to keep
+
+        Returns
+        -------
+        PackedPolygons
+            Selected polygons
+        """
+        indexes = np.asarray(indexes, dtype=np.int64)
+
+        rings_count = np.diff(self.polygon_offsets)[indexes]
+        rings = concatenated_ranges(self.polygon_offsets[:-1][indexes], rings_count)
+
+        vertices_count = np.diff(self.ring_offsets)[rings]
+        vertices = concatenated_ranges(self.ring_offsets[:-1][rings], vertices_count)
+
+        return PackedPolygons(
+            self.x_coords[vertices],
+            self.y_coords[vertices],
+            np.concatenate([[0], np.cumsum(vertices_count)]),
+            np.concatenate([[0], np.cumsum(rings_count)]),
+            self.cell_ids[indexes],
+            None if self.compos is None else self.compos[indexes],
+        )
+
+    @classmethod
+    def concatenate(cls, polygons_list:List["PackedPolygons"]) -> "PackedPolygons":
+        """Concatenates several PackedPolygons in a single one. The compositions are dropped unless defined in all of them.
+
+        Parameters
+        ----------
+        polygons_list : List[PackedPolygons]
+            Polygons to concatenate
+
+        Returns
+        -------
+        PackedPolygons
+            Concatenated polygons
+        """
+        polygons_list = [polygons for polygons in polygons_list if len(polygons) > 0]
+        if len(polygons_list) == 0:
+            return cls.empty()
+
+        vertices_offsets = np.cumsum([0] + [len(polygons.x_coords) for polygons in polygons_list])
+        rings_offsets = np.cumsum([0] + [len(polygons.ring_offsets) - 1 for polygons in polygons_list])
+
+        compos = None
+        if all(polygons.compos is not None for polygons in polygons_list):
+            compos = np.concatenate([polygons.compos for polygons in polygons_list])
+
+        return cls(
+            np.concatenate([polygons.x_coords for polygons in polygons_list]),
+            np.concatenate([polygons.y_coords for polygons in polygons_list]),
+            np.concatenate([[0]] + [polygons.ring_offsets[1:] + offset for polygons, offset in zip(polygons_list, vertices_offsets)]),
+            np.concatenate([[0]] + [polygons.polygon_offsets[1:] + offset for polygons, offset in zip(polygons_list, rings_offsets)]),
+            np.concatenate([polygons.cell_ids for polygons in polygons_list]),
+            compos,
+        )
+
+    def copy(self) -> "PackedPolygons":
+        """Returns a copy of self
+
+        Returns
+        -------
+        PackedPolygons
+            Identical copy of self
+        """
+        return PackedPolygons(
+            self.x_coords.copy(),
+            self.y_coords.copy(),
+            self.ring_offsets.copy(),
+            self.polygon_offsets.copy(),
+            self.cell_ids.copy(),
+            None if self.compos is None else self.compos.copy(),
+        )
+
+    def translate(self, dx:float, dy:float):
+        """Translates all the polygons by (dx, dy)
+
+        Parameters
+        ----------
+        dx : float
+            Horizontal offset
+        dy : float
+            Vertical offset
+        """
+        self.x_coords += dx
+        self.y_coords += dy
+
+    def rotate(self, origin:Tuple[float, float], angle:float):
+        """Rotate all the polygons by the angle around the origin
+
+        Parameters
+        ----------
+        origin : Tuple[float, float]
+            Rotation origin
+        angle : float
+            Angle (in radians)
+        """
+        dx = self.x_coords - origin[0]
+        dy = self.y_coords - origin[1]
+
+        self.x_coords = dx*np.cos(angle) - dy*np.sin(angle) + origin[0]
+        self.y_coords = dx*np.sin(angle) + dy*np.cos(angle) + origin[1]
+
+    def bounds(self) -> np.ndarray:
+        """Returns the bounding box of each polygon, computed from its exterior ring
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (polygon_count, 4) containing (x_min, y_min, x_max, y_max) per polygon
+        """
+        if len(self) == 0:
+            return np.zeros((0, 4))
+
+        exterior_rings = self.polygon_offsets[:-1]
+        starts = self.ring_offsets[exterior_rings]
+        ends = self.ring_offsets[exterior_rings + 1]
+
+        #   reduceat reduces from each start to the next start, the exterior ring end is used by masking the holes vertices
+        ring_index = np.repeat(np.arange(len(self.ring_offsets) - 1), np.diff(self.ring_offsets))
+        is_exterior = np.zeros(len(self.ring_offsets) - 1, dtype=bool)
+        is_exterior[exterior_rings] = True
+        exterior_vertices = is_exterior[ring_index]
+
+        x = np.where(exterior_vertices, self.x_coords, np.nan)
+        y = np.where(exterior_vertices, self.y_coords, np.nan)
+
+        valid = ends > starts
+        bounds = np.full((len(self), 4), np.nan)
+        bounds[valid, 0] = np.fmin.reduceat(x, starts[valid])
+        bounds[valid, 1] = np.fmin.reduceat(y, starts[valid])
+        bounds[valid, 2] = np.fmax.reduceat(x, starts[valid])
+        bounds[valid, 3] = np.fmax.reduceat(y, starts[valid])
+
+        return bounds
+
+    @classmethod
+    def from_shapely(cls, polygons:np.ndarray, cell_ids:Union[List[Union[int, str]], np.ndarray]) -> "PackedPolygons":
+        """Packs an array of shapely polygons without iterating over their vertices
+
+        Parameters
+        ----------
+        polygons : np.ndarray
+            Array of shapely Polygon
+        cell_ids : Union[List[Union[int, str]], np.ndarray]
+            Cell id associated to each polygon
+
+        Returns
+        -------
+        PackedPolygons
+            Packed polygons
+        """
+        if len(polygons) == 0:
+            return cls.empty()
+
+        _, coords, (ring_offsets, polygon_offsets) = shapely.to_ragged_array(polygons)
+
+        return cls(coords[:, 0], coords[:, 1], ring_offsets, polygon_offsets, cell_ids)
+
+    def to_shapely(self, z_coord:float = None) -> np.ndarray:
+        """Returns the shapely Polygon version of each polygon, at the vertical coordinate z_coord
+
+        Parameters
+        ----------
+        z_coord : float, optional
+            If provided, the polygons are 3D at the given height, by default None
+
+        Returns
+        -------
+        np.ndarray
+            Array of shapely polygons
+        """
+        #   shapely expects closed rings: the first vertex is repeated at the end of the rings that are not closed yet
+        starts = self.ring_offsets[:-1]
+        ends = self.ring_offsets[1:]
+        open_rings = np.zeros(len(starts), dtype=bool)
+        if len(self.x_coords) > 0:
+            first = np.minimum(starts, len(self.x_coords) - 1)
+            last = np.maximum(ends - 1, 0)
+            open_rings = (ends > starts) & (
+                (self.x_coords[first] != self.x_coords[last]) | (self.y_coords[first] != self.y_coords[last])
+            )
+
+        x = np.insert(self.x_coords, ends[open_rings], self.x_coords[starts[open_rings]])
+        y = np.insert(self.y_coords, ends[open_rings], self.y_coords[starts[open_rings]])
+        ring_offsets = self.ring_offsets + np.concatenate([[0], np.cumsum(open_rings)])
+
+        if z_coord is None:
+            coords = np.stack([x, y], axis=1)
+        else:
+            coords = np.stack([x, y, np.full(len(x), z_coord)], axis=1)
+
+        return shapely.from_ragged_array(shapely.GeometryType.POLYGON, coords, (ring_offsets, self.polygon_offsets))
+
+
+def index_values(arr:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Lists the values found in an array, and replaces each element by the index of its value.
+    Integer arrays spanning a range smaller than their size are indexed through a lookup table instead of being sorted.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to index
+
+    Returns
+    -------
+    np.ndarray
+        Sorted values found in arr
+    np.ndarray
+        int32 array of the arr shape, such as values[index_arr] = arr
+    """
+    if arr.dtype.kind in "iu" and arr.size > 0:
+        minimum = int(arr.min())
+        maximum = int(arr.max())
+
+        if maximum - minimum < arr.size:
+            offsets = np.subtract(arr, minimum, dtype=np.int64)
+
+            present = np.zeros(maximum - minimum + 1, dtype=bool)
+            present[offsets.ravel()] = True
+
+            values = (np.flatnonzero(present) + minimum).astype(arr.dtype)
+            lookup_table = (np.cumsum(present) - 1).astype(np.int32)
+
+            return values, lookup_table[offsets]
+
+    values, inv = np.unique(arr.flatten(), return_inverse=True)
+    return values, inv.reshape(arr.shape).astype(np.int32)
+
+
 def numpy_2D_array_to_polygons(x:Union[List[float], np.ndarray], 
                                     y:Union[List[float], np.ndarray], 
                                     arr:np.ndarray, 
-                                    simplify:bool) -> List[PolygonElement]:
-    """Converts a 2D array mapping the cell id to a list of PolygonElements using the python module rasterio
+                                    simplify:bool,
+                                    tile_size:int = None,
+                                    max_workers:int = None,
+                                    polygonizer:Polygonizer = Polygonizer.RUN_LENGTH) -> PackedPolygons:
+    """Converts a 2D array mapping the cell id to packed polygons, the polygons are simplified at once with shapely.
+
+    If tile_size is given, the array is polygonized per tile in a process pool, the polygons crossing the tiles borders being merged back.
+    The pixels borders are placed halfway between the points, uniform or not.
 
     Parameters
     ----------
@@ -201,11 +647,19 @@ def numpy_2D_array_to_polygons(x:Union[List[float], np.ndarray],
         2D cell index mapping
     simplify : bool
         Simplify the polygons to smoothen the edges
+    tile_size : int, optional
+        Side in pixels of the tiles polygonized in parallel (POLYGONIZE_TILE_SIZE is a sensible value), 
+        by default None: the array is polygonized as a single tile
+    max_workers : int, optional
+        Number of processes polygonizing the tiles, by default None (processors count). 
+        The array is polygonized as a single tile if a single process is available
+    polygonizer : Polygonizer, optional
+        Algorithm converting the grid to polygons, by default Polygonizer.RUN_LENGTH
 
     Returns
     -------
-    List[PolygonElement]
-        List of PolygonElements
+    PackedPolygons
+        Polygons of the connected areas of each value, behaving as a list of PolygonElement
     """
     if not isinstance(arr, np.ndarray):
         raise TypeError(f"arr must be a numpy array, found {type(arr)}") 
@@ -219,45 +673,906 @@ def numpy_2D_array_to_polygons(x:Union[List[float], np.ndarray],
         raise ValueError(f"len(y) must have the same length as arr second coordinate, found {len(y)} and {arr.shape[0]}")
 
 
-    x0 = min(x)
-    x1 = max(x)
-    y0 = min(y)
-    y1 = max(y)
+    return pixel_to_frame_polygons(grid_to_pixel_polygons(arr, tile_size, max_workers, polygonizer), x, y, simplify)
+
 
-    # Simplify tolerance
-    delta = math.sqrt(math.pow(x[1] - x[0], 2) + math.pow(y[1] - y[0], 2))
+def grid_to_pixel_polygons(arr:np.ndarray, 
+                            tile_size:int = None, 
+                            max_workers:int = None, 
+                            polygonizer:Polygonizer = Polygonizer.RUN_LENGTH) -> PackedPolygons:
+    """Converts a 2D array mapping the cell id to packed polygons in pixel coordinates: 
+    the vertex (i, j) is the corner between the columns i-1 and i, and the rows j-1 and j.
 
-    polygon_element_list:List[PolygonElement] = []
+    Parameters
+    ----------
+    arr : np.ndarray
+        2D cell index mapping
+    tile_size : int, optional
+        Side in pixels of the tiles polygonized in parallel (POLYGONIZE_TILE_SIZE is a sensible value), 
+        by default None: the array is polygonized as a single tile
+    max_workers : int, optional
+        Number of processes polygonizing the tiles, by default None (processors count). 
+        The array is polygonized as a single tile if a single process is available
+    polygonizer : Polygonizer, optional
+        Algorithm converting the grid to polygons, by default Polygonizer.RUN_LENGTH
 
+    Returns
+    -------
+    PackedPolygons
+        Polygons of the connected areas of each value, the cell ids are the arr values
+    """
     #   We build a new array, we list the string values, and replace them by their index to accept very large values and non floats
-    values, direct, inv = np.unique(arr.flatten(), return_index = True, return_inverse=True)   #   Values found
-
-    # values : found values
-    # direct : first index of the value in arr.flatten()
-    # inv : for each element in arr.flatten(), index in values of the element
-
-    # values[inv].reshape(arr.shape) = arr
-
-    index_arr = np.array(range(len(values)))[inv].reshape(arr.shape).astype(np.int32)
-
-    transform1 = Affine.translation(x0 - (x1-x0)/len(x) / 2, y0 - (y1-y0)/len(y) / 2) * Affine.scale((x1-x0)/len(x), (y1-y0)/len(y))
-    shape_gen = ((shape(s), val) for s, val in rasterio.features.shapes(index_arr, transform=transform1))
-
-    s:Polygon
-    for s, val in shape_gen:
-        #   Checking the polygons of value 1
-        if simplify:
-            s = s.simplify(delta)
-        polygon_element_list.append(
-                        PolygonElement(exterior_polygon=PolygonCoords(x_coords=np.array([vert[0] for vert in s.exterior.coords]), 
-                                                                    y_coords=np.array([vert[1] for vert in s.exterior.coords])),
-                                        holes=[PolygonCoords(x_coords=np.array([vert[0] for vert in interior.coords]),
-                                                             y_coords=np.array([vert[1] for vert in interior.coords])) 
-                                                             for interior in s.interiors],
-                                        cell_id=values[int(val)])
-                    )
-        
-    return polygon_element_list
+    values, index_arr = index_values(arr)
+
+    #   Tiling only pays off when the tiles are polygonized in parallel
+    workers = os.cpu_count() if max_workers is None else max_workers
+    single_tile = tile_size is None or workers is None or workers <= 1
+
+    if single_tile or (arr.shape[0] <= tile_size and arr.shape[1] <= tile_size):
+        polygons = PIXEL_POLYGONIZERS[polygonizer](index_arr)
+    else:
+        polygons = _tiled_pixel_polygons(index_arr, tile_size, max_workers, polygonizer)
+
+    polygons.cell_ids = values[polygons.cell_ids]
+    return polygons
+
+
+def pixel_to_frame_polygons(polygons:PackedPolygons, 
+                                x:Union[List[float], np.ndarray], 
+                                y:Union[List[float], np.ndarray], 
+                                simplify:bool) -> PackedPolygons:
+    """Converts polygons in pixel coordinates to the frame coordinates of the grid points x and y
+
+    Parameters
+    ----------
+    polygons : PackedPolygons
+        Polygons in pixel coordinates, not modified
+    x : Union[List[float], np.ndarray]
+        Points coordinates along the X axis
+    y : Union[List[float], np.ndarray]
+        Points coordinates along the Y acis
+    simplify : bool
+        Simplify the polygons to smoothen the edges
+
+    Returns
+    -------
+    PackedPolygons
+        Polygons in frame coordinates
+    """
+    frame_polygons = PackedPolygons(
+        _pixel_to_frame_coords(polygons.x_coords, np.asarray(x, dtype=float)),
+        _pixel_to_frame_coords(polygons.y_coords, np.asarray(y, dtype=float)),
+        polygons.ring_offsets,
+        polygons.polygon_offsets,
+        polygons.cell_ids,
+        polygons.compos,
+    )
+
+    if simplify and len(frame_polygons) > 0:
+        # Simplify tolerance
+        delta = math.sqrt(math.pow(x[1] - x[0], 2) + math.pow(y[1] - y[0], 2))
+        frame_polygons = PackedPolygons.from_shapely(shapely.simplify(frame_polygons.to_shapely(), delta), frame_polygons.cell_ids)
+
+    return frame_polygons
+
+
+def iso_band_edges(arr:np.ndarray, band_count:int) -> np.ndarray:
+    """Returns the values separating band_count bands of equal width between the finite extrema of an array
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Continuous values array
+    band_count : int
+        Number of bands
+
+    Returns
+    -------
+    np.ndarray
+        band_count + 1 increasing values
+    """
+    finite = np.asarray(arr, dtype=float)[np.isfinite(arr)]
+    if len(finite) == 0:
+        return np.array([0., 1.])
+
+    #   The extreme edges are moved away from the extrema, to not leave degenerated holes on them
+    edges = np.linspace(finite.min(), finite.max(), band_count + 1)
+    edges[0] = np.nextafter(edges[0], -np.inf)
+    edges[-1] = np.nextafter(edges[-1], np.inf)
+    return edges
+
+
+def numpy_2D_array_to_iso_bands(x:Union[List[float], np.ndarray], 
+                                    y:Union[List[float], np.ndarray], 
+                                    arr:np.ndarray, 
+                                    band_edges:np.ndarray) -> PackedPolygons:
+    """Traces the areas of a continuous 2D array between consecutive band edges, with the marching squares of contourpy.
+
+    The bands borders are interpolated between the grid points, the polygons count depends on the bands shapes and not on the pixels count. 
+    The non finite values are not covered.
+
+    Parameters
+    ----------
+    x : Union[List[float], np.ndarray]
+        Points coordinates along the X axis
+    y : Union[List[float], np.ndarray]
+        Points coordinates along the Y acis
+    arr : np.ndarray
+        2D values array
+    band_edges : np.ndarray
+        Increasing values separating the bands, the band i covering the values between band_edges[i] and band_edges[i+1]
+
+    Returns
+    -------
+    PackedPolygons
+        Polygons of each band, the cell ids are the band indexes
+    """
+    import contourpy
+
+    generator = contourpy.contour_generator(
+        np.asarray(x, dtype=float), 
+        np.asarray(y, dtype=float), 
+        np.ma.masked_invalid(np.asarray(arr, dtype=float)), 
+        fill_type=contourpy.FillType.ChunkCombinedOffsetOffset, 
+        chunk_size=0,
+    )
+
+    bands = []
+    for band_index, (lower, upper) in enumerate(zip(band_edges[:-1], band_edges[1:])):
+        if upper <= lower:
+            continue
+
+        (points,), (ring_offsets,), (polygon_offsets,) = generator.filled(lower, upper)
+        if points is None:
+            continue
+
+        bands.append(PackedPolygons(
+            points[:, 0].copy(), 
+            points[:, 1].copy(), 
+            ring_offsets.astype(np.int64), 
+            polygon_offsets.astype(np.int64), 
+            np.full(len(polygon_offsets) - 1, band_index, dtype=np.int64),
+        ))
+
+    return PackedPolygons.concatenate(bands)
+
+
+def simplify_to_tolerance(polygons:PackedPolygons,
+                            values:np.ndarray,
+                            tolerance:float,
+                            merge:bool = False) -> Tuple[PackedPolygons, np.ndarray]:
+    """Simplifies the rings of a polygons coverage to a tolerance, the edges shared by neighbour polygons are simplified the same way so no gap nor overlap appears.
+    If merge is set, the touching polygons smaller than the tolerance that share a value are merged beforehand.
+
+    Parameters
+    ----------
+    polygons : PackedPolygons
+        Polygons to simplify
+    values : np.ndarray
+        Value of each polygon
+    tolerance : float
+        Simplification tolerance, in frame coordinates
+    merge : bool, optional
+        Merge the touching polygons smaller than the tolerance that share a value, by default False. 
+        The NaN values are considered equal, merging the polygons without value removes their edges
+
+    Returns
+    -------
+    Tuple[PackedPolygons, np.ndarray]
+        Simplified polygons, and index in polygons of the polygon each one comes from. 
+        If the tolerance is smaller than the median edge length, there is little to simplify and the polygons are returned as is.
+    """
+    indexes = np.arange(len(polygons))
+
+    #   The last vertex of each ring is linked back to its first vertex rather than to the next ring
+    next_vertex = np.arange(1, len(polygons.x_coords) + 1)
+    ring_starts = polygons.ring_offsets[:-1]
+    ring_ends = polygons.ring_offsets[1:]
+    not_empty_rings = ring_ends > ring_starts
+    next_vertex[ring_ends[not_empty_rings] - 1] = ring_starts[not_empty_rings]
+
+    edge_lengths = np.hypot(polygons.x_coords[next_vertex] - polygons.x_coords, polygons.y_coords[next_vertex] - polygons.y_coords)
+    #   The closed rings repeat their first vertex, giving null closing edges
+    edge_lengths = edge_lengths[edge_lengths > 0.]
+    if len(edge_lengths) == 0 or tolerance < np.median(edge_lengths):
+        return polygons, indexes
+
+    shapes = polygons.to_shapely()
+
+    bounds = polygons.bounds()
+    small = np.flatnonzero(np.fmax(bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1]) < tolerance)
+
+    if merge and len(small) > 1:
+        small_shapes = shapes[small]
+        first, second = shapely.STRtree(small_shapes).query(small_shapes, predicate="intersects")
+        _, value_indexes = np.unique(values[small], return_inverse=True)
+        linked = (first < second) & (value_indexes[first] == value_indexes[second])
+
+        components = _connected_components(len(small), first[linked], second[linked])
+        merged = np.bincount(components)[components] > 1
+
+        if merged.any():
+            order = np.argsort(components[merged], kind="stable")
+            merged_indexes = small[merged][order]
+            merged_components = components[merged][order]
+            group_starts = np.flatnonzero(np.concatenate([[True], merged_components[1:] != merged_components[:-1]]))
+
+            #   The polygons do not overlap, their union only removes their shared edges
+            unions = [shapely.coverage_union_all(shapes[group]) for group in np.split(merged_indexes, group_starts[1:])]
+            parts, part_groups = shapely.get_parts(unions, return_index=True)
+
+            kept = np.ones(len(shapes), dtype=bool)
+            kept[merged_indexes] = False
+            shapes = np.concatenate([shapes[kept], parts])
+            indexes = np.concatenate([indexes[kept], merged_indexes[group_starts][part_groups]])
+
+            #   The merged polygons take the place of their first polygon
+            order = np.argsort(indexes, kind="stable")
+            shapes = shapes[order]
+            indexes = indexes[order]
+
+    if hasattr(shapely, "coverage_simplify"):
+        simplified = shapely.coverage_simplify(shapes, tolerance)
+    else:
+        simplified = shapely.simplify(shapes, tolerance, preserve_topology=True)
+
+    not_empty = ~shapely.is_empty(simplified)
+
+    return PackedPolygons.from_shapely(simplified[not_empty], polygons.cell_ids[indexes[not_empty]]), indexes[not_empty]
+
+
+def rasterize_polygons(polygons:PackedPolygons,
+                        u_range:Tuple[float, float],
+                        v_range:Tuple[float, float],
+                        shape:Tuple[int, int]) -> np.ndarray:
+    """Returns the index of the polygon containing the center of each pixel of a grid covering u_range and v_range. 
+    The polygons are scan converted: the crossings of their edges with each pixel row are sorted per polygon, 
+    and the pixels between successive crossings are filled, following the even-odd rule.
+
+    Parameters
+    ----------
+    polygons : PackedPolygons
+        Polygons to rasterize
+    u_range : Tuple[float, float]
+        Range covered by the grid along the horizontal axis
+    v_range : Tuple[float, float]
+        Range covered by the grid along the vertical axis
+    shape : Tuple[int, int]
+        Grid rows (along the vertical axis) and columns counts
+
+    Returns
+    -------
+    np.ndarray
+        2D int32 grid of polygon indexes, -1 where no polygon contains the pixel center
+    """
+    rows, columns = shape
+    index_grid = np.full((rows, columns), -1, dtype=np.int32)
+    if len(polygons) == 0 or rows == 0 or columns == 0 or len(polygons.x_coords) == 0:
+        return index_grid
+
+    #   Vertices in pixel coordinates, the pixel centers being at integer coordinates
+    x = (polygons.x_coords - u_range[0]) * (columns / (u_range[1] - u_range[0])) - 0.5
+    y = (polygons.y_coords - v_range[0]) * (rows / (v_range[1] - v_range[0])) - 0.5
+
+    #   Each vertex starts an edge towards the next vertex of its ring, the last one closes the ring
+    ring_counts = np.diff(polygons.ring_offsets)
+    vertex_polygons = np.repeat(np.repeat(np.arange(len(polygons), dtype=np.int32), np.diff(polygons.polygon_offsets)), ring_counts)
+    next_vertices = np.arange(1, len(x) + 1)
+    next_vertices[polygons.ring_offsets[1:][ring_counts > 0] - 1] = polygons.ring_offsets[:-1][ring_counts > 0]
+
+    x0, y0, x1, y1 = x, y, x[next_vertices], y[next_vertices]
+
+    #   An edge crosses the rows whose center is in [min(y0, y1), max(y0, y1)), so each ring crosses a row an even number of times
+    first_rows = np.clip(np.ceil(np.minimum(y0, y1)), 0, rows).astype(np.int64)
+    row_counts = np.clip(np.ceil(np.maximum(y0, y1)), 0, rows).astype(np.int64) - first_rows
+    crossing_edges = np.repeat(np.arange(len(x)), row_counts)
+    crossing_rows = concatenated_ranges(first_rows, row_counts)
+
+    crossing_x = x0[crossing_edges] + (crossing_rows - y0[crossing_edges]) * (
+        (x1 - x0)[crossing_edges] / (y1 - y0)[crossing_edges]
+    )
+    crossing_polygons = vertex_polygons[crossing_edges]
+
+    #   Successive crossings of a polygon on a row delimit its inside spans
+    order = np.lexsort((crossing_x, crossing_rows, crossing_polygons))
+    span_starts, span_ends = order[0::2], order[1::2]
+
+    first_columns = np.clip(np.ceil(crossing_x[span_starts]), 0, columns).astype(np.int64)
+    column_counts = np.clip(np.ceil(crossing_x[span_ends]), 0, columns).astype(np.int64) - first_columns
+
+    pixels = concatenated_ranges(crossing_rows[span_starts] * columns + first_columns, column_counts)
+    index_grid.ravel()[pixels] = np.repeat(crossing_polygons[span_starts], column_counts)
+
+    return index_grid
+
+
+def _pixel_to_frame_coords(pixel_coords:np.ndarray, points:np.ndarray) -> np.ndarray:
+    """Converts pixel coordinates along an axis to frame coordinates. 
+    The pixels borders are halfway between the points, the first and last pixels extending half a spacing past the end points.
+
+    Parameters
+    ----------
+    pixel_coords : np.ndarray
+        Integer pixel coordinates
+    points : np.ndarray
+        Increasing coordinates of the grid points along the axis
+
+    Returns
+    -------
+    np.ndarray
+        Frame coordinates
+    """
+    spacings = np.diff(points)
+    if len(spacings) == 0:
+        #   A single point has no spacing, it is covered by a pixel of unit width
+        spacings = np.ones(1)
+
+    borders = np.concatenate([
+        [points[0] - spacings[0] / 2], 
+        (points[1:] + points[:-1]) / 2, 
+        [points[-1] + spacings[-1] / 2]
+    ])
+    return borders[pixel_coords.astype(np.int64)]
+
+
+def get_changed_windows(previous_arr:np.ndarray, arr:np.ndarray, block_size:int = INCREMENTAL_BLOCK_SIZE) -> List[Tuple[int, int, int, int]]:
+    """Compares two 2D arrays per block, and returns the bounding boxes of the groups of neighbouring blocks that differ
+
+    Parameters
+    ----------
+    previous_arr : np.ndarray
+        Former 2D array
+    arr : np.ndarray
+        New 2D array, of the same shape
+    block_size : int, optional
+        Side of the compared blocks in pixels, by default INCREMENTAL_BLOCK_SIZE
+
+    Returns
+    -------
+    List[Tuple[int, int, int, int]]
+        First row, last row (excluded), first column, last column (excluded) of each changed window
+    """
+    changed = _changed_pixels(previous_arr, arr)
+
+    rows_count = -(-arr.shape[0] // block_size)
+    columns_count = -(-arr.shape[1] // block_size)
+    padded = np.zeros((rows_count * block_size, columns_count * block_size), dtype=bool)
+    padded[:arr.shape[0], :arr.shape[1]] = changed
+    dirty = padded.reshape(rows_count, block_size, columns_count, block_size).any(axis=(1, 3))
+
+    #   Groups of dirty blocks connected by an edge or a corner
+    visited = np.zeros_like(dirty)
+    windows = []
+    for start in zip(*np.nonzero(dirty)):
+        if visited[start]:
+            continue
+        visited[start] = True
+        stack = [start]
+        row_min, column_min = start
+        row_max, column_max = start
+
+        while len(stack) > 0:
+            row, column = stack.pop()
+            row_min, row_max = min(row_min, row), max(row_max, row)
+            column_min, column_max = min(column_min, column), max(column_max, column)
+
+            for neighbour_row in range(max(row - 1, 0), min(row + 2, rows_count)):
+                for neighbour_column in range(max(column - 1, 0), min(column + 2, columns_count)):
+                    if dirty[neighbour_row, neighbour_column] and not visited[neighbour_row, neighbour_column]:
+                        visited[neighbour_row, neighbour_column] = True
+                        stack.append((neighbour_row, neighbour_column))
+
+        windows.append((
+            int(row_min * block_size), 
+            int(min((row_max + 1) * block_size, arr.shape[0])),
+            int(column_min * block_size), 
+            int(min((column_max + 1) * block_size, arr.shape[1])),
+        ))
+
+    return windows
+
+
+def splice_pixel_polygons(polygons:PackedPolygons, 
+                            previous_arr:np.ndarray, 
+                            arr:np.ndarray, 
+                            block_size:int = INCREMENTAL_BLOCK_SIZE, 
+                            max_fraction:float = INCREMENTAL_MAX_FRACTION,
+                            polygonizer:Polygonizer = Polygonizer.RUN_LENGTH) -> Union[None, Tuple[np.ndarray, PackedPolygons, np.ndarray]]:
+    """Updates the pixel polygons of previous_arr to arr by polygonizing again only the windows of arr that changed.
+    The former polygons reaching the windows are clipped out of them, and merged with the new windows polygons of same value.
+
+    Parameters
+    ----------
+    polygons : PackedPolygons
+        Pixel polygons of previous_arr, as given by grid_to_pixel_polygons
+    previous_arr : np.ndarray
+        Former 2D cell index mapping
+    arr : np.ndarray
+        New 2D cell index mapping, of the same shape
+    block_size : int, optional
+        Side of the compared blocks in pixels, by default INCREMENTAL_BLOCK_SIZE
+    max_fraction : float, optional
+        Fraction of the array area covered by the changed windows above which None is returned, by default INCREMENTAL_MAX_FRACTION
+    polygonizer : Polygonizer, optional
+        Algorithm converting the windows to polygons, by default Polygonizer.RUN_LENGTH
+
+    Returns
+    -------
+    Union[None, Tuple[np.ndarray, PackedPolygons, np.ndarray]]
+        None if the changed windows are too large to be worth splicing, otherwise:
+            - the indexes of the polygons kept unchanged,
+            - the pixel polygons replacing the other ones,
+            - the values whose area changed.
+    """
+    windows = get_changed_windows(previous_arr, arr, block_size)
+
+    if sum((row_max - row_min) * (column_max - column_min) for row_min, row_max, column_min, column_max in windows) > max_fraction * arr.size:
+        return None
+
+    changed = _changed_pixels(previous_arr, arr)
+    changed_values = np.unique(np.concatenate([previous_arr[changed], arr[changed]]))
+
+    if len(windows) == 0:
+        return np.arange(len(polygons)), PackedPolygons.empty(), changed_values
+
+    #   Polygons overlapping or touching a window
+    bounds = polygons.bounds()
+    reached = np.zeros(len(polygons), dtype=bool)
+    for row_min, row_max, column_min, column_max in windows:
+        reached |= (
+            (bounds[:, 0] <= column_max) & (bounds[:, 2] >= column_min) 
+            & (bounds[:, 1] <= row_max) & (bounds[:, 3] >= row_min)
+        )
+
+    windows_area = shapely.union_all(
+        [shapely.box(column_min, row_min, column_max, row_max) for row_min, row_max, column_min, column_max in windows]
+    )
+    reached_shapes = polygons.take(np.flatnonzero(reached)).to_shapely()
+
+    #   The bounds only preselect the polygons, large polygons may surround a window without reaching it
+    intersects = shapely.intersects(reached_shapes, windows_area)
+    reached[reached] = intersects
+    clipped = shapely.difference(reached_shapes[intersects], windows_area)
+    not_empty = ~shapely.is_empty(clipped)
+
+    window_polygons = []
+    for row_min, row_max, column_min, column_max in windows:
+        values, index_arr = index_values(arr[row_min:row_max, column_min:column_max])
+        window_polygon = PIXEL_POLYGONIZERS[polygonizer](index_arr, column_min, row_min)
+        window_polygon.cell_ids = values[window_polygon.cell_ids]
+        window_polygons.append(window_polygon)
+    window_polygons = PackedPolygons.concatenate(window_polygons)
+
+    shapes = np.concatenate([clipped[not_empty], window_polygons.to_shapely()])
+    values, shapes_indexes = np.unique(
+        np.concatenate([polygons.cell_ids[reached][not_empty], window_polygons.cell_ids]), 
+        return_inverse=True
+    )
+    merged = _merge_per_value(shapes, shapes_indexes.ravel())
+    merged.cell_ids = values[merged.cell_ids]
+
+    return np.flatnonzero(~reached), merged, changed_values
+
+
+def _changed_pixels(previous_arr:np.ndarray, arr:np.ndarray) -> np.ndarray:
+    """Returns the mask of the pixels whose value differs between two arrays of the same shape, NaN being equal to NaN
+
+    Parameters
+    ----------
+    previous_arr : np.ndarray
+        Former 2D array
+    arr : np.ndarray
+        New 2D array
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the changed pixels
+    """
+    changed = previous_arr != arr
+    if previous_arr.dtype.kind == "f" and arr.dtype.kind == "f":
+        changed &= ~(np.isnan(previous_arr) & np.isnan(arr))
+    return changed
+
+
+def _merge_per_value(shapes:np.ndarray, indexes:np.ndarray) -> PackedPolygons:
+    """Merges the touching polygons of same index, the collinear vertices left on the former borders are removed
+
+    Parameters
+    ----------
+    shapes : np.ndarray
+        Array of shapely polygons in pixel coordinates
+    indexes : np.ndarray
+        Integer index of each polygon value
+
+    Returns
+    -------
+    PackedPolygons
+        Merged polygons, the cell ids are the indexes
+    """
+    parts = []
+    parts_ids = []
+    for index in np.unique(indexes):
+        index_parts = shapely.get_parts(shapely.union_all(shapes[indexes == index]))
+        parts.append(index_parts)
+        parts_ids.append(np.full(len(index_parts), index))
+
+    if len(parts) == 0:
+        return PackedPolygons.empty()
+
+    #   The union keeps the vertices of the former borders corners, a null tolerance simplification removes them
+    return PackedPolygons.from_shapely(shapely.simplify(np.concatenate(parts), 0.), np.concatenate(parts_ids))
+
+
+def _rasterio_pixel_polygons(index_arr:np.ndarray, column_offset:int = 0, row_offset:int = 0) -> PackedPolygons:
+    """Polygonizes an index array with rasterio, in pixel coordinates
+
+    Parameters
+    ----------
+    index_arr : np.ndarray
+        int32 2D array
+    column_offset : int, optional
+        Column of the first array column in the full grid, by default 0
+    row_offset : int, optional
+        Row of the first array row in the full grid, by default 0
+
+    Returns
+    -------
+    PackedPolygons
+        Polygons of the connected areas of each index, the cell ids are the indexes
+    """
+    try:
+        import rasterio.features
+    except ImportError:
+        raise ImportError(
+            "Failed to import rasterio, install scivianna using the command pip install scivianna[rasterio] or use the Polygonizer.RUN_LENGTH polygonizer"
+        )
+
+    #   Only the rings lists are kept from the GeoJSON-like shapes. Their coordinates are read by a single generator, 
+    #   which iterates in Python over each coordinate but is faster than building one array per ring or parsing the shapes with shapely.from_geojson
+    rings:List[List[Tuple[float, float]]] = []
+    rings_count:List[int] = []
+    shape_values:List[float] = []
+    for s, val in rasterio.features.shapes(index_arr):
+        rings.extend(s["coordinates"])
+        rings_count.append(len(s["coordinates"]))
+        shape_values.append(val)
+
+    if len(rings) == 0:
+        return PackedPolygons.empty()
+
+    vertices_count = np.fromiter((len(ring) for ring in rings), dtype=np.int64, count=len(rings))
+    coords = np.fromiter(
+        (coord for ring in rings for vertex in ring for coord in vertex), 
+        dtype=float, 
+        count=2*int(vertices_count.sum())
+    ).reshape(-1, 2)
+
+    return PackedPolygons(
+        coords[:, 0] + column_offset, 
+        coords[:, 1] + row_offset,
+        np.concatenate([[0], np.cumsum(vertices_count)]),
+        np.concatenate([[0], np.cumsum(rings_count)]),
+        np.asarray(shape_values, dtype=np.int64),
+    )
+
+
+def _run_length_pixel_polygons(index_arr:np.ndarray, column_offset:int = 0, row_offset:int = 0) -> PackedPolygons:
+    """Polygonizes an index array in numpy, in pixel coordinates. 
+    
+    The runs of equal values along the rows are merged vertically in connected areas, 
+    the borders between areas are then chained in rings, the area being kept on the same side of the border.
+
+    Parameters
+    ----------
+    index_arr : np.ndarray
+        int32 2D array
+    column_offset : int, optional
+        Column of the first array column in the full grid, by default 0
+    row_offset : int, optional
+        Row of the first array row in the full grid, by default 0
+
+    Returns
+    -------
+    PackedPolygons
+        Polygons of the connected areas of each index, the cell ids are the indexes
+    """
+    if index_arr.size == 0:
+        return PackedPolygons.empty()
+
+    rows_count, columns_count = index_arr.shape
+
+    #   Runs of equal values along the rows
+    run_starts = np.ones(index_arr.shape, dtype=bool)
+    run_starts[:, 1:] = index_arr[:, 1:] != index_arr[:, :-1]
+    run_ids = np.cumsum(run_starts.ravel(), dtype=np.int32).reshape(index_arr.shape) - 1
+
+    #   Runs of equal values overlapping on consecutive rows: each overlap begins where one of the runs starts
+    linked = (index_arr[1:] == index_arr[:-1]) & (run_starts[1:] | run_starts[:-1])
+    run_areas = _connected_components(int(run_ids[-1, -1]) + 1, run_ids[:-1][linked], run_ids[1:][linked]).astype(np.int32)
+
+    areas = np.full((rows_count + 2, columns_count + 2), -1, dtype=np.int32)
+    areas[1:-1, 1:-1] = run_areas[run_ids]
+    area_values = np.zeros(int(run_areas.max()) + 1, dtype=np.int64)
+    area_values[run_areas] = index_arr[run_starts]
+
+    #   Borders between two areas along the pixels lines, oriented to have their area on their left: directions +x, +y, -x, -y
+    columns, rows, lengths, above, below = _line_segments(areas[:-1, 1:-1], areas[1:, 1:-1])
+    vertical_rows, vertical_columns, vertical_lengths, left, right = _line_segments(areas[1:-1, :-1].T, areas[1:-1, 1:].T)
+
+    x = np.concatenate([columns, columns + lengths, vertical_columns, vertical_columns])
+    y = np.concatenate([rows, rows, vertical_rows, vertical_rows + vertical_lengths])
+    x_end = np.concatenate([columns + lengths, columns, vertical_columns, vertical_columns])
+    y_end = np.concatenate([rows, rows, vertical_rows + vertical_lengths, vertical_rows])
+    directions = np.repeat(np.array([0, 2, 1, 3]), [len(rows), len(rows), len(vertical_rows), len(vertical_rows)])
+    owners = np.concatenate([below, above, left, right])
+
+    inside = owners >= 0
+    x, y, x_end, y_end, directions, owners = x[inside], y[inside], x_end[inside], y_end[inside], directions[inside], owners[inside]
+
+    #   Next border of each border: when an area touches itself by a corner, turning away from it closes the pocket on the other side as a hole
+    keys = (y * (columns_count + 1) + x) * 4 + directions
+    sorter = np.argsort(keys)
+    sorted_keys = keys[sorter]
+    end_keys = (y_end * (columns_count + 1) + x_end) * 4
+    successors = np.full(len(keys), -1, dtype=np.int64)
+    for turn in (3, 0, 1):
+        missing = np.flatnonzero(successors < 0)
+        candidate_keys = end_keys[missing] + (directions[missing] + turn) % 4
+        positions = np.minimum(np.searchsorted(sorted_keys, candidate_keys), len(keys) - 1)
+        candidates = sorter[positions]
+        found = (sorted_keys[positions] == candidate_keys) & (owners[candidates] == owners[missing])
+        successors[missing[found]] = candidates[found]
+
+    rings, ranks = _rank_cycles(successors)
+    predecessors = np.empty_like(successors)
+    predecessors[successors] = np.arange(len(successors))
+
+    #   Rings exterior first then holes, sorted per area: the exteriors are counterclockwise in pixel coordinates
+    heads = np.flatnonzero(rings == np.arange(len(rings)))
+    ring_indexes = np.empty_like(rings)
+    ring_indexes[heads] = np.arange(len(heads))
+    ring_indexes = ring_indexes[rings]
+    signed_areas = np.bincount(ring_indexes, weights=x * y_end - x_end * y, minlength=len(heads))
+    ring_owners = owners[heads]
+    ring_order = np.lexsort((signed_areas < 0, ring_owners))
+    ring_ranks = np.empty_like(ring_order)
+    ring_ranks[ring_order] = np.arange(len(ring_order))
+
+    #   Only the borders starting a new direction give a vertex
+    order = np.lexsort((ranks, ring_ranks[ring_indexes]))
+    order = order[directions[order] != directions[predecessors[order]]]
+    vertices_count = np.bincount(ring_ranks[ring_indexes[order]], minlength=len(heads))
+
+    #   The rings are closed by repeating their first vertex
+    ring_starts = np.cumsum(vertices_count) - vertices_count
+    closed = concatenated_ranges(ring_starts, vertices_count + 1)
+    closing = np.cumsum(vertices_count + 1) - 1
+    closed[closing] = ring_starts
+
+    polygons_rings_count = np.bincount(ring_owners[ring_order], minlength=len(area_values))
+
+    return PackedPolygons(
+        x[order][closed].astype(float) + column_offset,
+        y[order][closed].astype(float) + row_offset,
+        np.concatenate([[0], np.cumsum(vertices_count + 1)]),
+        np.concatenate([[0], np.cumsum(polygons_rings_count)]),
+        area_values,
+    )
+
+
+def _line_segments(first_side:np.ndarray, second_side:np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Lists the segments along the rows of two arrays where their values differ, a segment ending where either value changes
+
+    Parameters
+    ----------
+    first_side : np.ndarray
+        Values on the first side of each unit border
+    second_side : np.ndarray
+        Values on the second side of each unit border, of the same shape
+
+    Returns
+    -------
+    np.ndarray
+        Column of the segments starts
+    np.ndarray
+        Row of the segments
+    np.ndarray
+        Length of the segments
+    np.ndarray
+        Value on the first side of the segments
+    np.ndarray
+        Value on the second side of the segments
+    """
+    border = first_side != second_side
+    starts = border.copy()
+    starts[:, 1:] &= ~(
+        border[:, :-1] 
+        & (first_side[:, 1:] == first_side[:, :-1]) 
+        & (second_side[:, 1:] == second_side[:, :-1])
+    )
+
+    rows, columns = np.nonzero(starts)
+    lengths = np.bincount(np.cumsum(starts[border]) - 1, minlength=len(rows))
+
+    return columns, rows, lengths, first_side[rows, columns], second_side[rows, columns]
+
+
+def _connected_components(nodes_count:int, first_nodes:np.ndarray, second_nodes:np.ndarray) -> np.ndarray:
+    """Labels the connected components of a graph, by hooking the components roots on the smallest linked root and jumping pointers
+
+    Parameters
+    ----------
+    nodes_count : int
+        Number of nodes
+    first_nodes : np.ndarray
+        First node of each link
+    second_nodes : np.ndarray
+        Second node of each link
+
+    Returns
+    -------
+    np.ndarray
+        Component of each node, numbered from 0 in the order of their smallest node
+    """
+    roots = np.arange(nodes_count)
+    while True:
+        first_roots = roots[first_nodes]
+        second_roots = roots[second_nodes]
+        different = first_roots != second_roots
+        if not different.any():
+            break
+
+        first_nodes, second_nodes = first_nodes[different], second_nodes[different]
+        first_roots, second_roots = first_roots[different], second_roots[different]
+        np.minimum.at(roots, np.maximum(first_roots, second_roots), np.minimum(first_roots, second_roots))
+
+        jumped = roots[roots]
+        while not np.array_equal(jumped, roots):
+            roots = jumped
+            jumped = roots[roots]
+
+    return np.unique(roots, return_inverse=True)[1].ravel()
+
+
+def _rank_cycles(successors:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds the cycles of a permutation and the position of each element in its cycle, by pointer jumping
+
+    Parameters
+    ----------
+    successors : np.ndarray
+        Permutation giving the next element of each element
+
+    Returns
+    -------
+    np.ndarray
+        Smallest element of the cycle of each element, starting its cycle
+    np.ndarray
+        Position of each element in its cycle
+    """
+    cycles = np.arange(len(successors))
+    jumps = successors.copy()
+    for _ in range(max(int(len(successors)).bit_length(), 1)):
+        cycles = np.minimum(cycles, cycles[jumps])
+        jumps = jumps[jumps]
+
+    #   Distance to the cycle start following the predecessors
+    is_start = cycles == np.arange(len(successors))
+    jumps = np.empty_like(successors)
+    jumps[successors] = np.arange(len(successors))
+    jumps[is_start] = np.flatnonzero(is_start)
+    ranks = (~is_start).astype(np.int64)
+    while not np.array_equal(jumps[jumps], jumps):
+        ranks = ranks + ranks[jumps]
+        jumps = jumps[jumps]
+
+    return cycles, ranks
+
+
+_process_pool:concurrent.futures.ProcessPoolExecutor = None
+"""Process pool polygonizing the tiles, shared between the calls to avoid starting the processes at each frame"""
+_process_pool_workers:int = None
+"""Number of processes requested when _process_pool was created"""
+
+
+def _get_process_pool(max_workers:int = None) -> concurrent.futures.ProcessPoolExecutor:
+    """Returns the shared process pool, a new pool is created if none exists yet or if a different number of processes is requested
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of processes, by default None (processors count)
+
+    Returns
+    -------
+    concurrent.futures.ProcessPoolExecutor
+        Shared process pool
+    """
+    global _process_pool, _process_pool_workers
+
+    if _process_pool is None or _process_pool_workers != max_workers:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False)
+        _process_pool = concurrent.futures.ProcessPoolExecutor(max_workers)
+        _process_pool_workers = max_workers
+
+    return _process_pool
+
+
+def _discard_process_pool():
+    """Shuts the shared process pool down, the next call to _get_process_pool creates a new one
+    """
+    global _process_pool, _process_pool_workers
+
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False)
+    _process_pool = None
+    _process_pool_workers = None
+
+
+def _tiled_pixel_polygons(index_arr:np.ndarray, 
+                            tile_size:int, 
+                            max_workers:int = None, 
+                            polygonizer:Polygonizer = Polygonizer.RUN_LENGTH) -> PackedPolygons:
+    """Polygonizes an index array per tile in the shared process pool, in pixel coordinates. 
+    The polygons reaching a border between two tiles are merged with their neighbours of same index.
+
+    Parameters
+    ----------
+    index_arr : np.ndarray
+        int32 2D array
+    tile_size : int
+        Side of the square tiles, in pixels
+    max_workers : int, optional
+        Number of processes, by default None (processors count)
+    polygonizer : Polygonizer, optional
+        Algorithm converting the tiles to polygons, by default Polygonizer.RUN_LENGTH
+
+    Returns
+    -------
+    PackedPolygons
+        Polygons of the connected areas of each index, the cell ids are the indexes
+    """
+    rows = np.arange(0, index_arr.shape[0], tile_size)
+    columns = np.arange(0, index_arr.shape[1], tile_size)
+
+    executor = _get_process_pool(max_workers)
+    try:
+        futures = [
+            executor.submit(PIXEL_POLYGONIZERS[polygonizer], index_arr[row:row + tile_size, column:column + tile_size], int(column), int(row))
+            for row in rows for column in columns
+        ]
+        polygons = PackedPolygons.concatenate([future.result() for future in futures])
+    except concurrent.futures.BrokenExecutor:
+        #   A dead worker breaks the pool for good, the next call starts a new one
+        _discard_process_pool()
+        raise
+
+    #   The pixel coordinates are integers: the polygons bounds are exactly on the tiles borders
+    bounds = polygons.bounds()
+    on_border = (
+        np.isin(bounds[:, 0], columns[1:]) | np.isin(bounds[:, 2], columns[1:]) 
+        | np.isin(bounds[:, 1], rows[1:]) | np.isin(bounds[:, 3], rows[1:])
+    )
+
+    #   Only the indexes with several polygons on the borders may have polygons to merge
+    border_ids = polygons.cell_ids[on_border]
+    unique_ids, counts = np.unique(border_ids, return_counts=True)
+    to_merge = on_border & np.isin(polygons.cell_ids, unique_ids[counts > 1])
+
+    if not to_merge.any():
+        return polygons
+
+    merged = _merge_per_value(polygons.take(np.flatnonzero(to_merge)).to_shapely(), polygons.cell_ids[to_merge])
+
+    return PackedPolygons.concatenate([polygons.take(np.flatnonzero(~to_merge)), merged])
+
+
+PIXEL_POLYGONIZERS = {
+    Polygonizer.RUN_LENGTH: _run_length_pixel_polygons,
+    Polygonizer.RASTERIO: _rasterio_pixel_polygons,
+}
+"""Function polygonizing an index array in pixel coordinates for each polygonizer"""
 
 
 if __name__ == "__main__":
@@ -6,8 +6,8 @@ import panel as pn
 import panel_material_ui as pmui
 
 from scivianna.extension.extension import Extension
-from scivianna.interface.generic_interface import Geometry2DGrid
-from scivianna.constants import MATERIAL, MESH
+from scivianna.interface.generic_interface import Geometry2DGrid, cache_frames, cache_tiles, get_screen_grid_values
+from scivianna.constants import MATERIAL, MESH, SCREEN_RESOLUTION, DEVICE_PIXEL_RATIO
 from scivianna.panel.panel_2d import Panel2D
 from scivianna.plotter_2d.generic_plotter import Plotter2D
 from scivianna.slave import ComputeSlave
@@ -55,6 +55,11 @@ This extension allows defining the medcoupling field display parameters.
 
         self.iconsize = "1.0em"
 
+        self.fit_screen_input = pmui.Switch(
+            label = "Fit to screen",
+            value=True,
+            description="Computes a point per screen pixel instead of the u_steps x v_steps grid.",
+        )
         self.u_step_input = pmui.IntInput(
             label = "u_steps",
             value=500,
@@ -73,17 +78,28 @@ This extension allows defining the medcoupling field display parameters.
             description="Maximum mandelbrot iterations.",
             width=280
         )
+        self.iso_bands_input = pmui.IntInput(
+            label = "Iso bands",
+            value=0,
+            start=0,
+            description="Number of iterations bands contoured when the grid is displayed as polygons, 0 polygonizes each iterations count.",
+            width=280
+        )
         
 
+        self.fit_screen_input.param.watch(self.panel.recompute, "value")
         self.u_step_input.param.watch(self.panel.recompute, "value")
         self.v_step_input.param.watch(self.panel.recompute, "value")
         self.max_iter_input.param.watch(self.panel.recompute, "value")
+        self.iso_bands_input.param.watch(self.panel.recompute, "value")
 
     def provide_options(self):
         return {
+            "Fit to screen":self.fit_screen_input.value,
             "u_steps":self.u_step_input.value,
             "v_steps":self.v_step_input.value,
             "Max iter":self.max_iter_input.value,
+            "Iso bands":self.iso_bands_input.value,
         }
     
     def make_gui(self,) -> pn.viewable.Viewable:
@@ -95,9 +111,11 @@ This extension allows defining the medcoupling field display parameters.
             Viewable to display in the extension tab
         """
         return pmui.Column(
+            self.fit_screen_input,
             self.u_step_input,
             self.v_step_input,
             self.max_iter_input,
+            self.iso_bands_input,
             margin=0
         )
 
@@ -106,12 +124,18 @@ This extension allows defining the medcoupling field display parameters.
 class MandelBrotInterface(Geometry2DGrid):
     geometry_type: GeometryType = GeometryType._2D
     extensions = [MandelbrotExtension]
+    frame_cache_size: int = 64 * 2**20
+    """Maximum size in bytes of the cached grids"""
+    frame_cache_options: List[str] = ["Fit to screen", "u_steps", "v_steps", "Max iter", "Iso bands", SCREEN_RESOLUTION, DEVICE_PIXEL_RATIO]
+    """Options changing the computed grid"""
+    tile_cache_size: int = 64 * 2**20
+    """Maximum size in bytes of the cached tiles"""
+
     def __init__(
         self,
     ):
         """Antares interface constructor."""
         self.data = None
-        self.last_computed_frame = []
 
     def read_file(self, file_path: str, file_label: str):
         """Read a file and store its content in the interface
@@ -125,6 +149,23 @@ class MandelBrotInterface(Geometry2DGrid):
         """
         pass
 
+    def use_tiles(self, options: Dict[str, Any]) -> bool:
+        """Returns if the frame is assembled from tiles: only the grids fitted to the screen are tiled
+
+        Parameters
+        ----------
+        options : Dict[str, Any]
+            Additional options for frame computation.
+
+        Returns
+        -------
+        bool
+            Frame computed from tiles
+        """
+        return options.get("Fit to screen", False) and super().use_tiles(options)
+
+    @cache_frames
+    @cache_tiles
     def compute_2D_data(
         self,
         u: Tuple[float, float, float],
@@ -179,61 +220,34 @@ class MandelBrotInterface(Geometry2DGrid):
                 options
               
               )
-        if (
-            self.data is not None
-            and np.array_equal(np.array(u), np.array(self.last_computed_frame[0]))
-            and np.array_equal(np.array(v), np.array(self.last_computed_frame[1]))
-            and (u_min == self.last_computed_frame[2])
-            and (u_max == self.last_computed_frame[3])
-            and (v_min == self.last_computed_frame[4])
-            and (v_max == self.last_computed_frame[5])
-            and (w_value == self.last_computed_frame[6])
-            and (options["u_steps"] == self.last_computed_frame[7]["u_steps"])
-            and (options["v_steps"] == self.last_computed_frame[7]["v_steps"])
-            and (options["Max iter"] == self.last_computed_frame[7]["Max iter"])
-        ):
-            print("Skipping polygon computation.")
-            return self.data, False
-
-        self.last_computed_frame = [
-            u,
-            v,
-            u_min,
-            u_max,
-            v_min,
-            v_max,
-            w_value,
-            options,
-        ]
 
         # Script taken from:
         # https://gist.github.com/jfpuget/60e07a82dece69b011bb
 
         maxiter = options["Max iter"] if "Max iter" in options else 10
 
-        def mandelbrot(z, maxiter):
-            c = z
+        def mandelbrot_set(r1, r2, maxiter):
+            #   Iterations count before each point escapes, computed on the whole grid at once
+            c = r1[None, :] + 1j * r2[:, None]
+            z = c.copy()
+            grid = np.full(c.shape, maxiter)
             for n in range(maxiter):
-                if abs(z) > 2:
-                    return n
-                z = z * z + c
-            return maxiter
-
-        def mandelbrot_set(xmin, xmax, ymin, ymax, width, height, maxiter):
-            r1 = np.linspace(xmin, xmax, width)
-            r2 = np.linspace(ymin, ymax, height)
-            return (
-                r1,
-                r2,
-                [mandelbrot(complex(r, i), maxiter) for r in r1 for i in r2],
+                escaped = (grid == maxiter) & (np.abs(z) > 2)
+                grid[escaped] = n
+                z = np.where(grid == maxiter, z * z + c, z)
+            return grid
+
+        if options.get("Fit to screen", False):
+            xvalues, yvalues = get_screen_grid_values(
+                u_min, u_max, v_min, v_max, options, (options["u_steps"], options["v_steps"])
             )
+        else:
+            xvalues = np.linspace(u_min, u_max, options["u_steps"])
+            yvalues = np.linspace(v_min, v_max, options["v_steps"])
 
-        xvalues, yvalues, grid = mandelbrot_set(
-            u_min, u_max, v_min, v_max, options["u_steps"], options["v_steps"], maxiter
-        )
-
+        iso_bands = options.get("Iso bands", 0)
         self.data = Data2D.from_grid(
-            np.array(grid).reshape((options["v_steps"], options["u_steps"]), order="F"), xvalues, yvalues
+            mandelbrot_set(xvalues, yvalues, maxiter), xvalues, yvalues, iso_bands=iso_bands if iso_bands > 0 else None
         )
 
         return self.data, True
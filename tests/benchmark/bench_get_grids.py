@@ -0,0 +1,92 @@
+"""Benchmark of get_grids on a 4K (3840 x 2160) label grid.
+
+Compares the vectorized get_grids to the former dict based implementation, against the 60 and 30 frames per second budgets.
+
+    python tests/benchmark/bench_get_grids.py [width] [height]
+"""
+import sys
+import time
+
+import numpy as np
+
+from scivianna.data.data2d import Data2D
+from scivianna.plotter_2d.grid.grid_tools import get_grids
+from scivianna.utils.color_tools import get_edges_colors
+
+
+def label_grid(width: int, height: int) -> np.ndarray:
+    """Builds a height x width grid of about 40 values with curved boundaries"""
+    y, x = np.mgrid[0:height, 0:width] / max(width, height)
+    field = np.sin(7 * x + 3 * y**2) + np.cos(11 * y - 5 * x * y) + np.sin(23 * x * y)
+    return np.floor(field * 6).astype(np.int32) + 20
+
+
+def dict_get_grids(data: Data2D, display_edges: bool):
+    """Former get_grids: dict lookups per unique value and rolled flat copies for the edges"""
+    grid = data.get_grid()
+    flat_grid = grid.flatten()
+    vals, inv = np.unique(flat_grid, return_inverse=True)
+
+    value_map = dict(zip(data.cell_ids, data.cell_values))
+    color_map = dict(zip(data.cell_ids, data.cell_colors))
+
+    value_array = np.array([value_map[val] for val in vals])
+    color_array = np.array([color_map[val] for val in vals])
+
+    colors = color_array[inv]
+
+    if display_edges:
+        flat_data = grid.flatten()
+        contour_1_0 = np.where(flat_data == np.roll(flat_data, -1), 1, 0).reshape(grid.shape)
+        contour_1_1 = np.where(flat_data == np.roll(flat_data, 1), 1, 0).reshape(grid.shape)
+
+        flat_data_2 = grid.T.flatten()
+        contour_2_0 = np.where(flat_data_2 == np.roll(flat_data_2, -1), 1, 0).reshape(grid.T.shape).T
+        contour_2_1 = np.where(flat_data_2 == np.roll(flat_data_2, 1), 1, 0).reshape(grid.T.shape).T
+
+        borders = np.expand_dims(np.minimum(
+            np.minimum(contour_1_0, contour_2_0),
+            np.minimum(contour_1_1, contour_2_1),
+        ).flatten(), axis=-1)
+        borders = np.concatenate([borders, borders, borders, borders], axis=1)
+
+        color_edge_map = dict(zip(data.cell_ids, data.cell_edge_colors))
+        edge_colors = np.array([color_edge_map[val] for val in vals])[inv]
+
+        colors = np.where(borders == (1, 1, 1, 1), colors, edge_colors).reshape((*grid.shape, 4))
+    else:
+        colors = colors.reshape((*grid.shape, 4))
+
+    val_grid = value_array[inv].reshape(grid.shape)
+
+    img = np.empty(grid.shape, dtype=np.uint32)
+    view = img.view(dtype=np.uint8).reshape(colors.shape)
+    view[:, :, :] = colors[:, :, :]
+
+    return img, view, grid, val_grid
+
+
+if __name__ == "__main__":
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 3840
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 2160
+
+    arr = label_grid(width, height)
+    data = Data2D.from_grid(arr, np.arange(width, dtype=float), np.arange(height, dtype=float))
+    data.cell_values = data.cell_ids * 0.5
+    data.cell_colors = np.random.default_rng(0).integers(0, 256, (len(data.cell_ids), 4))
+    data.cell_edge_colors = get_edges_colors(data.cell_colors)
+
+    print(f"{width} x {height} grid, {len(data.cell_ids)} values, frame budget 16.7 ms at 60 fps, 33.3 ms at 30 fps")
+    for display_edges in (False, True):
+        start = time.perf_counter()
+        img, _, _, val_grid = get_grids(data, display_edges)
+        vectorized_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference_img, _, _, reference_val_grid = dict_get_grids(data, display_edges)
+        dict_time = time.perf_counter() - start
+
+        assert np.array_equal(val_grid, reference_val_grid)
+        if not display_edges:
+            assert np.array_equal(img, reference_img)
+        print(f"display_edges={display_edges}: vectorized {vectorized_time * 1e3:.1f} ms, dict based {dict_time * 1e3:.1f} ms, speedup x{dict_time / vectorized_time:.1f}")
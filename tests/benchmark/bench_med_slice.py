@@ -0,0 +1,80 @@
+"""Benchmark of MEDInterface.compute_2D_data on a synthetic 1M cells hexahedral mesh.
+
+Compares the vectorized slice to polygons conversion to the former per cell loop, 
+and the slicing of the indexed candidate cells to the slicing of the whole mesh along a w sweep.
+
+    python tests/benchmark/bench_med_slice.py [cells per axis]
+"""
+import sys
+import time
+
+import medcoupling
+import numpy as np
+
+from scivianna.interface.med_interface import MEDInterface, mesh_to_polygons
+
+
+def build_mesh(n: int) -> medcoupling.MEDCouplingUMesh:
+    """Builds a n x n x n hexahedral mesh on the unit cube"""
+    axis = medcoupling.DataArrayDouble(np.linspace(0., 1., n + 1).tolist())
+    mesh = medcoupling.MEDCouplingCMesh()
+    mesh.setCoords(axis, axis, axis)
+    return mesh.buildUnstructured()
+
+
+def per_cell_polygons(mesh: medcoupling.MEDCouplingUMesh, u, v):
+    """Former conversion: one getNodeIdsOfCell call and projection per cell"""
+    vertices_coords = [list(c) for c in mesh.getCoords()]
+    polygons = []
+    for cell in range(mesh.getNumberOfCells()):
+        coords = np.array([vertices_coords[node] for node in mesh.getNodeIdsOfCell(cell)]).T
+        polygons.append((np.matmul(coords.T, u), np.matmul(coords.T, v)))
+    return polygons
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    u, v = (1., 0., 0.), (0., 1., 0.)
+
+    start = time.perf_counter()
+    interface = MEDInterface()
+    interface.mesh = build_mesh(n)
+    print(f"Mesh of {interface.mesh.getNumberOfCells()} cells built in {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    data, _ = interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.5 + 0.1/n, None, {})
+    print(f"compute_2D_data of {len(data.cell_ids)} polygons: {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    slice_mesh, _ = interface.mesh.buildSlice3D([0., 0., 0.5 + 0.1/n], [0., 0., 1.], 0.)
+    print(f"    of which buildSlice3D: {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    polygons = mesh_to_polygons(slice_mesh, u, v)
+    vectorized_time = time.perf_counter() - start
+    print(f"Vectorized conversion to polygons: {vectorized_time:.4f} s")
+
+    start = time.perf_counter()
+    reference = per_cell_polygons(slice_mesh, u, v)
+    loop_time = time.perf_counter() - start
+    print(f"Per cell loop conversion to polygons: {loop_time:.4f} s")
+
+    for i in np.linspace(0, len(reference) - 1, 100).astype(int):
+        np.testing.assert_almost_equal(polygons[i].exterior_polygon.x_coords, reference[i][0])
+        np.testing.assert_almost_equal(polygons[i].exterior_polygon.y_coords, reference[i][1])
+
+    print(f"Conversion speedup: x{loop_time / vectorized_time:.1f}")
+
+    w_values = 0.05 + 0.9 * np.arange(10) / 10 + 0.1/n
+
+    start = time.perf_counter()
+    for w_value in w_values:
+        interface.mesh.buildSlice3D([0., 0., w_value], [0., 0., 1.], 0.)
+    full_time = (time.perf_counter() - start) / len(w_values)
+    print(f"Whole mesh buildSlice3D per w step: {full_time:.3f} s")
+
+    start = time.perf_counter()
+    for w_value in w_values:
+        interface.compute_2D_data(u, v, 0., 1., 0., 1., w_value, None, {})
+    indexed_time = (time.perf_counter() - start) / len(w_values)
+    print(f"Indexed compute_2D_data per w step: {indexed_time:.3f} s")
@@ -0,0 +1,113 @@
+"""Benchmark of numpy_2D_array_to_polygons on a 4000 x 4000 label grid.
+
+Compares the packed conversion to the former per shape conversion, and to the run time of rasterio.features.shapes alone.
+The packing of the rasterio shapes is compared to a bulk conversion through shapely.from_geojson.
+The tiled conversion is timed for several process counts, and both polygonizers on a single tile.
+
+    python tests/benchmark/bench_polygonize.py [grid size]
+"""
+import os
+import sys
+import time
+
+import json
+
+import numpy as np
+import rasterio.features
+import shapely
+from shapely.geometry import shape
+
+from scivianna.enums import Polygonizer
+from scivianna.utils.polygonize_tools import PackedPolygons, grid_to_pixel_polygons, index_values, numpy_2D_array_to_polygons
+
+
+def label_grid(n: int) -> np.ndarray:
+    """Builds a n x n grid of about 40 values with curved boundaries"""
+    y, x = np.mgrid[0:n, 0:n] / n
+    field = np.sin(7 * x + 3 * y**2) + np.cos(11 * y - 5 * x * y) + np.sin(23 * x * y)
+    return np.floor(field * 6).astype(np.int32) + 20
+
+
+def per_shape_polygons(arr: np.ndarray, simplify: bool, delta: float):
+    """Former conversion: one shapely object and per vertex comprehensions per shape"""
+    values, inv = np.unique(arr.flatten(), return_inverse=True)
+    index_arr = inv.reshape(arr.shape).astype(np.int32)
+
+    polygons = []
+    for s, val in rasterio.features.shapes(index_arr):
+        s = shape(s)
+        if simplify:
+            s = s.simplify(delta)
+        polygons.append((
+            np.array([vert[0] for vert in s.exterior.coords]),
+            np.array([vert[1] for vert in s.exterior.coords]),
+            [(np.array([vert[0] for vert in interior.coords]), np.array([vert[1] for vert in interior.coords])) for interior in s.interiors],
+            values[int(val)],
+        ))
+    return polygons
+
+
+def geojson_pixel_polygons(shapes: list) -> PackedPolygons:
+    """Bulk alternative to the rasterio shapes packing: the shapes are parsed back by shapely.from_geojson"""
+    collection = shapely.from_geojson(json.dumps({"type": "GeometryCollection", "geometries": [s for s, _ in shapes]}))
+    return PackedPolygons.from_shapely(shapely.get_parts(collection), np.array([val for _, val in shapes], dtype=np.int64))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    arr = label_grid(n)
+    x = np.arange(n, dtype=float)
+    y = np.arange(n, dtype=float)
+
+    start = time.perf_counter()
+    shapes = list(rasterio.features.shapes(arr))
+    rasterio_time = time.perf_counter() - start
+    print(f"rasterio.features.shapes alone: {rasterio_time:.2f} s for {len(shapes)} shapes")
+
+    index_arr = index_values(arr)[1]
+    start = time.perf_counter()
+    index_shapes = list(rasterio.features.shapes(index_arr))
+    index_shapes_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rasterio_polygons = grid_to_pixel_polygons(index_arr, polygonizer=Polygonizer.RASTERIO)
+    rasterio_polygonizer_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    geojson_polygons = geojson_pixel_polygons(index_shapes)
+    geojson_time = time.perf_counter() - start
+
+    assert len(geojson_polygons) == len(rasterio_polygons)
+    print(
+        f"RASTERIO polygonizer indexing and packing: {rasterio_polygonizer_time - index_shapes_time:.2f} s on top of rasterio, "
+        f"packing through shapely.from_geojson: {geojson_time:.2f} s"
+    )
+
+    for simplify in (False, True):
+        start = time.perf_counter()
+        polygons = numpy_2D_array_to_polygons(x, y, arr, simplify)
+        packed_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = per_shape_polygons(arr, simplify, np.sqrt(2.))
+        loop_time = time.perf_counter() - start
+
+        assert len(polygons) == len(reference)
+        print(f"simplify={simplify}: packed {packed_time:.2f} s ({len(polygons.x_coords)} vertices), per shape {loop_time:.2f} s, speedup x{loop_time / packed_time:.1f}")
+
+    reference = numpy_2D_array_to_polygons(x, y, arr, False, tile_size=n)
+    for workers in sorted({1, 2, 4, os.cpu_count()}):
+        start = time.perf_counter()
+        polygons = numpy_2D_array_to_polygons(x, y, arr, False, tile_size=1024, max_workers=workers)
+        tiled_time = time.perf_counter() - start
+
+        assert len(polygons) == len(reference)
+        print(f"tiled, {workers} processes: {tiled_time:.2f} s")
+
+    for polygonizer in Polygonizer:
+        start = time.perf_counter()
+        polygons = grid_to_pixel_polygons(arr, tile_size=n, polygonizer=polygonizer)
+        polygonizer_time = time.perf_counter() - start
+
+        assert len(polygons) == len(reference)
+        print(f"{polygonizer.name} polygonizer: {polygonizer_time:.2f} s ({len(polygons.x_coords)} vertices)")
@@ -0,0 +1,53 @@
+"""Benchmark of the ComputeSlave round trip latency.
+
+Times the get_labels calls of an interface answering immediately, so the measured time is the transport between the processes.
+
+    python tests/benchmark/bench_slave_round_trip.py [calls]
+"""
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from scivianna.interface.generic_interface import GenericInterface
+from scivianna.slave import ComputeSlave
+
+
+class EchoInterface(GenericInterface):
+    def __init__(self, ):
+        """Interface answering immediately, to time the slave round trip.
+        """
+        pass
+
+    def get_labels(self) -> List[str]:
+        """Returns the fields names providable.
+
+        Returns
+        -------
+        List[str]
+            Fields names
+        """
+        return ["echo"]
+
+
+if __name__ == "__main__":
+    n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    slave = ComputeSlave(EchoInterface)
+    #   The first call waits for the worker start
+    assert slave.get_labels() == ["echo"]
+
+    latencies = np.empty(n_calls)
+    for i in range(n_calls):
+        start = time.perf_counter()
+        slave.get_labels()
+        latencies[i] = time.perf_counter() - start
+
+    slave.terminate()
+
+    print(f"{n_calls} get_labels round trips, frame budget 16.7 ms at 60 fps")
+    print(
+        f"mean {latencies.mean() * 1e3:.3f} ms, median {np.median(latencies) * 1e3:.3f} ms, "
+        f"99th percentile {np.percentile(latencies, 99) * 1e3:.3f} ms, max {latencies.max() * 1e3:.3f} ms"
+    )
@@ -0,0 +1,79 @@
+import medcoupling
+import numpy as np
+import pytest
+
+from scivianna.constants import GEOMETRY
+from scivianna.interface.med_interface import MEDInterface
+
+
+def write_med_file(file_path: str, iterations: int = 2):
+    """Writes a 3 x 3 x 3 mesh with a two components field at several iterations"""
+    axis = medcoupling.DataArrayDouble([0., 1., 2., 3.])
+    cartesian_mesh = medcoupling.MEDCouplingCMesh()
+    cartesian_mesh.setCoords(axis, axis, axis)
+    mesh = cartesian_mesh.buildUnstructured()
+    mesh.setName("mesh")
+    medcoupling.WriteMesh(file_path, mesh, True)
+
+    for iteration in range(iterations):
+        field = medcoupling.MEDCouplingFieldDouble(medcoupling.ON_CELLS, medcoupling.ONE_TIME)
+        field.setName("power")
+        field.setMesh(mesh)
+        values = np.stack([np.arange(27.) + 100 * iteration, -np.arange(27.)], axis=1)
+        array = medcoupling.DataArrayDouble(values)
+        array.setInfoOnComponents(["fuel [W]", "moderator [W]"])
+        field.setArray(array)
+        field.setTime(float(iteration), iteration, 0)
+        medcoupling.WriteFieldUsingAlreadyWrittenMesh(file_path, field)
+
+
+@pytest.mark.default
+def test_field_time_steps_and_components(tmp_path):
+    file_path = str(tmp_path / "fields.med")
+    write_med_file(file_path)
+
+    interface = MEDInterface()
+    interface.read_file(file_path, GEOMETRY)
+
+    assert interface.fields_iterations["power@fuel"] == [(0, 0), (1, 0)]
+
+    cells = np.arange(27)
+    for iteration in range(2):
+        fuel = interface.get_value_dict("power@fuel", cells, {"Iteration": iteration, "Order": 0})
+        assert list(fuel.values()) == (np.arange(27.) + 100 * iteration).tolist()
+
+    #   Both components were read at once
+    moderator = interface.get_value_dict("power@moderator", cells, {"Iteration": 1, "Order": 0})
+    assert list(moderator.values()) == (-np.arange(27.)).tolist()
+    assert (interface.fields.hits, interface.fields.misses) == (1, 2)
+
+
+@pytest.mark.default
+def test_time_step_prefetch(tmp_path):
+    file_path = str(tmp_path / "fields.med")
+    write_med_file(file_path, 6)
+
+    interface = MEDInterface()
+    interface.read_file(file_path, GEOMETRY)
+    options = {"Order": 0, "Field prefetch depth": 2}
+
+    interface.get_value_dict("power@fuel", np.arange(27), {**options, "Iteration": 1})
+    while interface.idle_task():
+        pass
+    assert sorted(interface.fields.keys()) == [("power", i, 0) for i in range(4)]
+
+    #   Stepping backwards by two time steps
+    interface.get_value_dict("power@fuel", np.arange(27), {**options, "Iteration": 5})
+    interface.get_value_dict("power@fuel", np.arange(27), {**options, "Iteration": 3})
+    assert interface.get_prefetch_time_steps() == [(1, 0), (5, 0)]
+
+    misses = interface.fields.misses
+    while interface.idle_task():
+        pass
+    values = interface.get_value_dict("power@moderator", np.arange(27), {**options, "Iteration": 1})
+    assert interface.fields.misses == misses
+    assert list(values.values()) == (-np.arange(27.)).tolist()
+
+    #   Memory cap option
+    interface.get_value_dict("power@fuel", np.arange(27), {**options, "Iteration": 1, "Field cache size": 0})
+    assert len(interface.fields) == 0
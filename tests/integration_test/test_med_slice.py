@@ -0,0 +1,119 @@
+import medcoupling
+import numpy as np
+import pytest
+
+from scivianna.interface.med_interface import CellPlaneIndex, MEDInterface
+
+
+def build_mesh(n: int) -> medcoupling.MEDCouplingUMesh:
+    """Builds a n x n x n hexahedral mesh on the unit cube"""
+    axis = medcoupling.DataArrayDouble(np.linspace(0., 1., n + 1).tolist())
+    mesh = medcoupling.MEDCouplingCMesh()
+    mesh.setCoords(axis, axis, axis)
+    return mesh.buildUnstructured()
+
+
+@pytest.mark.default
+@pytest.mark.parametrize("u, v", [
+    ((1., 0., 0.), (0., 1., 0.)),
+    ((1., 0., 0.), (0., np.sqrt(.5), np.sqrt(.5))),
+])
+def test_slice_polygons_and_cells(u, v):
+    interface = MEDInterface()
+    interface.mesh = build_mesh(5)
+
+    data, updated = interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.33, None, {})
+    assert updated
+
+    w = np.cross(u, v)
+    slice_mesh, _ = interface.mesh.buildSlice3D((0.33 * w).tolist(), w.tolist(), 0.)
+    coords = slice_mesh.getCoords().toNumPyArray()
+    barycenters = slice_mesh.computeCellCenterOfMass().toNumPyArray()
+
+    assert len(data.cell_ids) == slice_mesh.getNumberOfCells()
+    for cell in range(slice_mesh.getNumberOfCells()):
+        nodes = slice_mesh.getNodeIdsOfCell(cell)
+        polygon = data.packed_polygons[cell]
+        np.testing.assert_almost_equal(polygon.exterior_polygon.x_coords, coords[nodes] @ u)
+        np.testing.assert_almost_equal(polygon.exterior_polygon.y_coords, coords[nodes] @ v)
+
+        #   The 2D cell barycenter is inside the 3D cell given as cell id
+        cell_3d = data.cell_ids[cell]
+        bounding_box = interface.mesh.getBoundingBoxForBBTree().toNumPyArray()[cell_3d]
+        assert np.all(barycenters[cell] >= bounding_box[::2] - 1e-12)
+        assert np.all(barycenters[cell] <= bounding_box[1::2] + 1e-12)
+
+
+@pytest.mark.default
+@pytest.mark.parametrize("normal, w_value", [
+    ((0., 0., 1.), 0.5),
+    ((0., 0., 1.), 0.33),
+    ((1., 2., 3.), 0.41),
+    ((0., 0., 1.), 1.5),
+])
+def test_cell_plane_index(normal, w_value):
+    mesh = build_mesh(6)
+    index = CellPlaneIndex(mesh)
+
+    normal = np.array(normal) / np.linalg.norm(normal)
+    origin = w_value * normal
+    candidates = index.get_cells_crossing_plane(origin, normal, 1e-7)
+
+    bounding_boxes = mesh.getBoundingBoxForBBTree().toNumPyArray().reshape(-1, 3, 2)
+    projections = np.einsum("ijk,j->ik", bounding_boxes, normal)
+    lower = np.minimum(projections[:, 0], projections[:, 1])
+    upper = np.maximum(projections[:, 0], projections[:, 1])
+    #   The box corners projections are enclosed by the index intervals, which are exact for axis normals
+    crossing = np.flatnonzero((lower <= w_value + 1e-7) & (upper >= w_value - 1e-7))
+    assert set(crossing).issubset(candidates)
+
+    if w_value < 1.:
+        _, full_cell_ids = mesh.buildSlice3D(origin.tolist(), normal.tolist(), 1e-7)
+        assert set(full_cell_ids.toNumPyArray()).issubset(candidates)
+
+
+@pytest.mark.default
+def test_indexed_slice_matches_full_slice():
+    interface = MEDInterface()
+    interface.mesh = build_mesh(6)
+    u, v = (1., 0., 0.), (0., np.sqrt(.5), np.sqrt(.5))
+
+    data, _ = interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.4, None, {})
+
+    w = np.cross(u, v)
+    _, full_cell_ids = interface.mesh.buildSlice3D((0.4 * w).tolist(), w.tolist(), 0.)
+    np.testing.assert_array_equal(data.cell_ids, full_cell_ids.toNumPyArray())
+
+    #   Plane outside of the mesh
+    data, _ = interface.compute_2D_data(u, v, 0., 1., 0., 1., 10., None, {})
+    assert len(data.cell_ids) == 0
+
+
+@pytest.mark.default
+def test_slice_prefetch():
+    interface = MEDInterface()
+    interface.mesh = build_mesh(10)
+    u, v = (1., 0., 0.), (0., 1., 0.)
+    options = {"Prefetch slices": True, "W step": 0.}
+
+    interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.31, None, options)
+    assert not interface.idle_task()
+
+    #   The prefetch follows the slider direction, and stops at the mesh boundary
+    interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.51, None, options)
+    assert interface.get_prefetch_w_values() == pytest.approx([0.71, 0.91, 0.31])
+    while interface.idle_task():
+        pass
+
+    cache = interface.get_frame_cache()
+    misses = cache.misses
+    data, updated = interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.51 + 2 * 0.2, None, options)
+    assert updated
+    assert cache.misses == misses
+
+    _, full_cell_ids = interface.mesh.buildSlice3D([0., 0., 0.91], [0., 0., 1.], 0.)
+    np.testing.assert_array_equal(data.cell_ids, full_cell_ids.toNumPyArray())
+
+    #   Disabled prefetch
+    interface.compute_2D_data(u, v, 0., 1., 0., 1., 0.5, None, {"Prefetch slices": False})
+    assert not interface.idle_task()
@@ -0,0 +1,44 @@
+from typing import Callable
+
+import numpy as np
+import pytest
+import shapely
+
+from scivianna.data.data2d import Data2D
+from scivianna.enums import VisualizationMode
+from scivianna.extension.field_selector import set_colors_list
+from scivianna.utils.polygonize_tools import PackedPolygons
+
+
+class ColoringModeSlave:
+    def __init__(self, coloring_mode: VisualizationMode):
+        """Slave only providing the coloring mode of the fields
+        """
+        self.coloring_mode = coloring_mode
+
+    def get_label_coloring_mode(self, label: str) -> VisualizationMode:
+        return self.coloring_mode
+
+
+@pytest.fixture
+def color_data() -> Callable[..., Data2D]:
+    """Returns a function coloring a Data2D from its cell values with the viridis colormap, as the field selector does"""
+    def color(data: Data2D, coloring_mode: VisualizationMode = VisualizationMode.FROM_VALUE, center_on_zero: bool = False) -> Data2D:
+        set_colors_list(data, ColoringModeSlave(coloring_mode), "field", "viridis", center_on_zero, {})
+        return data
+
+    return color
+
+
+@pytest.fixture
+def squares_data() -> Callable[..., Data2D]:
+    """Returns a function building a row of count unit squares, with ids starting at first_id and values from 0"""
+    def squares(count: int, first_id: int = 0) -> Data2D:
+        boxes = shapely.box(np.arange(count), 0., np.arange(count) + 1., 1.)
+        data = Data2D.from_polygon_list(PackedPolygons.from_shapely(boxes, np.arange(count) + first_id))
+        data.cell_values = np.arange(count) * 1.
+        data.cell_colors = np.full((count, 4), 255)
+        data.cell_edge_colors = np.zeros((count, 4))
+        return data
+
+    return squares
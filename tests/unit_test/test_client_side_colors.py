@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from scivianna.constants import CELL_VALUES, COLORS
+from scivianna.data.data2d import Data2D
+from scivianna.enums import VisualizationMode
+from scivianna.plotter_2d.polygon.bokeh import Bokeh2DPolygonPlotter
+
+
+@pytest.fixture
+def colored_data(color_data):
+    def make(coloring_mode: VisualizationMode, center_on_zero: bool = False) -> Data2D:
+        arr = np.arange(16.).reshape((4, 4)) - 4.
+        data = Data2D.from_grid(arr, np.arange(4.), np.arange(4.))
+        data.convert_to_polygons()
+        data.cell_values = data.cell_ids.astype(float)
+        data.cell_values[0] = np.nan
+        return color_data(data, coloring_mode, center_on_zero)
+
+    return make
+
+
+@pytest.mark.default
+def test_color_range(colored_data):
+    assert colored_data(VisualizationMode.FROM_VALUE).color_range == (-3., 11.)
+    assert colored_data(VisualizationMode.FROM_VALUE, True).color_range == (-11., 11.)
+    assert colored_data(VisualizationMode.NONE).color_range is None
+
+
+@pytest.mark.default
+def test_client_side_colors(colored_data):
+    plotter = Bokeh2DPolygonPlotter(client_side_colors=True)
+    data = colored_data(VisualizationMode.FROM_VALUE)
+    plotter.plot_2d_frame(data)
+
+    #   A single float32 column colors the glyph through the color mapper
+    assert plotter.colored_from_values
+    assert COLORS not in plotter.source_polygons.data
+    assert plotter.source_polygons.data[CELL_VALUES].dtype == np.float32
+    assert plotter.hovered_glyph.glyph.fill_color.transform is plotter.color_mapper
+
+    #   Unchanged values are not sent again
+    displayed_values = plotter.source_polygons.data[CELL_VALUES]
+    plotter.update_colors(colored_data(VisualizationMode.FROM_VALUE, True))
+    assert plotter.source_polygons.data[CELL_VALUES] is displayed_values
+
+    plotter.update_colorbar(True, (-11., 11.))
+    assert (plotter.edge_color_mapper.low, plotter.edge_color_mapper.high) == (-11., 11.)
+
+    #   Fields not colored from their values still receive their colors
+    plotter.update_colors(colored_data(VisualizationMode.NONE))
+    assert not plotter.colored_from_values
+    assert plotter.hovered_glyph.glyph.fill_color == COLORS
+    assert len(plotter.source_polygons.data[COLORS]) == len(data.cell_ids)
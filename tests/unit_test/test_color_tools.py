@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Tuple, Union
 import numpy as np
 import multiprocessing as mp
+import pytest
 
 from scivianna.data.data2d import Data2D
 from scivianna.interface.generic_interface import Geometry2DPolygon
@@ -9,7 +10,7 @@ from scivianna.utils.polygonize_tools import PolygonCoords, PolygonElement
 from scivianna.enums import VisualizationMode
 from scivianna.constants import MESH
 
-from scivianna.utils.color_tools import interpolate_cmap_at_values, get_edges_colors
+from scivianna.utils.color_tools import colors_from_lut, interpolate_cmap_at_values, get_edges_colors
 
 
 class ColorTestInterface(Geometry2DPolygon):
@@ -236,3 +237,17 @@ def test_color_list_float():
             [180, 180, 180, 255],
         ],
     )
+
+
+@pytest.mark.default
+def test_colors_from_lut():
+    values = np.array([0., 0.25, 0.5, 0.999, 1., np.nan, -1., 2.])
+    colors = colors_from_lut("viridis", values, nan_color=(200, 200, 200, 0))
+    reference = interpolate_cmap_at_values("viridis", values)
+
+    assert colors.dtype == np.uint8
+    #   The lookup table quantization error is below one color level
+    np.testing.assert_allclose(colors[:5].astype(int), reference[:5], atol=1)
+    np.testing.assert_equal(colors[5], (200, 200, 200, 0))
+    np.testing.assert_equal(colors[6], colors[0])
+    np.testing.assert_equal(colors[7], colors[4])
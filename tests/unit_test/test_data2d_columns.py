@@ -0,0 +1,184 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from scivianna.constants import OUTSIDE
+from scivianna.data.data2d import Data2D
+from scivianna.utils.color_tools import get_edges_colors
+
+
+@pytest.mark.default
+def test_columns_are_typed_arrays():
+    data = Data2D()
+    data.cell_ids = [3, 1, 2]
+    data.cell_values = [0.5, np.nan, 2]
+    data.cell_colors = [(255, 0, 0, 255), (0, 255.4, 0, 255), (0, 0, 300, 255)]
+
+    assert data.cell_ids.dtype == np.int64
+    assert data.cell_values.dtype == np.float64
+    assert data.cell_colors.dtype == np.uint8
+    np.testing.assert_equal(data.cell_colors[1:], [(0, 255, 0, 255), (0, 0, 255, 255)])
+
+
+@pytest.mark.default
+def test_outside_id_is_kept():
+    data = Data2D()
+    data.cell_ids = [1, OUTSIDE]
+
+    assert OUTSIDE in data.cell_ids
+    np.testing.assert_equal(data.cell_ids == OUTSIDE, [False, True])
+
+
+@pytest.mark.default
+def test_string_values_are_interned():
+    data = Data2D()
+    data.cell_values = ["fuel" + "", "water", "".join(["fu", "el"])]
+
+    assert data.cell_values.dtype == object
+    assert data.cell_values[0] is data.cell_values[2]
+    assert list(data.cell_values) == ["fuel", "water", "fuel"]
+
+
+@pytest.mark.default
+def test_mixed_values_are_not_converted():
+    data = Data2D()
+    data.cell_values = ["0.", 3., np.nan]
+
+    assert data.cell_values.dtype == object
+    assert data.cell_values[0] == "0."
+    assert np.isnan(data.cell_values[2])
+
+    with pytest.raises(AssertionError):
+        data.check_valid()
+
+
+@pytest.mark.default
+def test_uint8_edge_colors_do_not_wrap():
+    edge_colors = get_edges_colors(np.array([[10, 100, 255, 255]], dtype=np.uint8))
+
+    assert edge_colors.dtype == np.uint8
+    np.testing.assert_equal(edge_colors, [[0, 80, 235, 255]])
+
+
+@pytest.mark.default
+def test_list_pickle_is_loaded_as_arrays():
+    data = Data2D()
+    data.cell_ids = [1, 2]
+    state = data.__dict__.copy()
+    for key in ["cell_ids", "cell_values", "cell_colors", "cell_edge_colors"]:
+        state[key] = state.pop("_" + key).tolist()
+
+    legacy = Data2D.__new__(Data2D)
+    legacy.__setstate__(state)
+    legacy = pickle.loads(pickle.dumps(legacy))
+
+    np.testing.assert_equal(legacy.cell_ids, [1, 2])
+    assert isinstance(legacy.cell_colors, np.ndarray)
+    assert legacy.cell_colors.dtype == np.uint8
+
+
+@pytest.mark.default
+def test_incremental_conversion():
+    i, j = np.indices((100, 100))
+    previous_grid = (i // 25) * 4 + j // 25
+    grid = previous_grid.copy()
+    grid[2:6, 2:6] = 100
+
+    previous = Data2D.from_grid(previous_grid, np.arange(100.), np.arange(100.))
+    previous.cell_values = previous.cell_ids * 2.
+    previous.convert_to_polygons()
+    assert previous.get_polygon_count() == 16
+    previous.take_polygons(np.arange(16)[::-1])
+
+    data = Data2D.from_grid(grid, np.arange(100.), np.arange(100.))
+    data.cell_values = data.cell_ids * 2.
+    data.convert_to_polygons(previous)
+
+    assert data.get_polygon_count() == 17
+    np.testing.assert_equal(data.cell_values, data.packed_polygons.cell_ids * 2.)
+
+    #   The polygons not reaching the changed 32 x 32 block are reused
+    np.testing.assert_equal(data.packed_polygons.cell_ids[:12], [15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 3, 2])
+    assert data.packed_polygons.to_shapely()[-1].area == pytest.approx(16.)
+
+
+@pytest.mark.default
+def test_iso_bands_conversion():
+    x = np.linspace(0., 1., 100)
+    u, v = np.meshgrid(x, x)
+    data = Data2D.from_grid(u + v, x, x, iso_bands=5)
+    data.cell_values = data.cell_ids * 10.
+    data.cell_colors = np.repeat(np.arange(len(data.cell_ids))[:, None] % 256, 4, axis=1)
+
+    data.convert_to_polygons()
+    data.check_valid()
+
+    assert data.get_polygon_count() == 5
+    #   Each band takes the columns of the cell closest to its center
+    np.testing.assert_allclose(data.cell_ids, [0.2, 0.6, 1., 1.4, 1.8], atol=0.01)
+    np.testing.assert_equal(data.cell_values, data.cell_ids * 10.)
+    np.testing.assert_equal(data.packed_polygons.cell_ids, data.cell_ids)
+
+
+@pytest.mark.default
+def test_polygons_in_range():
+    i, j = np.indices((40, 40))
+    data = Data2D.from_grid((i // 10) * 4 + j // 10, np.arange(40.), np.arange(40.))
+    data.cell_values = data.cell_ids * 2.
+    data.convert_to_polygons()
+    data.take_polygons(np.arange(16)[::-1])
+    data.cell_ids = data.cell_ids[::-1]
+    data.cell_values = data.cell_values[::-1]
+
+    #   The bounding boxes follow the polygons order
+    np.testing.assert_allclose(data.get_polygon_bounds(), [p.bounds for p in data.packed_polygons.to_shapely()])
+
+    indexes = data.get_polygons_in_range((0., 12.), (25., 26.))
+    np.testing.assert_equal(data.packed_polygons.cell_ids[indexes], [9, 8])
+
+    culled = data.take(indexes)
+    culled.check_valid()
+    np.testing.assert_equal(culled.cell_values, [18., 16.])
+    np.testing.assert_equal(culled.get_polygon_bounds(), data.get_polygon_bounds()[indexes])
+
+    #   Full detail lookup of the cell under a point
+    assert data.get_cell_id_at(5., 25.) == 8
+    assert data.get_cell_id_at(100., 25.) is None
+
+
+@pytest.mark.default
+def test_rasterize():
+    i, j = np.indices((40, 40))
+    data = Data2D.from_grid((i // 10) * 4 + j // 10, np.arange(40.), np.arange(40.))
+    data.cell_values = data.cell_ids * 2.
+    data.convert_to_polygons()
+
+    #   Grid points beyond the polygons belong to the transparent OUTSIDE cell
+    raster = data.rasterize(np.linspace(0.5, 49.5, 50), np.linspace(0.5, 4.5, 5))
+    raster.check_valid()
+    assert raster.get_grid().shape == (5, 50)
+    np.testing.assert_equal(raster.get_grid()[0, [0, 20, 45]], [0, 2, OUTSIDE])
+    assert raster.cell_ids[-1] == OUTSIDE
+    assert np.isnan(raster.cell_values[-1])
+    assert raster.cell_colors[-1, 3] == 0
+
+    #   Only the polygons in range are kept
+    np.testing.assert_equal(np.sort(raster.cell_ids[:-1]), [0, 1, 2, 3])
+
+
+@pytest.mark.default
+def test_tiled_grid_conversion():
+    i, j = np.indices((40, 40))
+    grid = (i // 10) * 4 + j // 10
+    data = Data2D.from_grid(grid, np.arange(40.), np.arange(40.), tile_size=16, max_workers=2)
+    assert data.copy().tile_size == 16
+    assert pickle.loads(pickle.dumps(data)).max_workers == 2
+
+    data.cell_values = data.cell_ids * 2.
+    data.convert_to_polygons()
+    data.check_valid()
+
+    #   The polygons crossing the tiles borders are merged back
+    assert len(data.packed_polygons) == 16
+    np.testing.assert_equal(data.cell_values, data.cell_ids * 2.)
@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+
+from scivianna.data.data2d import Data2D
+from scivianna.constants import DEVICE_PIXEL_RATIO, SCREEN_RESOLUTION
+from scivianna.interface.generic_interface import Geometry2DGrid, cache_frames, cache_tiles, get_screen_grid_values
+from scivianna.interface.structured_mesh_interface import StructuredMeshInterface
+from scivianna.utils.lru_cache import LRUCache
+from scivianna.utils.structured_mesh import CarthesianStructuredMesh
+
+
+class CountingInterface(Geometry2DGrid):
+    frame_cache_size = 10 * 2**20
+    frame_cache_options = ["steps"]
+
+    def __init__(self, ):
+        """Interface counting the computed frames
+        """
+        self.computed = 0
+        self.restored = []
+
+    def restore_cached_frame(self, data, u, v, w_value):
+        self.restored.append(data)
+
+    @cache_frames
+    def compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options):
+        self.computed += 1
+        steps = options["steps"]
+        grid = np.arange(steps * steps).reshape((steps, steps))
+        return Data2D.from_grid(grid, np.linspace(u_min, u_max, steps), np.linspace(v_min, v_max, steps)), True
+
+
+@pytest.mark.default
+def test_lru_cache_eviction():
+    cache = LRUCache(10, len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+
+    #   b is the least recently used
+    cache.put("c", "cccc")
+    assert "b" not in cache
+    assert list(cache.keys()) == ["a", "c"]
+    assert cache.nbytes == 8
+    assert cache.evictions == 1
+
+    #   Too large to be stored
+    cache.put("d", "d" * 11)
+    assert "d" not in cache
+
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.default
+def test_cache_frames():
+    interface = CountingInterface()
+    frame_a = ((1., 0., 0.), (0., 1., 0.), 0., 1., 0., 1., 0.)
+    frame_b = ((1., 0., 0.), (0., 1., 0.), 0., 2., 0., 1., 0.)
+
+    data_a, updated = interface.compute_2D_data(*frame_a, None, {"steps": 5, "Field": "a"})
+    assert updated
+    data_b, updated = interface.compute_2D_data(*frame_b, None, {"steps": 5})
+    assert updated
+
+    #   Going back to the first frame does not recompute it, options not listed in frame_cache_options are ignored
+    data, updated = interface.compute_2D_data(*frame_a, None, {"steps": 5, "Field": "b"})
+    np.testing.assert_equal(data.grid, data_a.grid)
+    np.testing.assert_equal(data.u_values, data_a.u_values)
+    assert updated
+    data, updated = interface.compute_2D_data(*frame_a, None, {"steps": 5})
+    np.testing.assert_equal(data.u_values, data_a.u_values)
+    assert not updated
+    assert interface.computed == 2
+    assert len(interface.restored) == 2
+
+    #   Geometry relevant option change
+    data_c, _ = interface.compute_2D_data(*frame_a, None, {"steps": 6})
+    assert interface.computed == 3
+
+    cache = interface.get_frame_cache()
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert len(cache) == 3
+    assert cache.nbytes == data_a.nbytes + data_b.nbytes + data_c.nbytes
+
+    interface.clear_frame_cache()
+    interface.compute_2D_data(*frame_a, None, {"steps": 5})
+    assert interface.computed == 4
+
+
+@pytest.mark.default
+def test_cache_frames_returns_copies():
+    interface = CountingInterface()
+    frame = ((1., 0., 0.), (0., 1., 0.), 0., 1., 0., 1., 0.)
+
+    data, _ = interface.compute_2D_data(*frame, None, {"steps": 5})
+    cache = interface.get_frame_cache()
+    nbytes = cache.nbytes
+
+    #   The slave replaces the columns of the returned frame when coloring it
+    data.cell_values = np.arange(len(data.cell_ids), dtype=float)
+    data.cell_colors = np.zeros((len(data.cell_ids), 4), dtype=np.uint8)
+    data.color_range = (0., 1.)
+    data.convert_to_polygons()
+
+    assert cache.nbytes == nbytes
+    hit, _ = interface.compute_2D_data(*frame, None, {"steps": 5})
+    assert interface.computed == 1
+    assert hit is not data
+    assert hit.nbytes == nbytes
+    assert np.isnan(hit.cell_values).all()
+    assert hit.color_range is None
+    assert interface.restored[-1] is not hit
+
+
+@pytest.mark.default
+def test_cache_frames_disabled():
+    interface = CountingInterface()
+    interface.frame_cache_size = 0
+
+    interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 0., 1., 0., 1., 0., None, {"steps": 5})
+    interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 0., 1., 0., 1., 0., None, {"steps": 5})
+    assert interface.computed == 2
+
+
+@pytest.mark.default
+def test_get_screen_grid_values():
+    #   Default points counts without screen resolution
+    u_values, v_values = get_screen_grid_values(0., 1., 2., 4., {}, (5, 3))
+    np.testing.assert_allclose(u_values, np.linspace(0., 1., 5))
+    np.testing.assert_allclose(v_values, [2., 3., 4.])
+
+    #   One point per device pixel
+    u_values, v_values = get_screen_grid_values(0., 1., 2., 4., {SCREEN_RESOLUTION: (300, 200), DEVICE_PIXEL_RATIO: 1.5}, (5, 3))
+    assert (len(u_values), len(v_values)) == (450, 300)
+    assert (u_values[0], u_values[-1], v_values[0], v_values[-1]) == (0., 1., 2., 4.)
+
+
+class TiledInterface(Geometry2DGrid):
+    tile_size = 16
+    tile_cache_size = 10 * 2**20
+
+    def __init__(self, ):
+        """Interface sampling cells of unit size at the screen resolution, counting the computed tiles
+        """
+        self.computed = 0
+
+    @cache_tiles
+    def compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options):
+        self.computed += 1
+        u_values, v_values = get_screen_grid_values(u_min, u_max, v_min, v_max, options, (10, 10))
+        grid = np.floor(v_values)[:, None] * 1000 + np.floor(u_values)[None, :]
+        return Data2D.from_grid(grid.astype(int), u_values, v_values, iso_bands=options.get("Iso bands")), True
+
+
+@pytest.mark.default
+def test_cache_tiles():
+    interface = TiledInterface()
+    options = {SCREEN_RESOLUTION: (100, 50), DEVICE_PIXEL_RATIO: 1.}
+
+    #   Pixels of 0.1 are computed with a spacing of 1 / 8
+    data, updated = interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 0.3, 10.3, 2., 7., 0., None, options)
+    assert updated
+    np.testing.assert_allclose(np.diff(data.u_values), 0.125)
+    assert data.u_values[0] >= 0.3 and data.u_values[-1] <= 10.3
+    assert data.v_values[0] >= 2. and data.v_values[-1] <= 7.
+    np.testing.assert_equal(data.get_grid(), np.floor(data.v_values)[:, None] * 1000 + np.floor(data.u_values)[None, :])
+
+    #   Panning only computes the newly exposed tiles
+    computed = interface.computed
+    data, updated = interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 2.3, 12.3, 2., 7., 0., None, options)
+    assert updated
+    assert interface.computed - computed == 3
+    np.testing.assert_equal(data.get_grid(), np.floor(data.v_values)[:, None] * 1000 + np.floor(data.u_values)[None, :])
+
+    computed = interface.computed
+    interface.clear_frame_cache()
+    interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 2.3, 12.3, 2., 7., 0., None, options)
+    assert interface.computed - computed == 18
+
+    #   The assembled frame keeps the conversion settings of the tiles
+    data, _ = interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 2.3, 12.3, 2., 7., 0., None, {**options, "Iso bands": 4})
+    assert data.iso_bands == 4
+
+    #   Without screen resolution, the frame is computed directly
+    data, _ = interface.compute_2D_data((1., 0., 0.), (0., 1., 0.), 0., 1., 0., 1., 0., None, {})
+    assert data.get_grid().shape == (10, 10)
+
+
+@pytest.mark.default
+def test_cache_frames_refreshes_last_frame():
+    interface = StructuredMeshInterface()
+    interface.mesh = CarthesianStructuredMesh(np.linspace(0, 4, 5), np.linspace(0, 4, 5), np.linspace(0, 4, 5))
+    frame_a = ((1., 0., 0.), (0., 1., 0.), 0., 4., 0., 4., 0.5)
+    frame_b = ((1., 0., 0.), (0., 1., 0.), 0., 4., 0., 4., 1.5)
+
+    data_a, _ = interface.compute_2D_data(*frame_a, None, {})
+    interface.compute_2D_data(*frame_b, None, {})
+    assert interface.last_computed_frame == [1., 0., 0., 0., 1., 0., 1.5]
+
+    #   The frame taken from the cache is the one the interface saves
+    interface.compute_2D_data(*frame_a, None, {})
+    assert interface.last_computed_frame == [1., 0., 0., 0., 1., 0., 0.5]
+    assert interface.data is interface.get_frame_cache().get(interface.get_frame_key(*frame_a, {}))
+    assert interface.data.get_polygon_count() == data_a.get_polygon_count()
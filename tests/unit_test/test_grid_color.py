@@ -1,7 +1,8 @@
 import numpy as np
+import pytest
 
 from scivianna.data.data2d import Data2D
-from scivianna.plotter_2d.grid.grid_tools import get_grids
+from scivianna.plotter_2d.grid.grid_tools import get_cell_indexes, get_grids
 from scivianna.utils.color_tools import get_edges_colors
 
 def test_get_grid():
@@ -38,5 +39,33 @@ def test_get_grid():
     np.testing.assert_almost_equal(view[1, :, 1], [235, 255, 255, 255, 235, 105, 125, 125, 125, 105])
     np.testing.assert_almost_equal(view[1, :, 2], [235, 255, 255, 255, 235, 0, 0, 0, 0, 0])
 
+@pytest.mark.default
+@pytest.mark.parametrize("cell_ids", [
+    np.array([7, 3, 5]),
+    np.array([7, 3, 10**9]),
+    np.array([7., 3., np.nan]),
+    np.array(["g", "c", "e"], dtype=object),
+])
+def test_get_cell_indexes(cell_ids):
+    grid = cell_ids[[[0, 1], [2, 1], [0, 0]]]
+    np.testing.assert_equal(get_cell_indexes(cell_ids, grid), [[0, 1], [2, 1], [0, 0]])
+
+@pytest.mark.default
+@pytest.mark.parametrize("cell_ids, unknown_id", [
+    (np.array([7, 3, 5]), 4),
+    (np.array([7, 3, 5]), 2),
+    (np.array([7, 3, 5]), 8),
+    (np.array([7, 3, 10**9]), 4),
+    (np.array([7, 3, 10**9]), 10**9 + 1),
+    (np.array([7., 3., np.nan]), 4.),
+    (np.array(["g", "c", "e"], dtype=object), "d"),
+    (np.array(["g", "c", "e"], dtype=object), "h"),
+])
+def test_get_cell_indexes_unknown_id(cell_ids, unknown_id):
+    grid = cell_ids[[[0, 1], [2, 1], [0, 0]]]
+    grid[1, 1] = unknown_id
+    with pytest.raises(ValueError):
+        get_cell_indexes(cell_ids, grid)
+
 if __name__ == "__main__":
     test_get_grid()
\ No newline at end of file
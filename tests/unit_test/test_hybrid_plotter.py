@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from scivianna.constants import CELL_NAMES, GRID, OUTSIDE
+from scivianna.plotter_2d.hybrid.bokeh import Bokeh2DHybridPlotter
+
+
+def hover(plotter: Bokeh2DHybridPlotter, u: float, v: float):
+    plotter.source_mouse.data = {**plotter.source_mouse.data, "u": [u], "v": [v], "index": [0]}
+    events = []
+    plotter.send_event(lambda **kwargs: events.append(kwargs["cell_id"]))
+    return events[0] if events else None
+
+
+@pytest.mark.default
+def test_hybrid_plotter(squares_data):
+    plotter = Bokeh2DHybridPlotter()
+    data = squares_data(4, first_id=10)
+    plotter.plot_2d_frame(data)
+    assert not plotter.rasterized
+    assert not plotter.image.visible
+
+    #   The rasterized polygons replace the polygons
+    raster = data.rasterize(np.linspace(0.05, 4.95, 50), np.linspace(0.05, 1.95, 20))
+    plotter.update_2d_frame(raster)
+    assert plotter.rasterized
+    assert plotter.image.visible and not plotter.hovered_glyph.visible
+    assert len(plotter.source_polygons.data[CELL_NAMES]) == 0
+    assert plotter.source_grid.data[GRID][0].shape == (20, 50)
+
+    #   The hovered cell is found in the image
+    assert hover(plotter, 2.5, 0.5) == 12
+    assert hover(plotter, 2.5, 1.5) == OUTSIDE
+    assert hover(plotter, 20., 0.5) is None
+
+    #   Same image, only the colors are updated
+    data.cell_colors[1] = (0, 0, 0, 255)
+    plotter.update_colors(data.rasterize(np.linspace(0.05, 4.95, 50), np.linspace(0.05, 1.95, 20)))
+    assert plotter.source_grid.data[GRID][0][5, 15] == np.array([0, 0, 0, 255], dtype=np.uint8).view(np.uint32)[0]
+
+    #   Back to the polygons
+    plotter.update_colors(data)
+    assert not plotter.rasterized
+    assert not plotter.image.visible and plotter.hovered_glyph.visible
+    assert len(plotter.source_grid.data[GRID]) == 0
+    assert hover(plotter, 2.5, 0.5) == 10
@@ -2,8 +2,23 @@
 
 import pytest
 import numpy as np
-from scivianna.utils.polygonize_tools import numpy_2D_array_to_polygons, PolygonCoords, PolygonElement
+import shapely
+from scivianna.utils import polygonize_tools
+from scivianna.utils.polygonize_tools import (
+    PackedPolygons,
+    grid_to_pixel_polygons, 
+    index_values, 
+    iso_band_edges,
+    numpy_2D_array_to_iso_bands,
+    numpy_2D_array_to_polygons, 
+    rasterize_polygons,
+    simplify_to_tolerance,
+    splice_pixel_polygons, 
+    PolygonCoords, 
+    PolygonElement,
+)
 from scivianna.constants import OUTSIDE
+from scivianna.enums import Polygonizer
 
 @pytest.mark.default
 def test_numpy_2D_array_to_polygons_basic():
@@ -109,3 +124,230 @@ def test_numpy_2D_array_to_polygons_invalid_input():
     # Test with invalid array type
     with pytest.raises(TypeError):
         numpy_2D_array_to_polygons(x, y, "not an array", False)
+
+
+@pytest.mark.default
+@pytest.mark.parametrize("arr", [
+    np.array([[3, 3, -2], [7, 3, -2]]),
+    np.array([[3, 3, 2**40], [7, 3, 2**40]]),
+    np.array([[1.5, 0.5], [0.5, np.inf]]),
+])
+def test_index_values(arr):
+    """Test that the lookup table indexing matches np.unique."""
+    values, index_arr = index_values(arr)
+    reference_values, reference_inv = np.unique(arr.flatten(), return_inverse=True)
+
+    np.testing.assert_array_equal(values, reference_values)
+    np.testing.assert_array_equal(index_arr, reference_inv.reshape(arr.shape))
+    assert values.dtype == arr.dtype
+    assert index_arr.dtype == np.int32
+
+
+@pytest.mark.default
+@pytest.mark.parametrize("simplify", [False, True])
+def test_numpy_2D_array_to_polygons_areas(simplify):
+    """Test that the packed polygons cover the area of each value."""
+    x = np.arange(20.)
+    y = np.arange(20.)
+    i, j = np.indices((20, 20))
+    arr = ((i - 9.5)**2 + (j - 9.5)**2 < 36).astype(int) + (i < 3)
+
+    result = numpy_2D_array_to_polygons(x, y, arr, simplify=simplify)
+    areas = shapely.area(result.to_shapely())
+    pixel_area = 1.
+
+    for value in (0, 1, 2):
+        if simplify:
+            assert areas[result.cell_ids == value].sum() == pytest.approx(np.sum(arr == value) * pixel_area, rel=0.1)
+        else:
+            assert areas[result.cell_ids == value].sum() == pytest.approx(np.sum(arr == value) * pixel_area)
+
+
+@pytest.mark.default
+def test_numpy_2D_array_to_polygons_tiled():
+    """Test that the tiled polygonization gives the same polygons as a single tile."""
+    x = np.arange(40.)
+    y = np.arange(30.)
+    i, j = np.indices((30, 40))
+    arr = np.floor(np.sin(i / 4) * 2 + np.cos(j / 5) * 2 + ((i - 15)**2 + (j - 20)**2 < 49)).astype(int)
+
+    reference = numpy_2D_array_to_polygons(x, y, arr, simplify=False)
+    tiled = numpy_2D_array_to_polygons(x, y, arr, simplify=False, tile_size=7, max_workers=2)
+
+    assert sorted(tiled.cell_ids.tolist()) == sorted(reference.cell_ids.tolist())
+    assert len(tiled.x_coords) == len(reference.x_coords)
+
+    #   The process pool is kept for the next frames
+    pool = polygonize_tools._process_pool
+    assert pool is not None
+    numpy_2D_array_to_polygons(x, y, arr, simplify=False, tile_size=7, max_workers=2)
+    assert polygonize_tools._process_pool is pool
+
+    #   A single process polygonizes the array as a single tile
+    single = numpy_2D_array_to_polygons(x, y, arr, simplify=False, tile_size=7, max_workers=1)
+    assert len(single) == len(reference)
+
+    reference_shapes = reference.to_shapely()
+    tiled_shapes = tiled.to_shapely()
+    for value in np.unique(arr):
+        assert shapely.equals(
+            shapely.union_all(tiled_shapes[tiled.cell_ids == value]),
+            shapely.union_all(reference_shapes[reference.cell_ids == value]),
+        )
+
+
+@pytest.mark.default
+def test_splice_pixel_polygons():
+    """Test that splicing the changed blocks gives the same polygons as polygonizing the new grid."""
+    i, j = np.indices((60, 50))
+    previous_arr = np.floor(np.sin(i / 6) * 2 + np.cos(j / 7) * 2).astype(int)
+    arr = previous_arr.copy()
+    arr[5:12, 8:20] = 7
+    arr[40:44, 30:33] = previous_arr[0, 0]
+    arr[30, 49] = 9
+
+    kept, merged, changed_values = splice_pixel_polygons(grid_to_pixel_polygons(previous_arr), previous_arr, arr, block_size=8)
+    reference = grid_to_pixel_polygons(arr)
+
+    assert sorted(changed_values.tolist()) == sorted(set(previous_arr[arr != previous_arr].tolist()) | {7, 9, previous_arr[0, 0]})
+    assert len(kept) + len(merged) == len(reference)
+    assert len(kept) > 0
+
+    spliced_shapes = np.concatenate([grid_to_pixel_polygons(previous_arr).take(kept).to_shapely(), merged.to_shapely()])
+    spliced_ids = np.concatenate([grid_to_pixel_polygons(previous_arr).cell_ids[kept], merged.cell_ids])
+    reference_shapes = reference.to_shapely()
+    for value in np.unique(arr):
+        assert shapely.equals(
+            shapely.union_all(spliced_shapes[spliced_ids == value]),
+            shapely.union_all(reference_shapes[reference.cell_ids == value]),
+        )
+
+    #   Too many changes
+    assert splice_pixel_polygons(grid_to_pixel_polygons(previous_arr), previous_arr, previous_arr + 1, block_size=8) is None
+
+
+@pytest.mark.rasterio
+@pytest.mark.parametrize("seed", range(5))
+def test_run_length_matches_rasterio(seed):
+    """Test that both polygonizers give the same polygons, touching corners and holes included."""
+    rng = np.random.default_rng(seed)
+    arr = rng.integers(0, 3, (23, 17))
+
+    run_length = grid_to_pixel_polygons(arr, polygonizer=Polygonizer.RUN_LENGTH)
+    rasterio = grid_to_pixel_polygons(arr, polygonizer=Polygonizer.RASTERIO)
+
+    assert len(run_length) == len(rasterio)
+    assert len(run_length.x_coords) == len(rasterio.x_coords)
+    assert sorted(len(polygon.holes) for polygon in run_length) == sorted(len(polygon.holes) for polygon in rasterio)
+
+    run_length_shapes = run_length.to_shapely()
+    rasterio_shapes = rasterio.to_shapely()
+    assert shapely.is_valid(run_length_shapes).all()
+    for value in range(3):
+        assert shapely.equals(
+            shapely.union_all(run_length_shapes[run_length.cell_ids == value]),
+            shapely.union_all(rasterio_shapes[rasterio.cell_ids == value]),
+        )
+
+
+@pytest.mark.default
+def test_numpy_2D_array_to_polygons_non_uniform():
+    """Test that the pixels borders are halfway between non-uniform points."""
+    x = np.array([0., 1., 3., 7.])
+    y = np.array([0., 2.])
+    arr = np.array([[0, 0, 1, 1], [0, 1, 1, 1]])
+
+    result = numpy_2D_array_to_polygons(x, y, arr, simplify=False)
+    shapes = result.to_shapely()
+
+    #   The uniform vertical axis follows the same construction, with pixels of height 2
+    assert shapely.area(shapes[result.cell_ids == 0]).sum() == pytest.approx(2. * (1. + 1.5 + 1.))
+    assert shapes[result.cell_ids == 1][0].bounds == (0.5, -1., 9., 3.)
+
+    #   A single point is covered by a pixel of unit width
+    single = numpy_2D_array_to_polygons(x, np.array([5.]), arr[:1], simplify=False)
+    assert shapely.union_all(single.to_shapely()).bounds == (-0.5, 4.5, 9., 5.5)
+
+
+@pytest.mark.default
+def test_numpy_2D_array_to_iso_bands():
+    """Test that the iso-bands cover the finite values area with a polygon count independent of the pixels count."""
+    x = np.linspace(-1., 1., 200)
+    u, v = np.meshgrid(x, x)
+    arr = np.sqrt(u**2 + v**2)
+    arr[:10, :10] = OUTSIDE
+
+    band_edges = iso_band_edges(arr, 4)
+    assert band_edges[0] < np.nanmin(arr) and band_edges[-1] > np.max(arr[np.isfinite(arr)])
+
+    result = numpy_2D_array_to_iso_bands(x, x, arr, band_edges)
+    shapes = result.to_shapely()
+
+    #   The last band is split in the four corners
+    assert result.cell_ids.tolist() == [0, 1, 2, 3, 3, 3, 3]
+    assert shapely.is_valid(shapes).all()
+    assert shapes[0].area == pytest.approx(np.pi * band_edges[1]**2, rel=1e-3)
+    #   The quads around the OUTSIDE points are not covered
+    assert shapely.union_all(shapes).area == pytest.approx(4. - (10 * 2. / 199)**2, rel=1e-3)
+
+
+@pytest.mark.default
+def test_simplify_to_tolerance():
+    #   20 x 20 unit squares, the left and right halves have different values
+    squares = [shapely.box(i, j, i + 1, j + 1) for j in range(20) for i in range(20)]
+    values = [float(i >= 10) for j in range(20) for i in range(20)]
+
+    #   Band whose left edge follows the squares corners and whose right edge wiggles below the tolerance
+    wiggle_y = np.linspace(20., 0., 201)
+    band = shapely.Polygon(
+        [(20., float(y)) for y in range(21)] + 
+        list(zip(30. + 0.05 * np.sin(wiggle_y * 10.), wiggle_y))
+    )
+
+    polygons = PackedPolygons.from_shapely(np.array(squares + [band]), np.arange(401))
+    simplified, indexes = simplify_to_tolerance(polygons, np.array(values + [2.]), 2., merge=True)
+
+    #   The squares are merged per value, the merged polygons take the place and cell of their first square
+    np.testing.assert_equal(indexes, [0, 10, 400])
+    np.testing.assert_equal(simplified.cell_ids, [0, 10, 400])
+
+    shapes = simplified.to_shapely()
+    assert shapely.coverage_is_valid(shapes)
+    assert shapely.union_all(shapes).area == pytest.approx(600., rel=1e-2)
+    assert len(simplified.x_coords) < len(polygons.x_coords) / 10
+
+    #   Without merging, the squares without value keep their edges
+    unmerged, indexes = simplify_to_tolerance(polygons, np.full(401, np.nan), 2.)
+    np.testing.assert_equal(indexes, np.arange(401))
+    assert shapely.coverage_is_valid(unmerged.to_shapely())
+
+    #   Tolerance below the edges length
+    unchanged, indexes = simplify_to_tolerance(polygons, np.array(values + [2.]), 0.01)
+    assert unchanged is polygons
+    np.testing.assert_equal(indexes, np.arange(401))
+
+
+@pytest.mark.default
+def test_rasterize_polygons():
+    #   Disks with a hole, open and closed rings
+    rng = np.random.default_rng(0)
+    centers = shapely.points(rng.random((200, 2)) * 100.)
+    shapes = np.array([
+        shapely.Polygon(shapely.get_exterior_ring(shapely.buffer(c, 3.)), [shapely.get_exterior_ring(shapely.buffer(c, 1.))])
+        for c in centers
+    ])
+    polygons = PackedPolygons.from_shapely(shapes, np.arange(200))
+
+    index_grid = rasterize_polygons(polygons, (10., 90.), (0., 60.), (150, 200))
+    assert index_grid.shape == (150, 200)
+
+    #   Same coverage as the pixel centers containment, the last polygon covering a pixel is kept
+    v, u = np.mgrid[0:150, 0:200] * 0.4 + 0.2
+    u += 10.
+    expected = np.full(index_grid.shape, -1)
+    for index, shape in enumerate(shapes):
+        expected[shapely.intersects_xy(shape, u, v)] = index
+
+    np.testing.assert_equal(index_grid, expected)
+
+    assert (rasterize_polygons(PackedPolygons.empty(), (0., 1.), (0., 1.), (4, 4)) == -1).all()
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from scivianna.constants import XS, YS
+from scivianna.plotter_2d.polygon.bokeh import Bokeh2DPolygonPlotter
+
+
+@pytest.mark.default
+def test_packed_geometry(squares_data):
+    plotter = Bokeh2DPolygonPlotter(packed_geometry=True)
+    plotter.plot_2d_frame(squares_data(3))
+
+    #   The polygons columns only contain indexes in the flat buffers
+    np.testing.assert_equal(plotter.source_polygons.data[XS], [0, 1, 2])
+    assert plotter.hovered_glyph.glyph.xs.transform.args["coordinate"] == "x"
+    assert plotter.hovered_glyph.glyph.ys.transform.args["geometry"] is plotter.source_geometry
+
+    plotter.update_2d_frame(squares_data(5))
+    geometry = plotter.source_geometry.data
+    assert geometry["x"][0].dtype == np.float32
+    assert geometry["ring_offsets"][0].dtype == np.int32
+    np.testing.assert_equal(geometry["polygon_offsets"][0], np.arange(6))
+    assert len(geometry["x"][0]) == geometry["ring_offsets"][0][-1] == 25
+    np.testing.assert_equal(plotter.source_polygons.data[YS], np.arange(5))
@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+import numpy as np
+from scivianna.data.data2d import Data2D
+from scivianna.utils.polygon_sorter import PolygonSorter
+from scivianna.utils.polygonize_tools import PackedPolygons, PolygonCoords, PolygonElement
+
+
+def create_test_polygons():
+    square_with_hole = PolygonElement(
+        exterior_polygon=PolygonCoords([0., 4., 4., 0.], [0., 0., 4., 4.]),
+        holes=[PolygonCoords([1., 2., 2., 1.], [1., 1., 2., 2.])],
+        cell_id=1,
+    )
+    triangle = PolygonElement(
+        exterior_polygon=PolygonCoords([5., 6., 6.], [0., 0., 1.]),
+        holes=[],
+        cell_id=2,
+    )
+    triangle.compo = "fuel"
+    return [square_with_hole, triangle]
+
+
+@pytest.mark.default
+def test_pack_unpack():
+    polygons = create_test_polygons()
+    packed = PackedPolygons.from_polygon_list(polygons)
+
+    assert len(packed) == 2
+    np.testing.assert_equal(packed.ring_offsets, [0, 4, 8, 11])
+    np.testing.assert_equal(packed.polygon_offsets, [0, 2, 3])
+    np.testing.assert_equal(packed.cell_ids, [1, 2])
+
+    unpacked = packed.to_polygon_list()
+    for polygon, expected in zip(unpacked, polygons):
+        assert polygon.cell_id == expected.cell_id
+        assert polygon.compo == expected.compo
+        np.testing.assert_equal(polygon.exterior_polygon.x_coords, expected.exterior_polygon.x_coords)
+        assert len(polygon.holes) == len(expected.holes)
+
+
+@pytest.mark.default
+def test_take():
+    packed = PackedPolygons.from_polygon_list(create_test_polygons())
+
+    reversed_ = packed.take([1, 0])
+
+    np.testing.assert_equal(reversed_.cell_ids, [2, 1])
+    np.testing.assert_equal(reversed_.ring_offsets, [0, 3, 7, 11])
+    np.testing.assert_equal(reversed_[1].holes[0].y_coords, [1., 1., 2., 2.])
+    assert reversed_[0].compo == "fuel"
+
+
+@pytest.mark.default
+def test_translate_rotate_bounds():
+    packed = PackedPolygons.from_polygon_list(create_test_polygons())
+    np.testing.assert_equal(packed.bounds(), [[0., 0., 4., 4.], [5., 0., 6., 1.]])
+
+    packed.translate(1., 2.)
+    np.testing.assert_equal(packed.bounds(), [[1., 2., 5., 6.], [6., 2., 7., 3.]])
+
+    reference = create_test_polygons()[1]
+    reference.translate(1., 2.)
+    reference.rotate((1., 1.), 0.3)
+    packed.rotate((1., 1.), 0.3)
+    np.testing.assert_almost_equal(packed[1].exterior_polygon.x_coords, reference.exterior_polygon.x_coords)
+    np.testing.assert_almost_equal(packed[1].exterior_polygon.y_coords, reference.exterior_polygon.y_coords)
+
+
+@pytest.mark.default
+def test_to_shapely():
+    polygons = create_test_polygons()
+    shapes = PackedPolygons.from_polygon_list(polygons).to_shapely()
+
+    assert len(shapes) == 2
+    for shape, polygon in zip(shapes, polygons):
+        assert shape.equals(polygon.to_shapely())
+    assert shapes[0].area == 15.
+
+
+@pytest.mark.default
+def test_data2d_keeps_packed_polygons():
+    packed = PackedPolygons.from_polygon_list(create_test_polygons())
+    data = Data2D.from_polygon_list(packed)
+    data.cell_values = [2., 1.]
+
+    PolygonSorter().sort_from_value(data)
+
+    assert data.packed_polygons is not packed
+    np.testing.assert_equal(data.get_packed_polygons().cell_ids, [2, 1])
+    np.testing.assert_equal(data.cell_ids, [2, 1])
+
+    data = pickle.loads(pickle.dumps(data))
+    assert data.get_polygon_count() == 2
+    assert data.polygons[1].cell_id == 1
@@ -0,0 +1,121 @@
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import pytest
+
+from scivianna.data.data2d import Data2D
+from scivianna.data.shared_data import map_data_2d, share_data_2d
+from scivianna.enums import DataType, Polygonizer
+from scivianna.interface.generic_interface import Geometry2DPolygon
+from scivianna.slave import ComputeSlave
+from scivianna.utils.polygonize_tools import PolygonCoords, PolygonElement
+
+
+def make_polygons() -> List[PolygonElement]:
+    """Returns two squares, the first one having a hole"""
+    return [
+        PolygonElement(
+            exterior_polygon=PolygonCoords([0., 4., 4., 0.], [0., 0., 4., 4.]),
+            holes=[PolygonCoords([1., 2., 2., 1.], [1., 1., 2., 2.])],
+            cell_id="outer",
+        ),
+        PolygonElement(
+            exterior_polygon=PolygonCoords([1., 2., 2., 1.], [1., 1., 2., 2.]),
+            holes=[],
+            cell_id="inner",
+        ),
+    ]
+
+
+class SquaresInterface(Geometry2DPolygon):
+    def __init__(self, ):
+        """Interface built to test the Data2D transport.
+        """
+        pass
+
+    def compute_2D_data(self, u, v, u_min, u_max, v_min, v_max, w_value, q_tasks, options) -> Tuple[Data2D, bool]:
+        """Returns two squares"""
+        return Data2D.from_polygon_list(make_polygons()), True
+
+    def get_value_dict(self, value_label: str, cells: List[Union[int, str]], options: Dict[str, Any]):
+        """Returns the cells length"""
+        return {c: float(len(c)) for c in cells}
+
+
+def assert_same_data(data: Data2D, expected: Data2D):
+    assert data.data_type == expected.data_type
+    assert data.simplify == expected.simplify
+    assert data.polygonizer == expected.polygonizer
+    assert data.tile_size == expected.tile_size
+    assert data.max_workers == expected.max_workers
+    assert data.iso_bands == expected.iso_bands
+    assert data.color_range == expected.color_range
+    np.testing.assert_equal(np.array(data.cell_ids), np.array(expected.cell_ids))
+    np.testing.assert_equal(np.array(data.cell_values), np.array(expected.cell_values))
+    np.testing.assert_equal(np.array(data.cell_colors), np.array(expected.cell_colors))
+    np.testing.assert_equal(np.array(data.cell_edge_colors), np.array(expected.cell_edge_colors))
+    np.testing.assert_equal(data.grid, expected.grid)
+
+    assert len(data.polygons) == len(expected.polygons)
+    for polygon, expected_polygon in zip(data.polygons, expected.polygons):
+        assert polygon.cell_id == expected_polygon.cell_id
+        np.testing.assert_equal(polygon.exterior_polygon.x_coords, expected_polygon.exterior_polygon.x_coords)
+        np.testing.assert_equal(polygon.exterior_polygon.y_coords, expected_polygon.exterior_polygon.y_coords)
+        assert len(polygon.holes) == len(expected_polygon.holes)
+        for hole, expected_hole in zip(polygon.holes, expected_polygon.holes):
+            np.testing.assert_equal(hole.x_coords, expected_hole.x_coords)
+            np.testing.assert_equal(hole.y_coords, expected_hole.y_coords)
+
+
+@pytest.mark.default
+def test_polygons_round_trip():
+    data = Data2D.from_polygon_list(make_polygons())
+    data.cell_values = ["a", "b"]
+
+    mapped = map_data_2d(share_data_2d(data))
+
+    assert_same_data(mapped, data)
+    #   All coordinates are views of the same block
+    assert mapped.polygons[0].exterior_polygon.x_coords.base is mapped.polygons[1].exterior_polygon.x_coords.base
+
+
+@pytest.mark.default
+def test_grid_round_trip():
+    grid = np.array([[1, 1, 2], [3, 2, 2]])
+    data = Data2D.from_grid(grid, np.arange(3), np.arange(2), polygonizer=Polygonizer.RASTERIO, iso_bands=3, tile_size=2, max_workers=2)
+    data.cell_values = [np.nan, 1., 2.]
+    data.color_range = (0., 1.)
+
+    mapped = map_data_2d(share_data_2d(data))
+
+    assert mapped.data_type == DataType.GRID
+    assert_same_data(mapped, data)
+    np.testing.assert_equal(mapped.u_values, data.u_values)
+
+
+@pytest.mark.default
+def test_mixed_values_are_not_converted():
+    data = Data2D.from_polygon_list(make_polygons())
+    data.cell_values = [np.nan, "b"]
+
+    mapped = map_data_2d(share_data_2d(data))
+
+    assert np.isnan(mapped.cell_values[0])
+    assert mapped.cell_values[1] == "b"
+
+
+@pytest.mark.default
+def test_slave_shared_memory_transport():
+    slave = ComputeSlave(SquaresInterface, shared_memory_transport=True)
+    reference_slave = ComputeSlave(SquaresInterface)
+    try:
+        args = ((1, 0, 0), (0, 1, 0), 0., 4., 0., 4., 0., None, "length", {})
+        data, polygons_updated = slave.compute_2D_data(*args)
+        reference, _ = reference_slave.compute_2D_data(*args)
+
+        assert polygons_updated
+        assert_same_data(data, reference)
+        assert list(data.cell_values) == [5., 5.]
+    finally:
+        slave.terminate()
+        reference_slave.terminate()
@@ -0,0 +1,97 @@
+import os
+import time
+from typing import List
+
+import pytest
+from scivianna.interface.generic_interface import GenericInterface
+from scivianna.slave import ComputeSlave
+
+
+class EchoInterface(GenericInterface):
+    def __init__(self, ):
+        """Interface built to test the slave round trip.
+        """
+        pass
+
+    def get_labels(self) -> List[str]:
+        """Returns the fields names providable.
+
+        Returns
+        -------
+        List[str]
+            Fields names
+        """
+        return ["echo"]
+
+
+class DyingInterface(GenericInterface):
+    def __init__(self, ):
+        """Interface built to test a worker stopping while answering.
+        """
+        pass
+
+    def get_labels(self) -> List[str]:
+        """Kills the worker process without answering.
+        """
+        os._exit(1)
+
+
+class IdleInterface(GenericInterface):
+    def __init__(self, ):
+        """Interface built to test the background work between tasks.
+        """
+        self.idle_steps = 0
+
+    def idle_task(self) -> bool:
+        """Runs ten 10 ms steps after each task.
+        """
+        time.sleep(0.01)
+        self.idle_steps += 1
+        return self.idle_steps % 10 != 0
+
+    def get_idle_steps(self) -> int:
+        """Returns the number of idle steps run
+        """
+        return self.idle_steps
+
+
+@pytest.mark.default
+def test_round_trip_latency():
+    slave = ComputeSlave(EchoInterface)
+    assert slave.get_labels() == ["echo"]
+
+    n_calls = 200
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        assert slave.get_labels() == ["echo"]
+    mean_latency = (time.perf_counter() - start) / n_calls
+
+    slave.terminate()
+
+    #   The former queue polling took at least 50 ms per call
+    assert mean_latency < 0.001, f"Mean round trip of {mean_latency*1e3:.2f} ms"
+
+
+@pytest.mark.default
+def test_dead_worker_does_not_hang():
+    slave = ComputeSlave(DyingInterface)
+    assert slave.get_labels() is None
+    assert not slave.running
+
+
+@pytest.mark.default
+def test_idle_task_gives_way():
+    slave = ComputeSlave(IdleInterface)
+    time.sleep(1.)
+    assert slave.call_custom_function("get_idle_steps", {}) == 10
+
+    #   The request is processed after the running step, before the remaining ones
+    start = time.perf_counter()
+    steps = slave.call_custom_function("get_idle_steps", {})
+    assert time.perf_counter() - start < 0.05
+    assert steps < 20
+
+    time.sleep(0.3)
+    assert slave.call_custom_function("get_idle_steps", {}) == 20
+
+    slave.terminate()
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from bokeh.models import ColumnDataSource
+
+from scivianna.constants import CELL_VALUES, COMPO_NAMES, GRID
+from scivianna.data.data2d import Data2D
+from scivianna.plotter_2d.generic_plotter import changed_values
+from scivianna.plotter_2d.grid.bokeh import Bokeh2DGridPlotter
+from scivianna.plotter_2d.polygon.bokeh import Bokeh2DPolygonPlotter
+
+
+@pytest.fixture
+def colored_data(color_data):
+    def make(changed_cells: list, polygons: bool) -> Data2D:
+        arr = np.repeat(np.repeat(np.arange(100).reshape((10, 10)), 4, axis=0), 4, axis=1)
+        data = Data2D.from_grid(arr, np.arange(40.), np.arange(40.))
+        if polygons:
+            data.convert_to_polygons()
+        data.cell_values = data.cell_ids.astype(float)
+        data.cell_values[np.isin(data.cell_ids, changed_cells)] = 50.
+        return color_data(data)
+
+    return make
+
+
+def record_patches(monkeypatch) -> list:
+    patches = []
+    source_patch = ColumnDataSource.patch
+
+    def patch(source, patches_dict, *args, **kwargs):
+        patches.append(patches_dict)
+        source_patch(source, patches_dict, *args, **kwargs)
+
+    monkeypatch.setattr(ColumnDataSource, "patch", patch)
+    return patches
+
+
+@pytest.mark.default
+def test_changed_values():
+    assert changed_values(np.array([1., np.nan, 2.]), np.array([1., np.nan, np.nan])).tolist() == [False, False, True]
+    assert changed_values(np.array(["a", "b"]), np.array(["a", "c"])).tolist() == [False, True]
+
+
+@pytest.mark.default
+@pytest.mark.parametrize("client_side_colors", [False, True])
+def test_polygon_sparse_patch(monkeypatch, colored_data, client_side_colors: bool):
+    plotter = Bokeh2DPolygonPlotter(client_side_colors=client_side_colors)
+    plotter.plot_2d_frame(colored_data([], True))
+    patches = record_patches(monkeypatch)
+
+    #   Unchanged cells send nothing
+    plotter.update_colors(colored_data([], True))
+    assert patches == []
+
+    #   Only the changed cells are sent
+    data = colored_data([3, 7], True)
+    plotter.update_colors(data)
+    assert len(patches) == 1
+    changed = np.flatnonzero(np.isin(data.cell_ids, [3, 7])).tolist()
+    assert [index for index, _ in patches[0][COMPO_NAMES]] == changed
+    if client_side_colors:
+        assert [index for index, _ in patches[0][CELL_VALUES]] == changed
+        assert np.array_equal(plotter.source_polygons.data[CELL_VALUES], data.cell_values.astype(np.float32))
+
+    #   Above patch_max_fraction of the cells, the whole columns are sent
+    plotter.update_colors(colored_data(list(range(1, 60)), True))
+    assert isinstance(patches[1][COMPO_NAMES][0][0], slice)
+
+
+@pytest.mark.default
+def test_grid_tile_patch(monkeypatch, colored_data):
+    plotter = Bokeh2DGridPlotter()
+    plotter.plot_2d_frame(colored_data([], False))
+    patches = record_patches(monkeypatch)
+
+    plotter.update_colors(colored_data([], False))
+    assert patches == []
+
+    #   Only the tile bounding the changed pixels is sent
+    data = colored_data([12, 23], False)
+    plotter.update_colors(data)
+    assert len(patches) == 1
+    tile, values = patches[0][GRID][0]
+    assert len(values) == (tile[1].stop - tile[1].start) * (tile[2].stop - tile[2].start)
+    assert len(values) < data.get_grid().size * plotter.patch_max_fraction
+
+    expected = Bokeh2DGridPlotter()
+    expected.plot_2d_frame(data)
+    assert np.array_equal(plotter.source_grid.data[GRID][0], expected.source_grid.data[GRID][0])
+    assert np.array_equal(plotter.source_grid.data[COMPO_NAMES][0], expected.source_grid.data[COMPO_NAMES][0])